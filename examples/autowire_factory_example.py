@@ -2,7 +2,6 @@ from typing import Callable, NewType, TypeAlias
 from pyioc3 import Container
 from pyioc3.autowire import bind_factory, AutoWireContainerBuilder
 
-
 GreetingFactory: TypeAlias = Callable[[str], str]
 Greeting = NewType("Greeting", str)
 
@@ -1,7 +1,6 @@
 from typing import Callable, NewType, TypeAlias
 from pyioc3 import StaticContainerBuilder, Container
 
-
 GreetingFactory: TypeAlias = Callable[[str], str]
 Greeting = NewType("Greeting", str)
 
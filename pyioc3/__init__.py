@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 """Python IOC Container"""
+
 from .static_container_builder import StaticContainerBuilder
-from .interface import Container
+from .interface import Container, Factory
 from .scope_enum import ScopeEnum
+from .fork_policy import ForkPolicy
 
 name = "pyioc3"
-__all__ = ["StaticContainerBuilder", "Container", "ScopeEnum"]
+__all__ = ["StaticContainerBuilder", "Container", "Factory", "ScopeEnum", "ForkPolicy"]
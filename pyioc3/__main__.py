@@ -0,0 +1,84 @@
+"""Command line tools for pyioc3.
+
+Usage:
+    python -m pyioc3 manifest my_package [--exclude my_package.tests] -o manifest.json
+    python -m pyioc3 compile myapp.container:builder -o myapp/_wired.py
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from .autowire_index import AutoWireIndex
+from .autowire_manifest import AutoWireManifest
+from .codegen import ContainerCompiler
+
+
+def _manifest(args: argparse.Namespace) -> int:
+    index = AutoWireIndex.scan(args.modules, args.exclude)
+    AutoWireManifest.save(index, args.output)
+    bindings = sum(len(r.bindings) for r in index.records.values())
+    print(
+        f"Wrote {bindings} bindings from {len(index.records)} modules to {args.output}"
+    )
+    return 0
+
+
+def _compile(args: argparse.Namespace) -> int:
+    container = ContainerCompiler.load(args.target)
+    source = ContainerCompiler.compile(container, args.target)
+    with open(args.output, "w", encoding="utf-8") as fh:
+        fh.write(source)
+    print(f"Wrote {len(container._bound_members)} bindings to {args.output}")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the pyioc3 command line.
+
+    Arguments:
+        argv: The command line arguments. Defaults to sys.argv[1:].
+
+    Returns:
+        The process exit code.
+    """
+    parser = argparse.ArgumentParser(prog="python -m pyioc3")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    manifest = commands.add_parser(
+        "manifest",
+        help="Write an autowire manifest so containers can skip module scanning.",
+    )
+    manifest.add_argument("modules", nargs="+", help="The packages to scan.")
+    manifest.add_argument(
+        "-e",
+        "--exclude",
+        action="append",
+        default=[],
+        help="A module to exclude from scanning. May be repeated.",
+    )
+    manifest.add_argument(
+        "-o", "--output", required=True, help="The manifest file to write."
+    )
+    manifest.set_defaults(handler=_manifest)
+
+    compile_ = commands.add_parser(
+        "compile",
+        help="Generate a module that recreates a container without introspection.",
+    )
+    compile_.add_argument(
+        "target",
+        help="The import path of a container, a container builder, or a callable "
+        "returning either. For example, myapp.container:builder.",
+    )
+    compile_.add_argument(
+        "-o", "--output", required=True, help="The Python module to write."
+    )
+    compile_.set_defaults(handler=_compile)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
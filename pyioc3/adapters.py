@@ -1,4 +1,19 @@
+import asyncio
+import inspect
+import mmap
+import os
+import queue
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from multiprocessing.shared_memory import SharedMemory
+from threading import Event, Lock, RLock, Semaphore, Thread
+from typing import Any, Callable, List, Optional, Tuple
+from weakref import WeakSet, ref
+
 from .interface import Container
+from .scope_enum import ScopeEnum
+
+_MISSING = object()
 
 
 class ValueAsImplAdapter:
@@ -33,6 +48,42 @@ class ValueAsImplAdapter:
         return self._value
 
 
+class CollectionAdapter:
+    """
+    CollectionAdapter is an adapter class for the collections of multi-bindings.
+
+    The elements are the dependencies of the collection member, so they are
+    created, each in its own scope, by the same pass that creates the collection.
+
+    Args:
+        collection: The type of the collection, list or tuple.
+        elements: The annotations of the elements, in order.
+
+    Methods:
+        __call__(self, *items) -> Any:
+            Returns the resolved elements as a new collection.
+
+    Example:
+        ```python
+        from pyioc3.adapters import CollectionAdapter
+
+        adapter = CollectionAdapter(list, (first_key, second_key))
+        result = adapter(first, second)  # result will be [first, second]
+        ```
+    """
+
+    def __init__(
+        self,
+        collection: Callable[[Tuple[Any, ...]], Any],
+        elements: Tuple[Any, ...],
+    ):
+        self._collection = collection
+        self.elements = tuple(elements)
+
+    def __call__(self, *items):
+        return self._collection(items)
+
+
 class FunctionAsImplAdapter:
     """
     FunctionAsImplAdapter is an adapter class for function-based bindings.
@@ -111,3 +162,677 @@ class FactoryAsImplAdapter:
 
     def __call__(self, ctx: Container):
         return self._fn(ctx)
+
+
+class LazyValueAsImplAdapter:
+    """
+    LazyValueAsImplAdapter is an adapter class for lazy constant bindings.
+
+    The loader runs the first time the adapter is called, once even if several
+    threads call the adapter concurrently, and its result is returned by every
+    later call. If the loader raises, nothing is cached and the next call runs it
+    again. If the loader is a coroutine function, the adapter returns an
+    AsyncLazyValue that runs it on the first await instead.
+
+    Args:
+        loader: A function, or coroutine function, without arguments.
+
+    Methods:
+        __call__(self) -> Any:
+            Returns the loaded value, running the loader if needed.
+
+    Example:
+        To create a LazyValueAsImplAdapter instance:
+
+        ```python
+        from pyioc3.adapters import LazyValueAsImplAdapter
+
+        # Create a LazyValueAsImplAdapter that reads a word list.
+        words_adapter = LazyValueAsImplAdapter(lambda: open("words.txt").read().split())
+
+        # Call the adapter to load the words. Later calls return the same list.
+        words = words_adapter()
+        ```
+    """
+
+    def __init__(self, loader: Callable[[], Any]):
+        self._loader = loader
+        self._lock = RLock()
+        self._loaded = False
+        self._value = None
+        if inspect.iscoroutinefunction(loader):
+            self._value = AsyncLazyValue(loader)
+            self._loaded = True
+
+    def __call__(self):
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._value = self._loader()
+                    self._loaded = True
+        return self._value
+
+
+class AsyncLazyValue:
+    """
+    AsyncLazyValue is the value injected for lazy constants with an async loader.
+
+    Awaiting it runs the loader once and returns its result. Concurrent awaits
+    share the same load, and cancelling one of them does not cancel the load. If
+    the loader raises, the next await runs it again.
+
+    Args:
+        loader: A coroutine function without arguments.
+
+    Example:
+        ```python
+        async def load_model():
+            return await storage.fetch("model.bin")
+
+        builder.bind_lazy_constant("model", load_model)
+
+        model = await container.get("model")
+        ```
+    """
+
+    def __init__(self, loader: Callable[[], Any]):
+        self._loader = loader
+        self._lock = Lock()
+        self._task: Optional[asyncio.Future] = None
+        self._loaded = False
+        self._value = None
+
+    def __await__(self):
+        return self._load().__await__()
+
+    async def _load(self) -> Any:
+        if self._loaded:
+            return self._value
+        with self._lock:
+            if self._task is None:
+                self._task = asyncio.ensure_future(self._loader())
+            task = self._task
+        try:
+            value = await asyncio.shield(task)
+        except BaseException:
+            # Load again on the next await if the load failed, rather than only
+            # this await being cancelled.
+            with self._lock:
+                if self._task is task and task.done():
+                    self._task = None
+            raise
+        self._value = value
+        self._loaded = True
+        return value
+
+
+class AssistedFactoryAdapter:
+    """
+    AssistedFactoryAdapter is an adapter class for assisted factory bindings.
+
+    Calling the adapter with a container returns the factory injected for
+    `Factory[T]`. The factory takes the assisted arguments, by position or by
+    name, resolves the other parameters from the container and calls the
+    implementation. The injected parameters are introspected when the binding is
+    built. The members they resolve to are looked up and linked on the first call
+    after the container publishes a new graph version, and singleton arguments
+    are kept, so later calls only resolve the other members.
+
+    Args:
+        implementation: The class or function that creates the instances.
+        assisted: The names of the parameters passed by the caller.
+        injected: The (name, annotation) pairs of the parameters resolved from the
+            container.
+
+    Methods:
+        __call__(self, ctx: Container) -> Callable[..., Any]:
+            Returns the factory for the container.
+
+    Example:
+        To create an AssistedFactoryAdapter instance:
+
+        ```python
+        from pyioc3.adapters import AssistedFactoryAdapter
+
+        # Create an adapter for a Handler(request_id, repository: Repository).
+        adapter = AssistedFactoryAdapter(
+            Handler, ("request_id",), (("repository", Repository),)
+        )
+
+        # Call the adapter to get the factory, then create a handler.
+        handler = adapter(container)("req-1")
+        ```
+    """
+
+    def __init__(
+        self,
+        implementation: Callable[..., Any],
+        assisted: Tuple[str, ...],
+        injected: Tuple[Tuple[str, Any], ...],
+    ):
+        self._implementation = implementation
+        self._assisted = assisted
+        self._injected = injected
+
+    def __call__(self, ctx: Container) -> Callable[..., Any]:
+        implementation = self._implementation
+        assisted = self._assisted
+        accepted = frozenset(assisted)
+        names = tuple(name for name, _ in self._injected)
+        annotations = tuple(annotation for _, annotation in self._injected)
+        # The graph version, the singleton arguments, and the names and members
+        # of the arguments resolved on every call.
+        plan = (None, {}, (), [])
+
+        def factory(*args, **kwargs):
+            nonlocal plan
+            if len(args) > len(assisted) or not accepted.issuperset(kwargs):
+                raise TypeError(
+                    f"Factory of {implementation!r} takes the assisted arguments"
+                    f" {assisted!r}."
+                )
+            arguments = dict(zip(assisted, args))
+            arguments.update(kwargs)
+            if names:
+                graph, singletons, planned, members = plan
+                if graph is not ctx._graph:
+                    graph = ctx._graph
+                    members = [ctx._lookup(a, graph) for a in annotations]
+                    values = ctx._resolve(members, graph)
+                    arguments.update(zip(names, values))
+                    plan = (
+                        graph,
+                        {
+                            name: value
+                            for name, value, member in zip(names, values, members)
+                            if member.scope == ScopeEnum.SINGLETON
+                        },
+                        tuple(
+                            name
+                            for name, member in zip(names, members)
+                            if member.scope != ScopeEnum.SINGLETON
+                        ),
+                        [m for m in members if m.scope != ScopeEnum.SINGLETON],
+                    )
+                else:
+                    arguments.update(singletons)
+                    if members:
+                        arguments.update(zip(planned, ctx._resolve(members, graph)))
+            return implementation(**arguments)
+
+        return factory
+
+
+class ResourceAdapter(ABC):
+    """
+    ResourceAdapter is the base class of adapters that hold operating system
+    resources for the values they provide.
+
+    The resources are released by `StaticContainer.close()`.
+
+    Methods:
+        release(self) -> None:
+            Releases the resources held by the adapter.
+    """
+
+    @abstractmethod
+    def release(self) -> None:
+        """Releases the resources held by the adapter."""
+        raise NotImplementedError()
+
+
+class MmapAsImplAdapter(ResourceAdapter):
+    """
+    MmapAsImplAdapter is an adapter class for memory-mapped file bindings.
+
+    Calling the adapter maps the file read-only and returns a memoryview of the
+    mapping, or the result of passing that memoryview to the loader. Nothing is
+    copied: every process that maps the same file reads the same page cache.
+
+    Args:
+        path: The path of the file to map.
+        loader: An optional function that decodes the memoryview.
+
+    Methods:
+        __call__(self) -> Any:
+            Maps the file and returns the memoryview or the loaded value.
+
+        release(self) -> None:
+            Releases the memoryviews and closes the mappings.
+
+    Example:
+        To create a MmapAsImplAdapter instance:
+
+        ```python
+        from pyioc3.adapters import MmapAsImplAdapter
+
+        # Create a MmapAsImplAdapter that decodes a table of 32 bit integers.
+        table_adapter = MmapAsImplAdapter("table.bin", lambda buf: buf.cast("i"))
+
+        # Call the adapter to map the file.
+        table = table_adapter()  # table[0] is read from the mapped file
+        ```
+    """
+
+    def __init__(self, path: str, loader: Optional[Callable[[memoryview], Any]] = None):
+        self._path = path
+        self._loader = loader
+        self._mappings: List[Tuple[Optional[mmap.mmap], memoryview]] = []
+
+    def __call__(self):
+        with open(self._path, "rb") as fh:
+            if os.fstat(fh.fileno()).st_size == 0:
+                # Empty files cannot be mapped.
+                mapping = None
+                view = memoryview(b"")
+            else:
+                mapping = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+                view = memoryview(mapping)
+        self._mappings.append((mapping, view))
+        return view if self._loader is None else self._loader(view)
+
+    def release(self) -> None:
+        while self._mappings:
+            mapping, view = self._mappings.pop()
+            try:
+                view.release()
+                if mapping is not None:
+                    mapping.close()
+            except BufferError:
+                # A value produced by the loader still exports the buffer.
+                # The mapping is closed when that value is collected.
+                pass
+
+
+class SharedMemoryAsImplAdapter(ResourceAdapter):
+    """
+    SharedMemoryAsImplAdapter is an adapter class for shared memory bindings.
+
+    The first call, or the first call to `share`, copies the value into a new
+    `multiprocessing.shared_memory` block and drops the reference to the value.
+    Calling the adapter returns a read-only memoryview of the block, or the result
+    of passing that memoryview to the loader. Adapters created by `attach` map an
+    existing block by name, so worker processes read the block without copying or
+    unpickling the value.
+
+    Only the process that created the block unlinks it on `release`. Other
+    processes, including forked children, only close their mapping.
+
+    Args:
+        value: A bytes-like object, such as bytes, an array or a NumPy array.
+        loader: An optional function that decodes the memoryview.
+
+    Methods:
+        attach(name, size, loader) -> SharedMemoryAsImplAdapter:
+            Creates an adapter for an existing block.
+
+        share(self) -> Tuple[str, int]:
+            Creates the block if needed and returns its name and size.
+
+        __call__(self) -> Any:
+            Returns a memoryview of the block or the loaded value.
+
+        release(self) -> None:
+            Releases the memoryviews, closes the block and unlinks it if owned.
+
+    Example:
+        To create a SharedMemoryAsImplAdapter instance:
+
+        ```python
+        from array import array
+        from pyioc3.adapters import SharedMemoryAsImplAdapter
+
+        # Place a table of 32 bit integers in shared memory.
+        table_adapter = SharedMemoryAsImplAdapter(
+            array("i", range(1000)), lambda buf: buf.cast("i")
+        )
+
+        # In a worker process, attach to the same block.
+        name, size = table_adapter.share()
+        worker_adapter = SharedMemoryAsImplAdapter.attach(name, size, None)
+        ```
+    """
+
+    def __init__(
+        self, value: Any, loader: Optional[Callable[[memoryview], Any]] = None
+    ):
+        self._value = value
+        self._loader = loader
+        self._lock = Lock()
+        self._block: Optional[SharedMemory] = None
+        self._size = 0
+        self._owner: Optional[int] = None
+        self._views: List[memoryview] = []
+
+    @staticmethod
+    def attach(
+        name: str, size: int, loader: Optional[Callable[[memoryview], Any]] = None
+    ) -> "SharedMemoryAsImplAdapter":
+        """
+        Creates an adapter for an existing block.
+
+        Args:
+            name: The name of the block.
+            size: The size of the value in bytes.
+            loader: An optional function that decodes the memoryview.
+
+        Returns:
+            SharedMemoryAsImplAdapter: An adapter that does not own the block.
+        """
+        adapter = SharedMemoryAsImplAdapter(None, loader)
+        adapter._block = SharedMemory(name=name)
+        adapter._size = size
+        return adapter
+
+    def share(self) -> Tuple[str, int]:
+        with self._lock:
+            if self._block is None:
+                data = memoryview(self._value).cast("B")
+                self._size = data.nbytes
+                # Blocks cannot be empty.
+                self._block = SharedMemory(create=True, size=max(self._size, 1))
+                self._block.buf[: self._size] = data
+                self._owner = os.getpid()
+                self._value = None
+        return self._block.name, self._size
+
+    def __call__(self):
+        self.share()
+        view = self._block.buf[: self._size].toreadonly()
+        self._views.append(view)
+        return view if self._loader is None else self._loader(view)
+
+    def release(self) -> None:
+        with self._lock:
+            if self._block is None:
+                return
+            try:
+                while self._views:
+                    self._views.pop().release()
+                self._block.close()
+            except BufferError:
+                # A value produced by the loader still exports the buffer.
+                # The mapping is closed when that value is collected.
+                pass
+            if self._owner == os.getpid():
+                self._block.unlink()
+                self._owner = None
+
+
+class KeyedInstanceAdapter(ResourceAdapter):
+    """
+    KeyedInstanceAdapter is an adapter class for keyed bindings.
+
+    Calling the adapter with a container returns the instance for the key of the
+    current `get(annotation, key=...)` request. Instances are created by an
+    assisted factory that passes the key to the implementation and injects its
+    other parameters, so every key shares one plan. They are cached per container
+    in a least recently used map owned by the container. The map is emptied when
+    the container publishes a new graph version or the process forks, and by
+    `release()`.
+
+    Args:
+        implementation: The class or function that creates the instances.
+        key: The name of the parameter that receives the key.
+        injected: The (name, annotation) pairs of the parameters resolved from the
+            container.
+        maxsize: The number of instances kept per container, or None to keep
+            every instance.
+        on_evict: An optional function called with each instance that is dropped
+            from the cache.
+
+    Methods:
+        __call__(self, ctx: Container) -> Any:
+            Returns the instance for the key of the current request.
+
+        release(self) -> None:
+            Drops every cached instance.
+
+    Example:
+        ```python
+        from pyioc3.adapters import KeyedInstanceAdapter
+
+        # Create an adapter for a ShardClient(shard_id, config: Config).
+        adapter = KeyedInstanceAdapter(
+            ShardClient, "shard_id", (("config", Config),), 64, ShardClient.close
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        implementation: Callable[..., Any],
+        key: str,
+        injected: Tuple[Tuple[str, Any], ...],
+        maxsize: Optional[int] = 128,
+        on_evict: Optional[Callable[[Any], None]] = None,
+    ):
+        self._implementation = implementation
+        self._key = key
+        self._injected = injected
+        self._maxsize = maxsize
+        self._on_evict = on_evict
+        self._factory = AssistedFactoryAdapter(implementation, (key,), injected)
+        self._lock = Lock()
+        # The caches are owned by their containers. These are kept for release().
+        self._caches = WeakSet()
+
+    def __call__(self, ctx: Container) -> Any:
+        key = ctx._request_key()
+        evicted = []
+        with self._lock:
+            cache = ctx._adapter_state.get(self)
+            if (
+                cache is None
+                or cache.graph is not ctx._graph
+                or cache.pid != os.getpid()
+            ):
+                if cache is not None and cache.pid == os.getpid():
+                    evicted.extend(cache.instances.values())
+                cache = _KeyedCache(ctx._graph, self._factory(ctx))
+                ctx._adapter_state[self] = cache
+                self._caches.add(cache)
+            instances = cache.instances
+            instance = instances.get(key, _MISSING)
+            if instance is not _MISSING:
+                instances.move_to_end(key)
+        self._evict(evicted)
+        if instance is not _MISSING:
+            return instance
+
+        instance = cache.factory(key)
+        evicted = []
+        with self._lock:
+            existing = instances.get(key, _MISSING)
+            if existing is not _MISSING:
+                # Another thread created the instance meanwhile.
+                evicted.append(instance)
+                instance = existing
+            else:
+                instances[key] = instance
+                if self._maxsize is not None and len(instances) > self._maxsize:
+                    evicted.append(instances.popitem(last=False)[1])
+        self._evict(evicted)
+        return instance
+
+    def _evict(self, instances: List[Any]) -> None:
+        if self._on_evict is not None:
+            for instance in instances:
+                self._on_evict(instance)
+
+    def release(self) -> None:
+        """Drops every cached instance."""
+        evicted = []
+        with self._lock:
+            for cache in self._caches:
+                if cache.pid == os.getpid():
+                    evicted.extend(cache.instances.values())
+                    cache.instances.clear()
+        self._evict(evicted)
+
+
+class _KeyedCache:
+    # The instances of a keyed binding in one container, owned by the container.
+
+    def __init__(self, graph: Any, factory: Callable[[Any], Any]):
+        self.graph = graph
+        self.pid = os.getpid()
+        self.factory = factory
+        self.instances: "OrderedDict[Any, Any]" = OrderedDict()
+
+
+class PrefetchAdapter(ResourceAdapter):
+    """
+    PrefetchAdapter is an adapter class for prefetched transient bindings.
+
+    Calling the adapter with a container returns a new instance taken from a
+    bounded queue. A daemon thread, started on the first call, keeps the queue
+    full by creating instances through an assisted factory without assisted
+    arguments, so the implementation and its injected parameters are created off
+    the caller's thread from a plan linked once per graph version. If the queue
+    is empty, the instance is created inline. Instances are never reused.
+
+    Each container owns its queue and thread. They are replaced when the
+    container publishes a new graph version or the process forks, and stopped by
+    `release()`. The thread holds the queue weakly, so it ends once the container
+    is garbage collected.
+
+    Args:
+        implementation: The class or function that creates the instances.
+        injected: The (name, annotation) pairs of the parameters resolved from the
+            container.
+        size: The number of instances kept ready.
+
+    Methods:
+        __call__(self, ctx: Container) -> Any:
+            Returns a new instance.
+
+        release(self) -> None:
+            Stops the threads and drops the queued instances.
+
+    Example:
+        ```python
+        from pyioc3.adapters import PrefetchAdapter
+
+        # Create an adapter for a Renderer(templates: Templates).
+        adapter = PrefetchAdapter(Renderer, (("templates", Templates),), 8)
+        ```
+    """
+
+    def __init__(
+        self,
+        implementation: Callable[..., Any],
+        injected: Tuple[Tuple[str, Any], ...],
+        size: int = 4,
+    ):
+        self._implementation = implementation
+        self._injected = injected
+        self._size = size
+        self._factory = AssistedFactoryAdapter(implementation, (), injected)
+        self._lock = Lock()
+        # The queues are owned by their containers. These are kept for release().
+        self._queues = WeakSet()
+
+    def __call__(self, ctx: Container) -> Any:
+        with self._lock:
+            ready = ctx._adapter_state.get(self)
+            if (
+                ready is None
+                or ready.graph is not ctx._graph
+                or not ready.current
+                or ready.stopped
+            ):
+                if ready is not None:
+                    ready.stop()
+                ready = _PrefetchQueue(ctx._graph, self._factory(ctx), self._size)
+                ctx._adapter_state[self] = ready
+                self._queues.add(ready)
+        try:
+            instance = ready.queue.get_nowait()
+        except queue.Empty:
+            instance = ready.factory()
+            # The first call, or the thread stopped after a failure.
+            ready.start()
+            return instance
+        ready.slots.release()
+        return instance
+
+    def release(self) -> None:
+        """Stops the threads and drops the queued instances."""
+        with self._lock:
+            queues = list(self._queues)
+            self._queues = WeakSet()
+        for ready in queues:
+            ready.stop()
+
+
+class _PrefetchQueue:
+    # The ready instances of one container and the thread that creates them. The
+    # container owns the queue and the thread only holds it weakly between two
+    # instances, so the thread ends once the container is collected.
+
+    def __init__(self, graph: Any, factory: Callable[[], Any], size: int):
+        self.graph = graph
+        self.factory = factory
+        self.queue = queue.Queue(size)
+        # The free places of the queue, taken by the thread before it creates an
+        # instance, so it never waits while holding one.
+        self.slots = Semaphore(size)
+        self._pid = os.getpid()
+        self._stopped = Event()
+        self._thread: Optional[Thread] = None
+        self._lock = Lock()
+
+    @property
+    def current(self) -> bool:
+        # Threads and queued instances are not carried over by fork.
+        return self._pid == os.getpid()
+
+    @property
+    def stopped(self) -> bool:
+        return self._stopped.is_set()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._stopped.is_set() or (
+                self._thread is not None and self._thread.is_alive()
+            ):
+                return
+            self._thread = Thread(
+                target=_PrefetchQueue._fill,
+                args=(ref(self),),
+                name="pyioc3-prefetch",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        try:
+            while True:
+                self.queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    @staticmethod
+    def _fill(ready_ref: "ref[_PrefetchQueue]") -> None:
+        while True:
+            ready = ready_ref()
+            if ready is None or ready.stopped:
+                return
+            slots = ready.slots
+            del ready
+            if not slots.acquire(timeout=0.5):
+                continue
+            ready = ready_ref()
+            if ready is None or ready.stopped:
+                return
+            try:
+                instance = ready.factory()
+            except Exception:
+                # The next call creates the instance inline, raises the error to
+                # its caller, and restarts the thread if it succeeds.
+                slots.release()
+                return
+            ready.queue.put_nowait(instance)
+            del ready, instance
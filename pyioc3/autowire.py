@@ -1,24 +1,37 @@
 import pkgutil
 import importlib
-from typing import Union, List, Callable, Optional, Type, Set
+import importlib.metadata
+from typing import Any, Union, List, Callable, Optional, Type, Set
 from types import ModuleType
 from collections import deque
 
+from .autowire_index import AutoWireIndex
+from .autowire_manifest import AutoWireManifest
+from .binding_registry import BindingRegistry
 from .errors import AutoWireError
-from .interface import PROVIDER_T, Binding, ProviderBinding, FactoryBinding
+from .interface import (
+    PROVIDER_T,
+    Binding,
+    ProviderBinding,
+    FactoryBinding,
+    MultiBinding,
+)
+from .fork_policy import ForkPolicy
 from .scope_enum import ScopeEnum
 from .static_container_builder import StaticContainerBuilder
 
-
 ModuleRef = Union[str, ModuleType]
 ModuleList = Union[List[ModuleRef], ModuleRef]
 ExcludeList = Union[str, List[str]]
 
+ENTRY_POINT_GROUP = "pyioc3.bindings"
+
 
 def bind(
     annotation: Optional[Type[PROVIDER_T]] = None,
     scope: Union[str, ScopeEnum] = None,
     on_activate: Callable[[PROVIDER_T], PROVIDER_T] = None,
+    fork_policy: Union[str, ForkPolicy] = None,
 ) -> Callable[[Callable], Callable]:
     """
     Decorator for binding a class for use in dependency injection.
@@ -35,6 +48,9 @@ def bind(
             to be executed when instances of the provider class are activated or
             retrieved from the container. This function can perform additional
             initialization or configuration on the provider instance.
+        fork_policy (Union[str, ForkPolicy]): What happens to a singleton instance
+            when the process forks: "share," "reinitialize," or "lazy." If not
+            specified, the instance is shared with forked processes.
 
     Returns:
         Callable[[Callable], Callable]: A decorator function that can be used to annotate
@@ -70,10 +86,59 @@ def bind(
             implementation=implementation,
             scope=scope or ScopeEnum.TRANSIENT,
             on_activate=on_activate,
+            fork_policy=fork_policy,
         )
-        AutoWireContainerBuilder._staged_bindings.append(
-            (implementation.__module__, binding)
+        AutoWireContainerBuilder.registry.register(implementation.__module__, binding)
+        return implementation
+
+    return decorator
+
+
+def bind_multi(
+    annotation: Type[PROVIDER_T],
+    scope: Union[str, ScopeEnum] = None,
+    on_activate: Callable[[PROVIDER_T], PROVIDER_T] = None,
+    fork_policy: Union[str, ForkPolicy] = None,
+) -> Callable[[Callable], Callable]:
+    """
+    Decorator for adding a class to a multi-binding.
+
+    Every class decorated with `bind_multi` for the same annotation is injected into
+    parameters annotated as `List[annotation]` or `Tuple[annotation, ...]`. Unlike
+    `bind`, any number of classes may be bound to the annotation.
+
+    Args:
+        annotation (Type[PROVIDER_T]): The element type of the collection.
+        scope (Union[str, ScopeEnum]): The scope of the element. If not specified,
+            the default scope, "transient" will be used.
+        on_activate (Callable[[PROVIDER_T], PROVIDER_T]): An optional callback
+            function to be executed when the element is created.
+        fork_policy (Union[str, ForkPolicy]): What happens to a singleton element
+            when the process forks. If not specified, it is shared.
+
+    Returns:
+        Callable[[Callable], Callable]: A decorator function that can be used to
+        annotate a class as an element of the collection.
+
+    Example:
+        >>> @bind_multi(Middleware, scope="singleton")
+        ... class AuthMiddleware(Middleware):
+        ...     ...
+
+    Note:
+        Elements are ordered by the name of their module, then by their position
+        in the module.
+    """
+
+    def decorator(implementation: Type[PROVIDER_T]) -> Type[PROVIDER_T]:
+        binding = MultiBinding(
+            annotation=annotation,
+            implementation=implementation,
+            scope=scope or ScopeEnum.TRANSIENT,
+            on_activate=on_activate,
+            fork_policy=fork_policy,
         )
+        AutoWireContainerBuilder.registry.register(implementation.__module__, binding)
         return implementation
 
     return decorator
@@ -112,7 +177,7 @@ def bind_factory(annotation: Type[PROVIDER_T]):
             annotation=annotation,
             factory=factory,
         )
-        AutoWireContainerBuilder._staged_bindings.append((factory.__module__, binding))
+        AutoWireContainerBuilder.registry.register(factory.__module__, binding)
         return factory
 
     return decorator
@@ -135,6 +200,25 @@ class AutoWireContainerBuilder(StaticContainerBuilder):
             binding. If a single module name is provided, it will be treated as a
             list with a single element. If not specified or set to an empty list, no
             modules will be excluded.
+        roots (Optional[List[Any]]): The annotations the container will be asked
+            for, as classes or dotted reference strings. Only used with "ast"
+            discovery. If not specified, every module that declares a binding is
+            imported.
+        discovery (str): How bindings are discovered. "import" (the default)
+            imports every module to run the decorators. "ast" parses the module
+            sources and only imports the modules that declare bindings reachable
+            from `roots`.
+        manifest (Optional[str]): A file used to cache the results of "ast"
+            discovery between processes. It is created if it does not exist and
+            updated when modules change. Passing a manifest enables "ast" discovery.
+        manifest_check (str): How changed modules are detected. "mtime" (the
+            default) compares modification times and sizes, "hash" compares the
+            sha256 digest of each source, and "none" trusts the manifest without
+            walking the packages at all.
+        entry_point_group (Optional[str]): An entry point group, usually
+            `ENTRY_POINT_GROUP`, naming modules that hold bindings. Each listed
+            module is imported as-is, without scanning its submodules. This lets
+            installed plugins declare exactly which of their modules to load.
 
     Example:
         To create an `AutoWireContainerBuilder` that scans the 'my_package' module and
@@ -145,6 +229,29 @@ class AutoWireContainerBuilder(StaticContainerBuilder):
         ...     excludes=['excluded_module']
         ... )
 
+        To only import the modules needed to provide `DuckInterface`:
+
+        >>> builder = AutoWireContainerBuilder(
+        ...     modules=['my_package'],
+        ...     roots=[DuckInterface],
+        ...     discovery="ast",
+        ... )
+
+        To reuse the discovery results of previous runs:
+
+        >>> builder = AutoWireContainerBuilder(
+        ...     modules=['my_package'],
+        ...     roots=[DuckInterface],
+        ...     manifest=".autowire-manifest.json",
+        ... )
+
+        To load the bindings declared by installed plugins in their
+        `pyioc3.bindings` entry points:
+
+        >>> builder = AutoWireContainerBuilder(
+        ...     modules=['my_package'],
+        ...     entry_point_group=ENTRY_POINT_GROUP,
+        ... )
 
     Note:
         Dependencies are auto-wired based on class decorators defined within the
@@ -156,12 +263,17 @@ class AutoWireContainerBuilder(StaticContainerBuilder):
         the documentation.
     """
 
-    _staged_bindings: List[Binding] = []
+    registry: BindingRegistry = BindingRegistry()
 
     def __init__(
         self,
-        modules: ModuleList,
+        modules: Optional[ModuleList] = None,
         excludes: Optional[ExcludeList] = None,
+        roots: Optional[List[Any]] = None,
+        discovery: str = "import",
+        manifest: Optional[str] = None,
+        manifest_check: str = "mtime",
+        entry_point_group: Optional[str] = None,
     ) -> None:
         """
         Initialize a new AutoWireContainerBuilder.
@@ -177,18 +289,47 @@ class AutoWireContainerBuilder(StaticContainerBuilder):
                 for dependency binding. If a single module name is provided, it will
                 be treated as a list with a single element. If not specified or set
                 to an empty list, no modules will be excluded.
+            roots (Optional[List[Any]]): The annotations the container will be
+                asked for, as classes or dotted reference strings. Only used with
+                "ast" discovery. If not specified, every module that declares a
+                binding is imported.
+            discovery (str): How bindings are discovered. Either "import" or "ast".
+            manifest (Optional[str]): A file used to cache the results of "ast"
+                discovery between processes. Passing a manifest enables "ast"
+                discovery.
+            manifest_check (str): How changed modules are detected. One of
+                "mtime", "hash" or "none".
+            entry_point_group (Optional[str]): An entry point group naming
+                additional modules that hold bindings. Listed modules are imported
+                without scanning their submodules.
 
         Returns:
             None
+
+        Raises:
+            AutoWireError: If the discovery mode or manifest check is unknown.
         """
-        modules = [modules] if isinstance(modules, str) else modules
+        modules = [modules] if isinstance(modules, str) else (modules or [])
         excludes = [excludes] if isinstance(excludes, str) else (excludes or [])
-        included_modules = AutoWireContainerBuilder._collect_modules(modules, excludes)
-        bindings = [
-            binding
-            for module_name, binding in set(AutoWireContainerBuilder._staged_bindings)
-            if module_name in included_modules
-        ]
+        if manifest is not None:
+            discovery = "ast"
+        if discovery == "import":
+            AutoWireContainerBuilder._import_modules(modules, excludes)
+            included_modules = AutoWireContainerBuilder._walk_modules(modules, excludes)
+        elif discovery == "ast":
+            included_modules = AutoWireContainerBuilder._index_modules(
+                AutoWireContainerBuilder._scan(
+                    modules, excludes, manifest, manifest_check
+                ),
+                roots,
+            )
+        else:
+            raise AutoWireError(f"Unknown autowire discovery mode '{discovery}'.")
+        if entry_point_group is not None:
+            included_modules |= AutoWireContainerBuilder._entry_point_modules(
+                entry_point_group, excludes
+            )
+        bindings = AutoWireContainerBuilder.registry.select(sorted(included_modules))
         AutoWireContainerBuilder._check_for_duplicates(bindings)
         super().__init__(bindings)
 
@@ -196,6 +337,9 @@ class AutoWireContainerBuilder(StaticContainerBuilder):
     def _check_for_duplicates(bindings: List[Binding]):
         seen = set()
         for binding in bindings:
+            if isinstance(binding, MultiBinding):
+                # Multi-bindings collect every element bound to the annotation.
+                continue
             if binding.annotation in seen:
                 impls = ", ".join(
                     [
@@ -215,18 +359,74 @@ class AutoWireContainerBuilder(StaticContainerBuilder):
             seen.add(binding.annotation)
 
     @staticmethod
-    def _collect_modules(modules: List[ModuleRef], excludes: List[str]) -> Set[str]:
+    def _import_modules(modules: List[ModuleRef], excludes: List[str]) -> None:
         excludes = set(excludes)
         queue = deque(set(modules) - excludes)
-        ret = set()
         while queue:
             mod = queue.pop()
             if isinstance(mod, str):
                 mod = importlib.import_module(mod)
-            ret.add(mod.__name__)
             if hasattr(mod, "__path__"):
                 for submod_info in pkgutil.iter_modules(mod.__path__):
                     submod_name = f"{mod.__name__}.{submod_info.name}"
                     if submod_name not in excludes:
                         queue.append(submod_name)
+
+    @staticmethod
+    def _walk_modules(modules: List[ModuleRef], excludes: List[str]) -> Set[str]:
+        # The registry's package index only visits modules that staged bindings.
+        ret = set()
+        for mod in modules:
+            name = mod if isinstance(mod, str) else mod.__name__
+            if name in excludes:
+                continue
+            ret.update(
+                module
+                for module in AutoWireContainerBuilder.registry.walk(name)
+                if not any(
+                    module == exclude or module.startswith(exclude + ".")
+                    for exclude in excludes
+                )
+            )
+        return ret
+
+    @staticmethod
+    def _scan(
+        modules: List[ModuleRef],
+        excludes: List[str],
+        manifest: Optional[str],
+        check: str,
+    ) -> AutoWireIndex:
+        previous = AutoWireManifest.load(manifest) if manifest else None
+        index = AutoWireIndex.scan(modules, excludes, previous, check)
+        if manifest and index.stale:
+            try:
+                AutoWireManifest.save(index, manifest)
+            except OSError:
+                # The manifest is only a cache. Read-only deployments still work.
+                pass
+        return index
+
+    @staticmethod
+    def _index_modules(index: AutoWireIndex, roots: Optional[List[Any]]) -> Set[str]:
+        ret = index.modules_for(roots)
+        for name in ret:
+            importlib.import_module(name)
+        return ret
+
+    @staticmethod
+    def _entry_point_modules(group: str, excludes: List[str]) -> Set[str]:
+        entry_points = importlib.metadata.entry_points()
+        if hasattr(entry_points, "select"):
+            entry_points = entry_points.select(group=group)
+        else:
+            # Python < 3.10 returns a dict of groups.
+            entry_points = entry_points.get(group, [])
+
+        ret = set()
+        for entry_point in entry_points:
+            name = entry_point.value.partition(":")[0].strip()
+            if name not in excludes and name not in ret:
+                importlib.import_module(name)
+                ret.add(name)
         return ret
@@ -0,0 +1,548 @@
+import ast
+import hashlib
+import importlib
+import importlib.util
+import os
+import pkgutil
+from collections import deque
+from types import ModuleType
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from .errors import AutoWireError
+
+BIND_DECORATORS = {
+    "pyioc3.autowire.bind": "provider",
+    "pyioc3.autowire.bind_factory": "factory",
+    "pyioc3.autowire.bind_multi": "multi",
+}
+
+# References into these modules are too generic to identify a binding.
+_GENERIC_MODULES = ("builtins.", "typing.", "typing_extensions.", "collections.")
+
+
+class IndexedBinding(NamedTuple):
+    """A binding found in source code without importing its module."""
+
+    module: str
+    qualname: str
+    kind: str
+    provides: Tuple[str, ...]
+    scope: Optional[str]
+    depends: Tuple[str, ...]
+
+
+class ModuleRecord(NamedTuple):
+    """The statically discovered contents of a single module."""
+
+    name: str
+    path: Optional[str]
+    parsed: bool
+    bindings: Tuple[IndexedBinding, ...]
+    aliases: Dict[str, str]
+    mtime: Optional[int] = None
+    size: Optional[int] = None
+    digest: Optional[str] = None
+
+
+class AutoWireIndex:
+    """
+    AutoWireIndex locates `@bind`, `@bind_multi` and `@bind_factory` decorated
+    symbols by parsing module sources with `ast`, without importing the modules.
+
+    The index records, for every decorated symbol, the references it provides and
+    the references its constructor (or factory body) depends on. From that it can
+    compute which modules must be imported to satisfy a set of root annotations.
+    References are dotted paths such as `my_package.interface.DuckInterface`. Names
+    imported by a scanned module are followed to the module that defines them.
+
+    Dependency detection is conservative: factories depend on every name their body
+    references and classes without an `__init__` depend on their bases. Modules
+    whose source cannot be read are always imported.
+
+    Methods:
+        scan(modules, excludes, previous, check) -> AutoWireIndex:
+            Parses the given packages and their submodules, reusing the records of
+            a previous index for modules that have not changed.
+
+        modules_for(roots) -> Set[str]:
+            Returns the modules that must be imported to bind the given roots.
+
+    Example:
+        ```python
+        from pyioc3.autowire_index import AutoWireIndex
+
+        index = AutoWireIndex.scan(["my_package"], [])
+        modules = index.modules_for([DuckInterface])
+        ```
+    """
+
+    def __init__(
+        self,
+        records: Dict[str, ModuleRecord],
+        modules: Tuple[str, ...] = (),
+        excludes: Tuple[str, ...] = (),
+        stale: bool = True,
+    ):
+        self._records = records
+        self._providers: Optional[Dict[str, List[IndexedBinding]]] = None
+        self.modules = modules
+        self.excludes = excludes
+        self.stale = stale
+
+    @property
+    def records(self) -> Dict[str, ModuleRecord]:
+        """The module records of this index, by module name."""
+        return self._records
+
+    @staticmethod
+    def scan(
+        modules: List[Any],
+        excludes: List[str],
+        previous: Optional["AutoWireIndex"] = None,
+        check: str = "mtime",
+    ) -> "AutoWireIndex":
+        """
+        Parses the given packages and their submodules.
+
+        Arguments:
+            modules (List[ModuleRef]): Module names or module objects to scan.
+            excludes (List[str]): Module names to skip, along with their submodules.
+            previous (Optional[AutoWireIndex]): An earlier index of the same
+                modules, usually loaded from a manifest. Its records are reused for
+                modules that have not changed.
+            check (str): How unchanged modules are detected. "mtime" compares the
+                modification time and size of each source. "hash" compares the
+                sha256 digest of each source. "none" trusts the previous index
+                completely and skips the package walk.
+
+        Returns:
+            AutoWireIndex: The index of the scanned modules. The `stale` attribute
+            is False if it is identical to `previous`.
+
+        Raises:
+            AutoWireError: If a module cannot be found or `check` is unknown.
+        """
+        if check not in ("mtime", "hash", "none"):
+            raise AutoWireError(f"Unknown autowire manifest check '{check}'.")
+
+        names = tuple(m.__name__ if isinstance(m, ModuleType) else m for m in modules)
+        excludes = tuple(excludes)
+        if (
+            previous is not None
+            and check == "none"
+            and previous.modules == names
+            and previous.excludes == excludes
+        ):
+            return previous
+
+        cached = previous.records if previous is not None else {}
+        records = {
+            name: AutoWireIndex._refresh(cached.get(name), name, path, pkg, check)
+            for name, path, pkg in AutoWireIndex.find_modules(modules, excludes)
+        }
+        stale = (
+            previous is None
+            or previous.modules != names
+            or previous.excludes != excludes
+            or records.keys() != cached.keys()
+            or any(records[name] is not cached[name] for name in records)
+        )
+        return AutoWireIndex(records, names, excludes, stale)
+
+    @staticmethod
+    def _refresh(
+        cached: Optional[ModuleRecord],
+        name: str,
+        path: Optional[str],
+        is_package: bool,
+        check: str,
+    ) -> ModuleRecord:
+        # Records keep paths relative to the package root, so a manifest built at
+        # packaging time still matches once the package is installed elsewhere.
+        relative = AutoWireIndex.relative_path(name, path, is_package)
+        if cached is None or cached.path != relative or not path:
+            return AutoWireIndex.parse(name, path, is_package)._replace(path=relative)
+        if not path.endswith(".py"):
+            return cached
+        stat = os.stat(path)
+        if check != "hash":
+            if stat.st_mtime_ns == cached.mtime and stat.st_size == cached.size:
+                return cached
+            return AutoWireIndex.parse(name, path, is_package)._replace(path=relative)
+        with open(path, "rb") as fh:
+            source = fh.read()
+        if hashlib.sha256(source).hexdigest() == cached.digest:
+            return cached
+        record = AutoWireIndex._parse_file(name, path, is_package, source, stat)
+        return record._replace(path=relative)
+
+    @staticmethod
+    def relative_path(
+        name: str, path: Optional[str], is_package: bool
+    ) -> Optional[str]:
+        """
+        Returns the path of a module source relative to its package root.
+
+        Arguments:
+            name (str): The module name.
+            path (Optional[str]): The path of the module source.
+            is_package (bool): True if the module is a package `__init__`.
+
+        Returns:
+            Optional[str]: The path, with "/" separators, of the source below the
+            directory that holds the top-level package, or None without a path.
+        """
+        if not path:
+            return path
+        root = os.path.abspath(path)
+        for _ in range(name.count(".") + (2 if is_package else 1)):
+            root = os.path.dirname(root)
+        return os.path.relpath(os.path.abspath(path), root).replace(os.sep, "/")
+
+    @staticmethod
+    def find_modules(
+        modules: List[Any], excludes: List[str]
+    ) -> Iterable[Tuple[str, Optional[str], bool]]:
+        """
+        Walks packages without importing them.
+
+        Parent packages of the given module names are imported by the import
+        system to locate them. Submodules are located through the file system.
+
+        Arguments:
+            modules (List[ModuleRef]): Module names or module objects to walk.
+            excludes (List[str]): Module names to skip, along with their submodules.
+
+        Yields:
+            Tuple[str, Optional[str], bool]: The name, source path and package flag
+            of each module.
+        """
+        excludes = set(excludes)
+        queue = deque()
+        for mod in modules:
+            name = mod.__name__ if isinstance(mod, ModuleType) else mod
+            if name in excludes:
+                continue
+            try:
+                spec = (
+                    mod.__spec__
+                    if isinstance(mod, ModuleType)
+                    else importlib.util.find_spec(name)
+                )
+            except ImportError as ex:
+                raise AutoWireError(f"AutoWire could not find module '{name}'.") from ex
+            if spec is None:
+                raise AutoWireError(f"AutoWire could not find module '{name}'.")
+            queue.append((name, spec))
+
+        seen = set()
+        while queue:
+            name, spec = queue.pop()
+            if name in seen:
+                continue
+            seen.add(name)
+            locations = spec.submodule_search_locations
+            yield name, spec.origin if spec.has_location else None, bool(locations)
+            for info in pkgutil.iter_modules(locations or []):
+                child = f"{name}.{info.name}"
+                if child in excludes:
+                    continue
+                try:
+                    child_spec = info.module_finder.find_spec(child)
+                except (AttributeError, TypeError):
+                    child_spec = importlib.util.find_spec(child)
+                if child_spec is not None:
+                    queue.append((child, child_spec))
+
+    @staticmethod
+    def parse(name: str, path: Optional[str], is_package: bool) -> ModuleRecord:
+        """
+        Parses the source of a single module.
+
+        Arguments:
+            name (str): The module name.
+            path (Optional[str]): The path of the module source.
+            is_package (bool): True if the module is a package `__init__`.
+
+        Returns:
+            ModuleRecord: The record of the module. The record is marked as not
+            parsed if the source is not a python file.
+        """
+        if not path or not path.endswith(".py"):
+            return ModuleRecord(name, path, False, (), {})
+        stat = os.stat(path)
+        with open(path, "rb") as fh:
+            source = fh.read()
+        return AutoWireIndex._parse_file(name, path, is_package, source, stat)
+
+    @staticmethod
+    def _parse_file(
+        name: str,
+        path: str,
+        is_package: bool,
+        source: bytes,
+        stat: os.stat_result,
+    ) -> ModuleRecord:
+        return AutoWireIndex.parse_source(name, path, is_package, source)._replace(
+            mtime=stat.st_mtime_ns,
+            size=stat.st_size,
+            digest=hashlib.sha256(source).hexdigest(),
+        )
+
+    @staticmethod
+    def parse_source(
+        name: str, path: Optional[str], is_package: bool, source: bytes
+    ) -> ModuleRecord:
+        """
+        Parses module source code.
+
+        Arguments:
+            name (str): The module name.
+            path (Optional[str]): The path of the module source.
+            is_package (bool): True if the module is a package `__init__`.
+            source (bytes): The module source.
+
+        Returns:
+            ModuleRecord: The record of the module.
+        """
+        try:
+            tree = ast.parse(source, filename=path or name)
+        except SyntaxError:
+            return ModuleRecord(name, path, False, (), {})
+        parser = _SourceParser(name, is_package)
+        parser.visit_body(tree.body)
+        return ModuleRecord(name, path, True, tuple(parser.bindings), parser.aliases)
+
+    def _canonical(self, ref: str) -> str:
+        # Follow names imported by indexed modules to where they are defined.
+        for _ in range(32):
+            parts = ref.split(".")
+            for i in range(len(parts) - 1, 0, -1):
+                record = self._records.get(".".join(parts[:i]))
+                if record is not None:
+                    target = record.aliases.get(parts[i])
+                    if target is None:
+                        return ref
+                    ref = ".".join([target] + parts[i + 1 :])
+                    break
+            else:
+                return ref
+        return ref
+
+    def _get_providers(self) -> Dict[str, List[IndexedBinding]]:
+        if self._providers is None:
+            self._providers = {}
+            for record in self._records.values():
+                for binding in record.bindings:
+                    for ref in binding.provides:
+                        self._providers.setdefault(self._canonical(ref), []).append(
+                            binding
+                        )
+        return self._providers
+
+    @staticmethod
+    def root_ref(root: Any) -> Optional[str]:
+        """
+        Returns the reference of a root annotation.
+
+        Arguments:
+            root: A class, or a dotted reference string.
+
+        Returns:
+            Optional[str]: The reference, or None if the root cannot be referenced.
+        """
+        if isinstance(root, str):
+            return root
+        module = getattr(root, "__module__", None)
+        qualname = getattr(root, "__qualname__", None)
+        if module and qualname and "<locals>" not in qualname:
+            return f"{module}.{qualname}"
+        return None
+
+    def modules_for(self, roots: Optional[Iterable[Any]] = None) -> Set[str]:
+        """
+        Returns the modules that must be imported to bind the given roots.
+
+        Arguments:
+            roots (Optional[Iterable[Any]]): Root annotations, as classes or
+                dotted reference strings. If not provided, or if a root cannot be
+                referenced, every module that declares a binding is returned.
+
+        Returns:
+            Set[str]: The module names to import.
+        """
+        opaque = {name for name, r in self._records.items() if not r.parsed}
+        refs = [AutoWireIndex.root_ref(root) for root in roots or []]
+        if roots is None or None in refs:
+            return opaque | {
+                name for name, record in self._records.items() if record.bindings
+            }
+
+        providers = self._get_providers()
+        ret = set(opaque)
+        seen = set()
+        queue = deque(refs)
+        while queue:
+            ref = self._canonical(queue.pop())
+            if ref in seen:
+                continue
+            seen.add(ref)
+            # String annotations are indexed by their literal form.
+            for binding in providers.get(ref, []) + providers.get(repr(ref), []):
+                ret.add(binding.module)
+                queue.extend(binding.depends)
+        return ret
+
+
+class _SourceParser:
+    def __init__(self, module: str, is_package: bool):
+        self.module = module
+        self.package = module if is_package else module.rpartition(".")[0]
+        self.aliases: Dict[str, str] = {}
+        self.bindings: List[IndexedBinding] = []
+
+    def visit_body(self, body: List[ast.stmt]) -> None:
+        for node in body:
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    if alias.asname:
+                        self.aliases[alias.asname] = alias.name
+                    else:
+                        head = alias.name.split(".")[0]
+                        self.aliases[head] = head
+            elif isinstance(node, ast.ImportFrom):
+                base = self._import_base(node)
+                for alias in node.names:
+                    if alias.name != "*":
+                        self.aliases[alias.asname or alias.name] = (
+                            f"{base}.{alias.name}" if base else alias.name
+                        )
+            elif isinstance(node, (ast.ClassDef, ast.FunctionDef)):
+                self._visit_definition(node)
+            elif isinstance(node, ast.If):
+                self.visit_body(node.body)
+                self.visit_body(node.orelse)
+            elif isinstance(node, ast.Try):
+                self.visit_body(node.body)
+                for handler in node.handlers:
+                    self.visit_body(handler.body)
+                self.visit_body(node.orelse)
+                self.visit_body(node.finalbody)
+            elif isinstance(node, ast.With):
+                self.visit_body(node.body)
+
+    def _import_base(self, node: ast.ImportFrom) -> str:
+        if not node.level:
+            return node.module or ""
+        parts = self.package.split(".") if self.package else []
+        parts = parts[: len(parts) - (node.level - 1)]
+        if node.module:
+            parts.append(node.module)
+        return ".".join(parts)
+
+    def _ref(self, node: ast.AST) -> Optional[str]:
+        if isinstance(node, ast.Name):
+            return self.aliases.get(node.id, f"{self.module}.{node.id}")
+        elif isinstance(node, ast.Attribute):
+            value = self._ref(node.value)
+            return f"{value}.{node.attr}" if value else None
+        return None
+
+    def _refs(self, node: Optional[ast.AST]) -> List[str]:
+        # All references in an annotation expression, including string annotations.
+        if node is None:
+            return []
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            try:
+                node = ast.parse(node.value, mode="eval").body
+            except SyntaxError:
+                return []
+        ref = self._ref(node)
+        if ref is not None:
+            return [ref]
+        ret = []
+        for child in ast.iter_child_nodes(node):
+            ret.extend(self._refs(child))
+        return ret
+
+    def _visit_definition(self, node: ast.AST) -> None:
+        for decorator in node.decorator_list:
+            if not isinstance(decorator, ast.Call):
+                continue
+            kind = BIND_DECORATORS.get(self._ref(decorator.func))
+            if kind is None:
+                continue
+            args = {k.arg: k.value for k in decorator.keywords}
+            for param, value in zip(("annotation", "scope"), decorator.args):
+                args.setdefault(param, value)
+
+            annotation = args.get("annotation")
+            if annotation is None or (
+                isinstance(annotation, ast.Constant) and annotation.value is None
+            ):
+                provides = [f"{self.module}.{node.name}"]
+            elif isinstance(annotation, ast.Constant):
+                provides = [repr(annotation.value)]
+            else:
+                provides = self._refs(annotation)
+
+            if kind == "factory":
+                scope = "singleton"
+                depends = self._refs_in_body(node)
+            else:
+                scope = self._scope(args.get("scope"))
+                depends = self._constructor_refs(node)
+
+            self.bindings.append(
+                IndexedBinding(
+                    module=self.module,
+                    qualname=node.name,
+                    kind=kind,
+                    provides=self._specific(provides),
+                    scope=scope,
+                    depends=self._specific(depends),
+                )
+            )
+
+    @staticmethod
+    def _specific(refs: List[str]) -> Tuple[str, ...]:
+        return tuple(
+            dict.fromkeys(r for r in refs if not r.startswith(_GENERIC_MODULES))
+        )
+
+    @staticmethod
+    def _scope(node: Optional[ast.AST]) -> Optional[str]:
+        if node is None:
+            return "transient"
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+            return node.value.lower()
+        elif isinstance(node, ast.Attribute):
+            return node.attr.lower()
+        return None
+
+    def _constructor_refs(self, node: ast.AST) -> List[str]:
+        if isinstance(node, ast.FunctionDef):
+            return self._argument_refs(node)
+        for child in node.body:
+            if isinstance(child, ast.FunctionDef) and child.name == "__init__":
+                return self._argument_refs(child)
+        # The constructor is inherited. Depend on the bases.
+        return [ref for base in node.bases for ref in self._refs(base)]
+
+    def _argument_refs(self, node: ast.FunctionDef) -> List[str]:
+        args = node.args
+        params = args.posonlyargs + args.args + args.kwonlyargs
+        return [ref for arg in params for ref in self._refs(arg.annotation)]
+
+    def _refs_in_body(self, node: ast.AST) -> List[str]:
+        ret = []
+        for child in ast.walk(node):
+            if isinstance(child, ast.Attribute):
+                ref = self._ref(child)
+                if ref:
+                    ret.append(ref)
+            elif isinstance(child, ast.Name):
+                ret.append(self._ref(child))
+            elif isinstance(child, ast.arg):
+                ret.extend(self._refs(child.annotation))
+        return ret
@@ -0,0 +1,137 @@
+import json
+import os
+import tempfile
+from typing import Any, Dict, Optional
+
+from .autowire_index import AutoWireIndex, IndexedBinding, ModuleRecord
+
+MANIFEST_FORMAT = 1
+
+
+class AutoWireManifest:
+    """
+    AutoWireManifest persists an AutoWireIndex to a JSON file.
+
+    The manifest lists every scanned module with its source path, relative to the
+    package root, modification time, size and sha256 digest, and every discovered binding with its module,
+    qualified name, annotation references and scope. Loading a manifest lets the
+    next process skip parsing modules that have not changed, or with the "none"
+    check, skip the package walk entirely.
+
+    Methods:
+        load(path) -> Optional[AutoWireIndex]:
+            Reads an index from a manifest file.
+
+        save(index, path) -> None:
+            Writes an index to a manifest file.
+
+    Example:
+        ```python
+        from pyioc3.autowire_index import AutoWireIndex
+        from pyioc3.autowire_manifest import AutoWireManifest
+
+        previous = AutoWireManifest.load("autowire.json")
+        index = AutoWireIndex.scan(["my_package"], [], previous)
+        if index.stale:
+            AutoWireManifest.save(index, "autowire.json")
+        ```
+    """
+
+    @staticmethod
+    def load(path: str) -> Optional[AutoWireIndex]:
+        """
+        Reads an index from a manifest file.
+
+        Arguments:
+            path (str): The manifest file.
+
+        Returns:
+            Optional[AutoWireIndex]: The index, or None if the file does not exist
+            or was written by an incompatible version.
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+            return AutoWireManifest.from_dict(data)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    @staticmethod
+    def save(index: AutoWireIndex, path: str) -> None:
+        """
+        Writes an index to a manifest file.
+
+        The file is replaced atomically so concurrent readers never see a partial
+        manifest.
+
+        Arguments:
+            index (AutoWireIndex): The index to write.
+            path (str): The manifest file.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(AutoWireManifest.to_dict(index), fh, indent=1, sort_keys=True)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    @staticmethod
+    def to_dict(index: AutoWireIndex) -> Dict[str, Any]:
+        """
+        Converts an index to a JSON compatible dictionary.
+
+        Arguments:
+            index (AutoWireIndex): The index to convert.
+
+        Returns:
+            Dict[str, Any]: The manifest contents.
+        """
+        return {
+            "format": MANIFEST_FORMAT,
+            "modules": list(index.modules),
+            "excludes": list(index.excludes),
+            "records": {
+                name: dict(
+                    record._asdict(),
+                    bindings=[b._asdict() for b in record.bindings],
+                )
+                for name, record in index.records.items()
+            },
+        }
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> Optional[AutoWireIndex]:
+        """
+        Converts manifest contents back to an index.
+
+        Arguments:
+            data (Dict[str, Any]): The manifest contents.
+
+        Returns:
+            Optional[AutoWireIndex]: The index, or None if the format is not
+            supported.
+        """
+        if data.get("format") != MANIFEST_FORMAT:
+            return None
+        records = {}
+        for name, record in data["records"].items():
+            bindings = tuple(
+                IndexedBinding(
+                    **dict(
+                        b,
+                        provides=tuple(b["provides"]),
+                        depends=tuple(b["depends"]),
+                    )
+                )
+                for b in record["bindings"]
+            )
+            records[name] = ModuleRecord(**dict(record, bindings=bindings))
+        return AutoWireIndex(
+            records,
+            tuple(data["modules"]),
+            tuple(data["excludes"]),
+            stale=False,
+        )
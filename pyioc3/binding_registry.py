@@ -0,0 +1,181 @@
+from threading import RLock
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Set, Tuple
+
+from .interface import Binding
+
+
+class RegistrySnapshot(NamedTuple):
+    """An opaque copy of the contents of a BindingRegistry."""
+
+    modules: Dict[str, Dict[Binding, None]]
+
+
+class BindingRegistry:
+    """
+    BindingRegistry holds the bindings staged by the autowire decorators.
+
+    Bindings are grouped by the module that declared them and de-duplicated when
+    they are registered. Modules are also indexed in a prefix tree by package, so
+    selecting the bindings of a set of modules, or of a package, only touches the
+    selected modules no matter how many bindings were ever registered. Import
+    discovery walks this tree to find the modules of the scanned packages.
+
+    Methods:
+        register(module, binding) -> None:
+            Stages a binding declared by the given module.
+
+        select(modules) -> List[Binding]:
+            Returns the bindings declared by the given modules.
+
+        walk(package) -> Iterator[str]:
+            Yields the registered modules in a package, including the package.
+
+        reset() -> None:
+            Removes all staged bindings.
+
+        snapshot() -> RegistrySnapshot:
+            Captures the staged bindings so they can be restored later.
+
+        restore(snapshot) -> None:
+            Replaces the staged bindings with a snapshot.
+
+    Example:
+        To isolate tests that declare bindings:
+
+        ```python
+        from pyioc3.autowire import AutoWireContainerBuilder
+
+        class MyTest(TestCase):
+            def setUp(self):
+                self.snapshot = AutoWireContainerBuilder.registry.snapshot()
+
+            def tearDown(self):
+                AutoWireContainerBuilder.registry.restore(self.snapshot)
+        ```
+    """
+
+    def __init__(self):
+        self._lock = RLock()
+        self._modules: Dict[str, Dict[Binding, None]] = {}
+        self._children: Dict[str, Set[str]] = {}
+
+    def register(self, module: str, binding: Binding) -> None:
+        """
+        Stages a binding declared by the given module.
+
+        Registering the same binding twice, for example when a module is reloaded
+        without changes, has no effect.
+
+        Args:
+            module (str): The name of the declaring module.
+            binding (Binding): The staged binding.
+        """
+        with self._lock:
+            if module not in self._modules:
+                self._modules[module] = {}
+                self._index(module)
+            self._modules[module][binding] = None
+
+    def _index(self, module: str) -> None:
+        parent, _, _ = module.rpartition(".")
+        while parent:
+            children = self._children.setdefault(parent, set())
+            if module in children:
+                break
+            children.add(module)
+            module = parent
+            parent, _, _ = module.rpartition(".")
+
+    def select(self, modules: Iterable[str]) -> List[Binding]:
+        """
+        Returns the bindings declared by the given modules.
+
+        Args:
+            modules (Iterable[str]): The module names.
+
+        Returns:
+            List[Binding]: The bindings, grouped by module in the given order.
+        """
+        with self._lock:
+            return [
+                binding
+                for module in modules
+                for binding in self._modules.get(module, ())
+            ]
+
+    def walk(self, package: str) -> Iterator[str]:
+        """
+        Yields the registered modules in a package, including the package.
+
+        Args:
+            package (str): The package name.
+
+        Yields:
+            str: The names of modules that registered bindings.
+        """
+        with self._lock:
+            stack = [package]
+            ret = []
+            while stack:
+                name = stack.pop()
+                if name in self._modules:
+                    ret.append(name)
+                stack.extend(self._children.get(name, ()))
+        return iter(ret)
+
+    def reset(self) -> None:
+        """Removes all staged bindings."""
+        with self._lock:
+            self._modules = {}
+            self._children = {}
+
+    def snapshot(self) -> RegistrySnapshot:
+        """
+        Captures the staged bindings so they can be restored later.
+
+        Returns:
+            RegistrySnapshot: The captured bindings.
+        """
+        with self._lock:
+            return RegistrySnapshot(
+                {module: dict(bindings) for module, bindings in self._modules.items()}
+            )
+
+    def restore(self, snapshot: RegistrySnapshot) -> None:
+        """
+        Replaces the staged bindings with a snapshot.
+
+        Args:
+            snapshot (RegistrySnapshot): A snapshot taken from any registry.
+        """
+        with self._lock:
+            self.reset()
+            for module, bindings in snapshot.modules.items():
+                self._modules[module] = dict(bindings)
+                self._index(module)
+
+    def __iter__(self) -> Iterator[Tuple[str, Binding]]:
+        """
+        Returns an iterator over the staged (module, binding) pairs.
+
+        Returns:
+            Iterator: An iterator over the staged bindings, grouped by module.
+        """
+        with self._lock:
+            return iter(
+                [
+                    (module, binding)
+                    for module, bindings in self._modules.items()
+                    for binding in bindings
+                ]
+            )
+
+    def __len__(self) -> int:
+        """
+        Returns the number of staged bindings.
+
+        Returns:
+            int: The number of staged bindings.
+        """
+        with self._lock:
+            return sum(len(bindings) for bindings in self._modules.values())
@@ -1,8 +1,14 @@
-from typing import Callable, List, Type, Any
+from typing import Callable, List, Optional, Type, Any
+from .fork_policy import ForkPolicy
 from .scope_enum import ScopeEnum
 from .interface import PROVIDER_T
 
 
+def default_on_activate(instance: PROVIDER_T) -> PROVIDER_T:
+    """The activation callback of members bound without one. Returns the instance."""
+    return instance
+
+
 class BoundMember:
     """
     BoundMember represents metadata associated with a bound member.
@@ -11,26 +17,39 @@ class BoundMember:
         annotation (Type[PROVIDER_T]): The annotation of the bound member.
         implementation (Type[PROVIDER_T]): The implementation of the bound member.
         scope (ScopeEnum): The scope of the bound member.
-        parameters (List[Any]): A list of parameters required for the member's
-            instantiation.
+        parameters (Optional[List[Any]]): A list of parameters required for the
+            member's instantiation, or None if the member is deferred and has not
+            been introspected and linked yet.
         on_activate (Callable[[PROVIDER_T], PROVIDER_T], optional): An optional
             callback function to be executed when the bound member is activated.
+        fork_policy (ForkPolicy, optional): What happens to a singleton instance of
+            the member when the process forks. Defaults to ForkPolicy.SHARE.
 
     Attributes:
         annotation (Type[PROVIDER_T]): The annotation of the bound member.
         implementation (Type[PROVIDER_T]): The implementation of the bound member.
         scope (ScopeEnum): The scope of the bound member.
-        parameters (List[Any]): A list of parameters required for the member's
-            instantiation.
+        parameters (Optional[List[Any]]): A list of parameters required for the
+            member's instantiation, or None if the member is deferred and has not
+            been introspected and linked yet.
         on_activate (Callable[[PROVIDER_T], PROVIDER_T]): An optional callback function
             to be executed when the bound member is activated.
+        fork_policy (ForkPolicy): What happens to a singleton instance of the
+            member when the process forks.
         _depends_on (List[BoundMember]): A list of bound members that this member
             depends on.
+        references (List[BoundMember]): The members the implementation resolves
+            from the container itself, such as the injected parameters of an
+            assisted factory. They are linked and checked for cycles like the
+            dependencies, but are not created before the member.
 
     Methods:
         bind_dependant(self, dependant: "BoundMember") -> None:
             Binds a dependent member to this member.
 
+        bind_reference(self, reference: "BoundMember") -> None:
+            Binds a member resolved by the implementation of this member.
+
     Example:
         To create a `BoundMember` instance:
 
@@ -57,17 +76,20 @@ class BoundMember:
         annotation: Type[PROVIDER_T],
         implementation: Type[PROVIDER_T],
         scope: ScopeEnum,
-        parameters: List[Any],
+        parameters: Optional[List[Any]],
         on_activate: Callable[[PROVIDER_T], PROVIDER_T] = None,
+        fork_policy: ForkPolicy = ForkPolicy.SHARE,
     ) -> None:
         self.annotation: Type[PROVIDER_T] = annotation
         self.implementation: Type[PROVIDER_T] = implementation
         self.scope: ScopeEnum = scope
-        self.parameters: List[Any] = parameters
+        self.parameters: Optional[List[Any]] = parameters
         self._depends_on: List["BoundMember"] = []
+        self.references: List["BoundMember"] = []
         self.on_activate: Callable[[PROVIDER_T], PROVIDER_T] = (
-            on_activate if on_activate else lambda x: x
+            on_activate if on_activate else default_on_activate
         )
+        self.fork_policy: ForkPolicy = fork_policy
 
     def bind_dependant(self, dependant: "BoundMember") -> None:
         """
@@ -78,6 +100,15 @@ class BoundMember:
         """
         self._depends_on.append(dependant)
 
+    def bind_reference(self, reference: "BoundMember") -> None:
+        """
+        Binds a member resolved by the implementation of this member.
+
+        Args:
+            reference (BoundMember): The referenced member.
+        """
+        self.references.append(reference)
+
     def __iter__(self) -> None:
         """
         Returns an iterator over the dependent members.
@@ -1,16 +1,36 @@
-from inspect import isclass
-from types import FunctionType, MethodType
-from typing import get_type_hints, Callable, Type, Union
+import inspect
+from typing import Any, Callable, List, Tuple, Type, Union, get_args
 
 from .bound_member import BoundMember
+from .import_path import ImportPath
+from .introspection_cache import IntrospectionCache
+from .fork_policy import ForkPolicy
 from .scope_enum import ScopeEnum
-from .adapters import ValueAsImplAdapter, FactoryAsImplAdapter
+from .adapters import (
+    AssistedFactoryAdapter,
+    CollectionAdapter,
+    KeyedInstanceAdapter,
+    PrefetchAdapter,
+    FactoryAsImplAdapter,
+    LazyValueAsImplAdapter,
+    MmapAsImplAdapter,
+    SharedMemoryAsImplAdapter,
+    ValueAsImplAdapter,
+)
 from .interface import (
     PROVIDER_T,
+    AssistedBinding,
     Binding,
+    CollectionBinding,
     FactoryBinding,
     ConstantBinding,
+    KeyedBinding,
+    PrefetchBinding,
+    LazyConstantBinding,
+    MmapBinding,
+    MultiBinding,
     ProviderBinding,
+    SharedMemoryBinding,
 )
 from .errors import PyIOC3Error
 
@@ -20,10 +40,20 @@ class BoundMemberFactory:
     BoundMemberFactory is a factory class for creating BoundMember instances based on
     different binding types.
 
+    Attributes:
+        introspection_cache (IntrospectionCache): The process-wide cache of
+            implementation signatures shared by every build.
+
     Methods:
-        build(binding: Binding) -> BoundMember:
+        build(binding: Binding, deferred: bool = False) -> BoundMember:
             Builds a BoundMember instance based on the provided binding.
 
+        introspect(member: BoundMember) -> Tuple[Any, List[Any]]:
+            Resolves the implementation and parameters of a deferred member.
+
+        references(implementation: Any) -> List[Any]:
+            Returns the annotations an implementation resolves from the container.
+
     Example:
         To use `BoundMemberFactory` to create a BoundMember instance:
 
@@ -47,26 +77,56 @@ class BoundMemberFactory:
         - `FactoryBinding`: Binding type for factories.
         - `ConstantBinding`: Binding type for constants.
         - `ProviderBinding`: Binding type for providers.
+        - `MmapBinding`: Binding type for memory-mapped files.
+        - `SharedMemoryBinding`: Binding type for constants in shared memory.
+        - `LazyConstantBinding`: Binding type for constants loaded on first use.
+        - `AssistedBinding`: Binding type for assisted factories.
+        - `CollectionBinding`: Binding type for the collections of multi-bindings.
+        - `KeyedBinding`: Binding type for instances cached per request key.
+        - `PrefetchBinding`: Binding type for transients created ahead of time.
         - `ScopeEnum`: Enumeration of different dependency scopes.
         - `adapters.ValueAsImplAdapter`: Adapter for value-based bindings.
         - `adapters.FactoryAsImplAdapter`: Adapter for factory-based bindings.
+        - `adapters.MmapAsImplAdapter`: Adapter for memory-mapped file bindings.
+        - `adapters.SharedMemoryAsImplAdapter`: Adapter for shared memory bindings.
+        - `adapters.LazyValueAsImplAdapter`: Adapter for lazy constant bindings.
+        - `adapters.AssistedFactoryAdapter`: Adapter for assisted factory bindings.
+        - `adapters.CollectionAdapter`: Adapter for collection bindings.
+        - `adapters.KeyedInstanceAdapter`: Adapter for keyed bindings.
+        - `adapters.PrefetchAdapter`: Adapter for prefetched bindings.
         - `errors.PyIOC3Error`: Error raised for PyIOC3-specific exceptions.
+        - `introspection_cache.IntrospectionCache`: Cache of evaluated signatures.
+        - `import_path.ImportPath`: Resolver for lazy import path implementations.
     """
 
+    introspection_cache = IntrospectionCache()
+
+    _MULTI_BINDING_UNSUPPORTED = (
+        "MultiBinding adds an element to a collection and is only supported by"
+        " StaticContainerBuilder. Override an element with a binding for"
+        " MultiElement(T, index), or the collection with a CollectionBinding."
+    )
+
     @staticmethod
-    def build(binding: Binding) -> BoundMember:
+    def build(binding: Binding, deferred: bool = False) -> BoundMember:
         """
         Builds a BoundMember instance based on the provided binding.
 
         Args:
             binding (Binding): The binding for which a BoundMember instance is
                 created.
+            deferred (bool): If True, the member is not introspected. Its parameters
+                are None until it is linked by the container.
 
         Returns:
-            BoundMember: A BoundMember instance representing the binding.
+            BoundMember: A BoundMember instance representing the binding. If the
+                implementation is an import path, the member is deferred: its
+                parameters are None until it is introspected.
 
         Raises:
-            PyIOC3Error: If the binding type is not recognized or supported.
+            PyIOC3Error: If the binding type is not recognized or supported, such
+                as a MultiBinding, or if an assisted name is not a parameter of
+                the implementation.
 
         Example:
             To create a BoundMember instance using the factory:
@@ -92,6 +152,8 @@ class BoundMemberFactory:
                 implementation=binding.implementation or binding.annotation,
                 scope=binding.scope or ScopeEnum.TRANSIENT,
                 on_activate=binding.on_activate,
+                deferred=deferred or isinstance(binding.implementation, str),
+                fork_policy=binding.fork_policy or ForkPolicy.SHARE,
             )
 
         elif isinstance(binding, ConstantBinding):
@@ -100,6 +162,7 @@ class BoundMemberFactory:
                 implementation=ValueAsImplAdapter(binding.value),
                 scope=ScopeEnum.SINGLETON,
                 on_activate=None,
+                deferred=deferred,
             )
 
         elif isinstance(binding, FactoryBinding):
@@ -108,7 +171,110 @@ class BoundMemberFactory:
                 implementation=FactoryAsImplAdapter(binding.factory),
                 scope=ScopeEnum.SINGLETON,
                 on_activate=None,
+                deferred=deferred,
+            )
+
+        elif isinstance(binding, LazyConstantBinding):
+            return BoundMemberFactory._build(
+                annotation=binding.annotation,
+                implementation=LazyValueAsImplAdapter(binding.loader),
+                scope=ScopeEnum.SINGLETON,
+                on_activate=None,
+                deferred=deferred,
+            )
+
+        elif isinstance(binding, AssistedBinding):
+            implementation = binding.implementation or get_args(binding.annotation)[0]
+            assisted = tuple(binding.assisted)
+            BoundMemberFactory._check_assisted(implementation, assisted)
+            return BoundMemberFactory._build(
+                annotation=binding.annotation,
+                implementation=AssistedFactoryAdapter(
+                    implementation,
+                    assisted,
+                    tuple(
+                        (name, annotation)
+                        for name, annotation in (
+                            BoundMemberFactory.introspection_cache.get_signature(
+                                implementation
+                            )
+                        )
+                        if name not in assisted
+                    ),
+                ),
+                scope=ScopeEnum.SINGLETON,
+                on_activate=None,
+                deferred=deferred,
             )
+
+        elif isinstance(binding, KeyedBinding):
+            implementation = binding.implementation or binding.annotation
+            return BoundMemberFactory._build(
+                annotation=binding.annotation,
+                implementation=KeyedInstanceAdapter(
+                    implementation,
+                    binding.key,
+                    tuple(
+                        (name, annotation)
+                        for name, annotation in (
+                            BoundMemberFactory.introspection_cache.get_signature(
+                                implementation
+                            )
+                        )
+                        if name != binding.key
+                    ),
+                    binding.maxsize,
+                    binding.on_evict,
+                ),
+                scope=ScopeEnum.TRANSIENT,
+                on_activate=None,
+                deferred=deferred,
+            )
+
+        elif isinstance(binding, PrefetchBinding):
+            implementation = binding.implementation or binding.annotation
+            return BoundMemberFactory._build(
+                annotation=binding.annotation,
+                implementation=PrefetchAdapter(
+                    implementation,
+                    BoundMemberFactory.introspection_cache.get_signature(
+                        implementation
+                    ),
+                    binding.size,
+                ),
+                scope=ScopeEnum.TRANSIENT,
+                on_activate=binding.on_activate,
+                deferred=deferred,
+            )
+
+        elif isinstance(binding, CollectionBinding):
+            return BoundMemberFactory._build(
+                annotation=binding.annotation,
+                implementation=CollectionAdapter(binding.collection, binding.elements),
+                scope=ScopeEnum.TRANSIENT,
+                on_activate=None,
+                deferred=deferred,
+            )
+
+        elif isinstance(binding, MmapBinding):
+            return BoundMemberFactory._build(
+                annotation=binding.annotation,
+                implementation=MmapAsImplAdapter(binding.path, binding.loader),
+                scope=ScopeEnum.SINGLETON,
+                on_activate=None,
+                deferred=deferred,
+            )
+
+        elif isinstance(binding, SharedMemoryBinding):
+            return BoundMemberFactory._build(
+                annotation=binding.annotation,
+                implementation=SharedMemoryAsImplAdapter(binding.value, binding.loader),
+                scope=ScopeEnum.SINGLETON,
+                on_activate=None,
+                deferred=deferred,
+            )
+        elif isinstance(binding, MultiBinding):
+            raise PyIOC3Error(BoundMemberFactory._MULTI_BINDING_UNSUPPORTED)
         else:
             raise PyIOC3Error("Unable to create bound member.")
 
@@ -118,22 +284,86 @@ class BoundMemberFactory:
         implementation: Type[PROVIDER_T],
         scope: Union[str, ScopeEnum],
         on_activate: Callable[[PROVIDER_T], PROVIDER_T] = None,
+        deferred: bool = False,
+        fork_policy: Union[str, ForkPolicy] = ForkPolicy.SHARE,
     ) -> BoundMember:
-        if isclass(implementation):
-            params = get_type_hints(implementation.__init__)
-        elif type(implementation) is FunctionType:
-            params = get_type_hints(implementation)
-        elif type(implementation) is MethodType:
-            params = get_type_hints(implementation)
-        elif hasattr(implementation, "__call__"):
-            params = get_type_hints(implementation.__call__)
-        else:
-            params = get_type_hints(implementation)
-
         return BoundMember(
             annotation=annotation,
             implementation=implementation,
             scope=ScopeEnum.from_string(scope) if isinstance(scope, str) else scope,
-            parameters=[p for k, p in params.items() if k != "return"],
+            parameters=(
+                None if deferred else BoundMemberFactory._parameters(implementation)
+            ),
             on_activate=on_activate,
+            fork_policy=(
+                ForkPolicy.from_string(fork_policy)
+                if isinstance(fork_policy, str)
+                else fork_policy
+            ),
         )
+
+    @staticmethod
+    def introspect(member: BoundMember) -> Tuple[Any, List[Any]]:
+        """
+        Resolves the implementation and parameters of a deferred member.
+
+        If the implementation is an import path, its module is imported. The member
+        itself is not modified so a failed resolution leaves it deferred.
+
+        Args:
+            member (BoundMember): A member whose parameters are None.
+
+        Returns:
+            Tuple[Any, List[Any]]: The implementation and its parameter annotations.
+
+        Raises:
+            LazyBindingError: If the import path cannot be resolved.
+        """
+        implementation = member.implementation
+        if isinstance(implementation, str):
+            implementation = ImportPath.resolve(implementation)
+        return implementation, BoundMemberFactory._parameters(implementation)
+
+    @staticmethod
+    def references(implementation: Any) -> List[Any]:
+        """
+        Returns the annotations an implementation resolves from the container.
+
+        Assisted factories, keyed and prefetched bindings resolve the injected
+        parameters of the implementation they wrap when they are called. The
+        container links these annotations as references so a missing binding or a
+        cycle fails the build.
+
+        Args:
+            implementation (Any): The implementation of a linked member.
+
+        Returns:
+            List[Any]: The referenced annotations, empty for other implementations.
+        """
+        if isinstance(
+            implementation,
+            (AssistedFactoryAdapter, KeyedInstanceAdapter, PrefetchAdapter),
+        ):
+            return [annotation for _, annotation in implementation._injected]
+        return []
+
+    @staticmethod
+    def _check_assisted(implementation: Any, assisted: Tuple[str, ...]) -> None:
+        try:
+            names = inspect.signature(implementation).parameters
+        except (TypeError, ValueError):
+            # Signatures of some builtins cannot be inspected, trust the caller.
+            return
+        for name in assisted:
+            if name not in names:
+                raise PyIOC3Error(
+                    f"Assisted argument '{name}' is not a parameter of"
+                    f" {implementation!r}."
+                )
+
+    @staticmethod
+    def _parameters(implementation: Any) -> List[Any]:
+        # Collections depend on their elements rather than on their signature.
+        if isinstance(implementation, CollectionAdapter):
+            return list(implementation.elements)
+        return BoundMemberFactory.introspection_cache.get_parameters(implementation)
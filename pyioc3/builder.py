@@ -1,20 +1,31 @@
 from __future__ import annotations
 
+from collections import ChainMap
 from typing import (
+    Any,
     Callable,
+    Dict,
+    FrozenSet,
     Generic,
     List,
     Optional,
+    Set,
     Type,
     Union,
 )
 
+from .bound_member import BoundMember
+from .bound_member_factory import BoundMemberFactory
+from .graph_patcher import GraphPatcher
 from .scope_enum import ScopeEnum
+from .static_container import StaticContainer
 from .static_container_builder import StaticContainerBuilder
 from .interface import (
     Binding,
+    ConstantBinding,
     Container,
     FACTORY_T,
+    FactoryBinding,
     PROVIDER_T,
     ProviderBinding,
     TARGET_T,
@@ -140,3 +151,161 @@ class BuilderBase(Generic[TARGET_T]):
             TARGET_T: The built instance.
         """
         return self._container_builder.build().get(self._target_t)
+
+    def compile(self) -> BuilderTemplate[TARGET_T]:
+        """
+        Freeze the registered dependencies into a reusable template.
+
+        The dependency graph is computed, linked and checked for cycles once, lazy
+        bindings included. Each call to `BuilderTemplate.build()` then only replaces
+        the members affected by its overrides. Later changes to this builder do not
+        affect the template.
+
+        Returns:
+            BuilderTemplate: The compiled template.
+        """
+        container = self._container_builder.build()
+        container.validate()
+        return BuilderTemplate(self._target_t, container._bound_members)
+
+
+class BuilderTemplate(Generic[TARGET_T]):
+    """A compiled BuilderBase that builds instances without recomputing the graph.
+
+    Templates are created with `BuilderBase.compile()`. Each build gets a fresh
+    container, so SINGLETON members are not shared between builds, but the
+    introspection, linking and cycle checks are done once at compile time. Overrides
+    passed to build() only replan the overridden members and their dependents.
+
+    Example Usage:
+
+        template = DuckBuilder().using_provider(QuackBehavior, Squeak).compile()
+
+        for message in messages:
+            duck = template.build([ConstantBinding(message.name, DuckName)])
+    """
+
+    def __init__(
+        self,
+        target_t: Type[TARGET_T],
+        bound_members: Dict[Any, BoundMember],
+    ):
+        """Initialize the template from a linked graph.
+
+        Arguments:
+            target_t: The type produced by this template.
+            bound_members: A linked and cycle-free graph of bound members.
+        """
+        self._target_t = target_t
+        self._bound_members = bound_members
+        self._dependents = GraphPatcher.dependents(bound_members)
+        self._affected: Dict[FrozenSet[Any], Set[Any]] = {}
+
+    def _affected_by(self, annotations: FrozenSet[Any]) -> Set[Any]:
+        try:
+            return self._affected[annotations]
+        except KeyError:
+            affected = GraphPatcher.affected(self._dependents, annotations)
+            self._affected[annotations] = affected
+            return affected
+
+    def _patch(self, replacements: Dict[Any, BoundMember]) -> Dict[Any, BoundMember]:
+        return GraphPatcher.patch(
+            self._bound_members,
+            replacements,
+            self._affected_by(frozenset(replacements)),
+        )
+
+    def _derive(self, binding: Binding) -> BuilderTemplate[TARGET_T]:
+        bound_members = dict(self._bound_members)
+        bound_members.update(
+            self._patch({binding.annotation: BoundMemberFactory.build(binding)})
+        )
+        return BuilderTemplate(self._target_t, bound_members)
+
+    def using_provider(
+        self,
+        annotation: Type[PROVIDER_T],
+        implementation: Optional[Type[PROVIDER_T]] = None,
+        scope: Optional[Union[str, ScopeEnum]] = None,
+        on_activate: Optional[Callable[[PROVIDER_T], PROVIDER_T]] = None,
+    ) -> BuilderTemplate[TARGET_T]:
+        """
+        Derive a template with a different provider.
+
+        Arguments:
+            annotation: The annotion target.
+            implementation: The optional implementation class. If not provided,
+                            The annotation is used as the implementation.
+            scope: The optional scope of the provider. Defaults to Transient.
+            on_activate: An optional activation callback.
+
+        Returns:
+            BuilderTemplate: A new template. This template is not modified.
+        """
+        return self._derive(
+            ProviderBinding(
+                annotation=annotation,
+                implementation=implementation,
+                scope=scope,
+                on_activate=on_activate,
+            )
+        )
+
+    def using_constant(
+        self,
+        annotation: Type[PROVIDER_T],
+        value: PROVIDER_T,
+    ) -> BuilderTemplate[TARGET_T]:
+        """
+        Derive a template with a different constant.
+
+        Arguments:
+            annotation: The annotion target.
+            value: The constant value.
+
+        Returns:
+            BuilderTemplate: A new template. This template is not modified.
+        """
+        return self._derive(ConstantBinding(annotation=annotation, value=value))
+
+    def using_factory(
+        self,
+        annotation: FACTORY_T,
+        factory: Callable[[Container], FACTORY_T],
+    ) -> BuilderTemplate[TARGET_T]:
+        """
+        Derive a template with a different factory function.
+
+        Arguments:
+            annotation: The annotion target.
+            factory: The factory function.
+
+        Returns:
+            BuilderTemplate: A new template. This template is not modified.
+        """
+        return self._derive(FactoryBinding(annotation=annotation, factory=factory))
+
+    def build(self, overrides: Optional[List[Binding]] = None) -> TARGET_T:
+        """
+        Build an instance of the target type.
+
+        Arguments:
+            overrides: Optional bindings that replace the compiled ones for this
+                       build only. Only the overridden members and the members
+                       that depend on them are replanned.
+
+        Returns:
+            TARGET_T: The built instance.
+        """
+        replacements = {
+            binding.annotation: BoundMemberFactory.build(binding)
+            for binding in overrides or []
+        }
+        patched = {}
+        container = StaticContainer(ChainMap(patched, self._bound_members))
+        replacements.update(StaticContainerBuilder._container_members(container))
+        patched.update(self._patch(replacements))
+        # The template is validated and the patch checks the replanned members.
+        container._complete = all(m.parameters is not None for m in patched.values())
+        return container.get(self._target_t)
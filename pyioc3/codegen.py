@@ -0,0 +1,228 @@
+import ast
+from typing import Any, Dict, List
+
+from .adapters import (
+    AssistedFactoryAdapter,
+    CollectionAdapter,
+    FactoryAsImplAdapter,
+    KeyedInstanceAdapter,
+    LazyValueAsImplAdapter,
+    PrefetchAdapter,
+    ResourceAdapter,
+    ValueAsImplAdapter,
+)
+from .bound_member import default_on_activate
+from .errors import CodegenError
+from .fork_policy import ForkPolicy
+from .import_path import ImportPath
+from .interface import ContainerBuilder, MultiElement
+from .keyed_annotation import KeyedAnnotation
+from .static_container import StaticContainer
+
+HEADER = '''"""Generated by `python -m pyioc3 compile`{source}. Do not edit.
+
+Import `container` to resolve dependencies without introspection, or call `build()`
+for a container with its own singletons.
+"""
+
+'''
+
+
+class ContainerCompiler:
+    """
+    ContainerCompiler exports a container as the source of a Python module.
+
+    The generated module imports every implementation directly and defines one
+    builder function per binding, wired to the builders of its dependencies. Its
+    `container` is a CompiledContainer with the same `get` interface as the
+    original, so importing it skips introspection, linking, cycle detection and
+    autowire scanning.
+
+    Implementations, factories, activation callbacks and class annotations must be
+    importable by their module and qualified name. Constants must be literals or
+    importable objects. String annotations are supported as is. Fork policies and
+    memory-mapped files are not supported, every singleton of a compiled container
+    is shared with forked processes. Multi-bindings, keyed bindings, whose
+    annotation is `typing.Annotated`, assisted factories, keyed request bindings,
+    prefetched bindings and lazy constants are not supported either.
+
+    Methods:
+        load(target) -> StaticContainer:
+            Builds the container named by an import path.
+
+        compile(container, target) -> str:
+            Returns the source of a module that recreates the container.
+
+    Example:
+        ```python
+        from pyioc3.codegen import ContainerCompiler
+
+        container = ContainerCompiler.load("myapp.container:builder")
+        with open("myapp/_wired.py", "w") as fh:
+            fh.write(ContainerCompiler.compile(container))
+        ```
+    """
+
+    @staticmethod
+    def load(target: str) -> StaticContainer:
+        """
+        Builds the container named by an import path.
+
+        Args:
+            target (str): The import path of a StaticContainer, a ContainerBuilder,
+                or a callable returning either.
+
+        Returns:
+            StaticContainer: The container.
+
+        Raises:
+            CodegenError: If the target is not a container or container builder.
+            LazyBindingError: If the target cannot be imported.
+        """
+        obj = ImportPath.resolve(target)
+        if not isinstance(obj, (ContainerBuilder, StaticContainer)) and callable(obj):
+            obj = obj()
+        if isinstance(obj, ContainerBuilder):
+            obj = obj.build()
+        if not isinstance(obj, StaticContainer):
+            raise CodegenError(f"'{target}' is not a container or container builder.")
+        return obj
+
+    @staticmethod
+    def compile(container: StaticContainer, target: str = "") -> str:
+        """
+        Returns the source of a module that recreates the container.
+
+        The container is validated first, so lazy bindings are imported.
+
+        Args:
+            container (StaticContainer): The container to export.
+            target (str): The import path the container was loaded from. Only used
+                in the header of the generated module.
+
+        Returns:
+            str: The module source.
+
+        Raises:
+            CodegenError: If a binding cannot be referenced by generated code,
+                has a fork policy other than SHARE, maps a file, is a multi-binding,
+                is keyed by `typing.Annotated`, is an assisted factory, a keyed
+                request binding, a prefetched binding or a lazy constant.
+        """
+        container.validate()
+        return _ModuleWriter(container).write(target)
+
+
+class _ModuleWriter:
+    def __init__(self, container: StaticContainer):
+        self._container = container
+        self._imports: List[str] = []
+        self._names: Dict[str, str] = {}
+
+    def write(self, target: str) -> str:
+        members = list(self._container._bound_members.items())
+        indexes = {id(member): i for i, (_, member) in enumerate(members)}
+
+        builders = []
+        annotations = []
+        scopes = []
+        for i, (annotation, member) in enumerate(members):
+            if member.fork_policy != ForkPolicy.SHARE:
+                raise CodegenError(
+                    f"The fork policy of {annotation!r} is not supported by"
+                    " compiled containers."
+                )
+            args = ", ".join(f"r.resolve({indexes[id(dep)]})" for dep in member)
+            expr = self._instance(member.implementation, args)
+            if member.on_activate is not default_on_activate:
+                expr = f"{self._reference(member.on_activate)}({expr})"
+            builders.append(f"def _b{i}(r):\n    return {expr}\n")
+            annotations.append(f"    {self._key(annotation)}: {i},\n")
+            scopes.append(f"    ScopeEnum.{member.scope.name},\n")
+
+        return "".join(
+            [
+                HEADER.format(source=f" from {target}" if target else ""),
+                "from pyioc3.compiled_container import CompiledContainer\n",
+                "from pyioc3.scope_enum import ScopeEnum\n",
+                "\n",
+                *self._imports,
+                "\n\n",
+                "\n\n".join(builders),
+                "\n\nANNOTATIONS = {\n",
+                *annotations,
+                "}\n\nBUILDERS = (\n",
+                *[f"    _b{i},\n" for i in range(len(members))],
+                ")\n\nSCOPES = (\n",
+                *scopes,
+                ")\n\n\n",
+                "def build() -> CompiledContainer:\n",
+                "    return CompiledContainer(ANNOTATIONS, BUILDERS, SCOPES)\n",
+                "\n\n",
+                "container = build()\n",
+            ]
+        )
+
+    def _instance(self, implementation: Any, args: str) -> str:
+        if isinstance(implementation, ValueAsImplAdapter):
+            value = implementation._value
+            if value is self._container:
+                return "r.container"
+            return self._value(value)
+        elif isinstance(implementation, FactoryAsImplAdapter):
+            return f"{self._reference(implementation._fn)}({args})"
+        elif isinstance(implementation, AssistedFactoryAdapter):
+            raise CodegenError(
+                "Assisted factory bindings are not supported by codegen."
+            )
+        elif isinstance(implementation, CollectionAdapter):
+            raise CodegenError("Multi-bindings are not supported by codegen.")
+        elif isinstance(implementation, KeyedInstanceAdapter):
+            raise CodegenError("Keyed request bindings are not supported by codegen.")
+        elif isinstance(implementation, PrefetchAdapter):
+            raise CodegenError("Prefetched bindings are not supported by codegen.")
+        elif isinstance(implementation, LazyValueAsImplAdapter):
+            raise CodegenError("Lazy constant bindings are not supported by codegen.")
+        elif isinstance(implementation, ResourceAdapter):
+            raise CodegenError(
+                f"{implementation!r} holds resources that compiled containers"
+                " cannot release."
+            )
+        else:
+            return f"{self._reference(implementation)}({args})"
+
+    def _key(self, annotation: Any) -> str:
+        if isinstance(annotation, str):
+            return repr(annotation)
+        elif isinstance(annotation, MultiElement):
+            raise CodegenError("Multi-bindings are not supported by codegen.")
+        elif KeyedAnnotation.split(annotation)[1]:
+            raise CodegenError(
+                "Keyed bindings (typing.Annotated) are not supported by codegen."
+            )
+        return self._reference(annotation)
+
+    def _value(self, value: Any) -> str:
+        source = repr(value)
+        try:
+            literal = ast.literal_eval(source)
+        except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+            return self._reference(value)
+        if type(literal) is not type(value) or literal != value:
+            return self._reference(value)
+        return source
+
+    def _reference(self, obj: Any) -> str:
+        path = ImportPath.of(obj)
+        if path is None:
+            raise CodegenError(f"{obj!r} cannot be imported by generated code.")
+
+        if path not in self._names:
+            name = f"_r{len(self._names)}"
+            module, _, qualname = path.partition(":")
+            top, _, rest = qualname.partition(".")
+            self._imports.append(f"from {module} import {top} as {name}\n")
+            if rest:
+                self._imports.append(f"{name} = {name}.{rest}\n")
+            self._names[path] = name
+        return self._names[path]
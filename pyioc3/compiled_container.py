@@ -0,0 +1,135 @@
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional, Sequence, Type
+
+from .errors import _MemberNotBoundErrorAsKeyError
+from .interface import Container, PROVIDER_T
+from .scope_enum import ScopeEnum
+
+# The request of the outermost get() running in the current context.
+_active_request: ContextVar[Optional["CompiledRequest"]] = ContextVar(
+    "pyioc3_compiled_request", default=None
+)
+
+
+class CompiledContainer(Container):
+    """
+    CompiledContainer is the Container used by modules generated with
+    `python -m pyioc3 compile`.
+
+    The generated module provides one builder function per member, already wired
+    to the builders of its dependencies, so nothing is introspected, linked or
+    checked at runtime. Members are identified by their index in the generated
+    tables. A `get` called while another `get` is creating instances on the same
+    thread or task shares its REQUESTED instances.
+
+    Args:
+        annotations (Dict[Any, int]): The index of the member bound to each
+            annotation.
+        builders (Sequence[Callable[[CompiledRequest], Any]]): The function that
+            creates the instance of each member.
+        scopes (Sequence[ScopeEnum]): The scope of each member.
+
+    Methods:
+        get(annotation: Type[PROVIDER_T]) -> PROVIDER_T:
+            Retrieves an instance of the specified annotation from the container.
+
+    Example:
+        ```python
+        from myapp._wired import container
+
+        service = container.get(MyService)
+        ```
+
+    See Also:
+        - `codegen.ContainerCompiler`: Generates the modules that use this class.
+    """
+
+    def __init__(
+        self,
+        annotations: Dict[Any, int],
+        builders: Sequence[Callable[["CompiledRequest"], Any]],
+        scopes: Sequence[ScopeEnum],
+    ):
+        self._annotations = annotations
+        self._builders = builders
+        self._scopes = scopes
+        self._singletons: Dict[int, Any] = {}
+
+    def get(self, annotation: Type[PROVIDER_T]) -> PROVIDER_T:
+        """
+        Retrieve an instance of the specified annotation from the container.
+
+        Args:
+            annotation (Type[PROVIDER_T]): The annotation (provider) for which an
+                instance is requested.
+
+        Returns:
+            PROVIDER_T: An instance of the specified annotation.
+
+        Raises:
+            MemberNotBoundError: If the requested annotation is not bound in the
+                container.
+        """
+        try:
+            index = self._annotations[annotation]
+        except KeyError:
+            raise _MemberNotBoundErrorAsKeyError(f"{annotation} is not bound.")
+
+        request = _active_request.get()
+        if request is not None and request.container is self and request.open:
+            return request.resolve(index)
+
+        request = CompiledRequest(self)
+        token = _active_request.set(request)
+        try:
+            return request.resolve(index)
+        finally:
+            request.open = False
+            _active_request.reset(token)
+
+
+class CompiledRequest:
+    """
+    CompiledRequest holds the requested scope of a single `CompiledContainer.get`.
+
+    Args:
+        container (CompiledContainer): The container being resolved.
+
+    Attributes:
+        container (CompiledContainer): The container being resolved. Generated
+            builders pass it to factories and inject it as the Container.
+        open (bool): True while the `get` that created the request is running.
+
+    Methods:
+        resolve(index: int) -> Any:
+            Returns the instance of a member according to its scope.
+    """
+
+    def __init__(self, container: CompiledContainer):
+        self.container = container
+        self.open = True
+        self._requested: Dict[int, Any] = {}
+
+    def resolve(self, index: int) -> Any:
+        """
+        Returns the instance of a member according to its scope.
+
+        Args:
+            index (int): The index of the member in the generated tables.
+
+        Returns:
+            Any: A new, requested or singleton instance of the member.
+        """
+        container = self.container
+        scope = container._scopes[index]
+        if scope == ScopeEnum.TRANSIENT:
+            return container._builders[index](self)
+        cache = (
+            container._singletons if scope == ScopeEnum.SINGLETON else self._requested
+        )
+        try:
+            return cache[index]
+        except KeyError:
+            instance = container._builders[index](self)
+            cache[index] = instance
+            return instance
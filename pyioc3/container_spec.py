@@ -0,0 +1,274 @@
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from .adapters import (
+    AssistedFactoryAdapter,
+    CollectionAdapter,
+    KeyedInstanceAdapter,
+    PrefetchAdapter,
+    FactoryAsImplAdapter,
+    LazyValueAsImplAdapter,
+    MmapAsImplAdapter,
+    SharedMemoryAsImplAdapter,
+    ValueAsImplAdapter,
+)
+from .bound_member import BoundMember, default_on_activate
+from .errors import ContainerSpecError
+from .fork_policy import ForkPolicy
+from .import_path import ImportPath
+from .scope_enum import ScopeEnum
+from .static_container import StaticContainer
+
+PROVIDER = "provider"
+CONSTANT = "constant"
+FACTORY = "factory"
+CONTAINER = "container"
+MMAP = "mmap"
+SHARED_MEMORY = "shared_memory"
+LAZY_CONSTANT = "lazy_constant"
+ASSISTED = "assisted"
+COLLECTION = "collection"
+KEYED = "keyed"
+PREFETCH = "prefetch"
+
+
+class MemberSpec(NamedTuple):
+    """The picklable description of one linked member of a container."""
+
+    annotation: Any
+    kind: str
+    target: Any
+    scope: ScopeEnum
+    parameters: Tuple[Any, ...]
+    dependencies: Tuple[int, ...]
+    on_activate: Optional[str] = None
+    fork_policy: ForkPolicy = ForkPolicy.SHARE
+    references: Tuple[int, ...] = ()
+
+
+class ContainerSpec(NamedTuple):
+    """
+    ContainerSpec is a picklable description of a validated container.
+
+    Providers, factories, activation callbacks, the loaders of lazy constants, the
+    implementations of assisted, keyed and prefetched bindings and the eviction
+    callbacks of keyed bindings are referenced by import path, and constants are
+    kept by value. Memory-mapped files are kept by path and mapped again by each
+    built container. Constants in shared memory are kept by block name, and
+    containers built from the spec attach to the block. Every member carries its
+    introspected parameters and the indexes of the members it depends on and
+    references, so `build` neither introspects, links by annotation, nor checks
+    for cycles.
+    Sending a spec to process pool workers lets each of them rebuild the
+    container in microseconds instead of running autowire and `build()` again.
+
+    Attributes:
+        members (Tuple[MemberSpec, ...]): The members of the container.
+
+    Methods:
+        from_container(container) -> ContainerSpec:
+            Exports a container.
+
+        build() -> StaticContainer:
+            Creates a new container from the spec.
+
+    Example:
+        ```python
+        from concurrent.futures import ProcessPoolExecutor
+        from pyioc3.container_spec import ContainerSpec
+
+        def init_worker(spec):
+            global container
+            container = spec.build()
+
+        spec = ContainerSpec.from_container(builder.build())
+        pool = ProcessPoolExecutor(initializer=init_worker, initargs=(spec,))
+        ```
+    """
+
+    members: Tuple[MemberSpec, ...]
+
+    @staticmethod
+    def from_container(container: StaticContainer) -> "ContainerSpec":
+        """
+        Exports a container.
+
+        The container is validated first, so lazy bindings are imported. Singleton
+        instances are not part of the spec.
+
+        Args:
+            container (StaticContainer): The container to export.
+
+        Returns:
+            ContainerSpec: The spec of the container.
+
+        Raises:
+            ContainerSpecError: If a provider, factory or activation callback cannot
+                be referenced by import path.
+        """
+        container.validate()
+        members = list(container._bound_members.values())
+        indexes = {id(member): i for i, member in enumerate(members)}
+        return ContainerSpec(
+            tuple(
+                ContainerSpec._export(member, container, indexes) for member in members
+            )
+        )
+
+    @staticmethod
+    def _export(
+        member: BoundMember, container: StaticContainer, indexes: Dict[int, int]
+    ) -> MemberSpec:
+        implementation = member.implementation
+        if isinstance(implementation, ValueAsImplAdapter):
+            if implementation._value is container:
+                kind, target = CONTAINER, None
+            else:
+                kind, target = CONSTANT, implementation._value
+        elif isinstance(implementation, FactoryAsImplAdapter):
+            kind, target = FACTORY, ContainerSpec._path(implementation._fn)
+        elif isinstance(implementation, AssistedFactoryAdapter):
+            kind, target = ASSISTED, (
+                ContainerSpec._path(implementation._implementation),
+                implementation._assisted,
+                implementation._injected,
+            )
+        elif isinstance(implementation, KeyedInstanceAdapter):
+            kind, target = KEYED, (
+                ContainerSpec._path(implementation._implementation),
+                implementation._key,
+                implementation._injected,
+                implementation._maxsize,
+                ContainerSpec._optional_path(implementation._on_evict),
+            )
+        elif isinstance(implementation, PrefetchAdapter):
+            kind, target = PREFETCH, (
+                ContainerSpec._path(implementation._implementation),
+                implementation._injected,
+                implementation._size,
+            )
+        elif isinstance(implementation, CollectionAdapter):
+            kind, target = COLLECTION, implementation._collection
+        elif isinstance(implementation, LazyValueAsImplAdapter):
+            kind, target = LAZY_CONSTANT, ContainerSpec._path(implementation._loader)
+        elif isinstance(implementation, MmapAsImplAdapter):
+            kind, target = MMAP, (
+                implementation._path,
+                ContainerSpec._optional_path(implementation._loader),
+            )
+        elif isinstance(implementation, SharedMemoryAsImplAdapter):
+            # The block is created here, if needed, so workers attach to it.
+            kind, target = SHARED_MEMORY, (
+                *implementation.share(),
+                ContainerSpec._optional_path(implementation._loader),
+            )
+        else:
+            kind, target = PROVIDER, ContainerSpec._path(implementation)
+
+        return MemberSpec(
+            annotation=member.annotation,
+            kind=kind,
+            target=target,
+            scope=member.scope,
+            parameters=tuple(member.parameters),
+            dependencies=tuple(indexes[id(dep)] for dep in member),
+            on_activate=(
+                None
+                if member.on_activate is default_on_activate
+                else ContainerSpec._path(member.on_activate)
+            ),
+            fork_policy=member.fork_policy,
+            references=tuple(indexes[id(ref)] for ref in member.references),
+        )
+
+    @staticmethod
+    def _path(obj: Any) -> str:
+        path = ImportPath.of(obj)
+        if path is None:
+            raise ContainerSpecError(f"{obj!r} cannot be referenced by import path.")
+        return path
+
+    @staticmethod
+    def _optional_path(obj: Any) -> Optional[str]:
+        return None if obj is None else ContainerSpec._path(obj)
+
+    @staticmethod
+    def _resolve(path: Optional[str]) -> Any:
+        return None if path is None else ImportPath.resolve(path)
+
+    def build(self) -> StaticContainer:
+        """
+        Creates a new container from the spec.
+
+        Returns:
+            StaticContainer: A validated container with no singleton instances.
+
+        Raises:
+            LazyBindingError: If an import path cannot be resolved.
+        """
+        bound_members = {}
+        container = StaticContainer(bound_members)
+        members = []
+        for spec in self.members:
+            if spec.kind == PROVIDER:
+                implementation = ImportPath.resolve(spec.target)
+            elif spec.kind == FACTORY:
+                implementation = FactoryAsImplAdapter(ImportPath.resolve(spec.target))
+            elif spec.kind == ASSISTED:
+                path, assisted, injected = spec.target
+                implementation = AssistedFactoryAdapter(
+                    ImportPath.resolve(path), assisted, injected
+                )
+            elif spec.kind == KEYED:
+                path, key, injected, maxsize, on_evict = spec.target
+                implementation = KeyedInstanceAdapter(
+                    ImportPath.resolve(path),
+                    key,
+                    injected,
+                    maxsize,
+                    ContainerSpec._resolve(on_evict),
+                )
+            elif spec.kind == PREFETCH:
+                path, injected, size = spec.target
+                implementation = PrefetchAdapter(
+                    ImportPath.resolve(path), injected, size
+                )
+            elif spec.kind == COLLECTION:
+                implementation = CollectionAdapter(spec.target, spec.parameters)
+            elif spec.kind == LAZY_CONSTANT:
+                implementation = LazyValueAsImplAdapter(ImportPath.resolve(spec.target))
+            elif spec.kind == MMAP:
+                path, loader = spec.target
+                implementation = MmapAsImplAdapter(path, ContainerSpec._resolve(loader))
+            elif spec.kind == SHARED_MEMORY:
+                name, size, loader = spec.target
+                implementation = SharedMemoryAsImplAdapter.attach(
+                    name, size, ContainerSpec._resolve(loader)
+                )
+            elif spec.kind == CONSTANT:
+                implementation = ValueAsImplAdapter(spec.target)
+            else:
+                implementation = ValueAsImplAdapter(container)
+            members.append(
+                BoundMember(
+                    annotation=spec.annotation,
+                    implementation=implementation,
+                    scope=spec.scope,
+                    parameters=list(spec.parameters),
+                    on_activate=(
+                        ImportPath.resolve(spec.on_activate)
+                        if spec.on_activate is not None
+                        else None
+                    ),
+                    fork_policy=spec.fork_policy,
+                )
+            )
+
+        for member, spec in zip(members, self.members):
+            for index in spec.dependencies:
+                member.bind_dependant(members[index])
+            for index in spec.references:
+                member.bind_reference(members[index])
+            bound_members[spec.annotation] = member
+
+        container._complete = True
+        return container
@@ -16,8 +16,39 @@ class ScopeError(PyIOC3Error):
     pass
 
 
+class ForkPolicyError(PyIOC3Error):
+    """Raised if a string-based fork policy is not valid."""
+
+    pass
+
+
 class AutoWireError(PyIOC3Error):
-    """Raised if the autowire api detects duplicate annotations."""
+    """Raised if the autowire api cannot discover bindings or detects duplicates."""
+
+    pass
+
+
+class LazyBindingError(PyIOC3Error):
+    """Raised if the import path of a lazy binding cannot be imported."""
+
+    pass
+
+
+class CodegenError(PyIOC3Error):
+    """Raised if a container cannot be exported as generated source."""
+
+    pass
+
+
+class ContainerSpecError(PyIOC3Error):
+    """Raised if a container cannot be exported as a picklable spec."""
+
+    pass
+
+
+class InjectionError(PyIOC3Error):
+    """Raised if a function decorated by an Injector is called before a container
+    is bound to it."""
 
     pass
 
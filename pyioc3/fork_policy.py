@@ -0,0 +1,68 @@
+from enum import Enum
+from .errors import ForkPolicyError
+
+
+class ForkPolicy(Enum):
+    """
+    ForkPolicy is an enumeration class representing what happens to a singleton
+    when the process that created it forks.
+
+    Attributes:
+        SHARE (ForkPolicy): The child process keeps using the instance inherited
+            from the parent. Its memory stays shared copy-on-write.
+        REINITIALIZE (ForkPolicy): The instance is created again in the child
+            process right after the fork.
+        LAZY (ForkPolicy): The inherited instance is discarded in the child process
+            and created again on the first `get` that needs it.
+
+    Methods:
+        from_string(val: str) -> "ForkPolicy":
+            Converts a string representation of a fork policy to a ForkPolicy value.
+
+    Example:
+        To bind a singleton that must not be inherited by forked workers:
+
+        ```python
+        from pyioc3.fork_policy import ForkPolicy
+
+        builder.bind(Pool, scope="singleton", fork_policy=ForkPolicy.REINITIALIZE)
+        builder.bind(Client, scope="singleton", fork_policy="lazy")
+        ```
+
+    See Also:
+        - `errors.ForkPolicyError`: Error raised when an unknown fork policy string
+          is provided to the `from_string` method.
+
+    """
+
+    SHARE = 1
+    REINITIALIZE = 2
+    LAZY = 3
+
+    @staticmethod
+    def from_string(val: str) -> "ForkPolicy":
+        """
+        Converts a string representation of a fork policy to a ForkPolicy value.
+
+        Args:
+            val (str): A string representing a fork policy, such as "share,"
+                "reinitialize," or "lazy."
+
+        Returns:
+            ForkPolicy: The corresponding ForkPolicy value.
+
+        Raises:
+            ForkPolicyError: If the provided string does not match any known policy.
+        """
+        try:
+            return {
+                "SHARE": ForkPolicy.SHARE,
+                "REINITIALIZE": ForkPolicy.REINITIALIZE,
+                "LAZY": ForkPolicy.LAZY,
+                "share": ForkPolicy.SHARE,
+                "reinitialize": ForkPolicy.REINITIALIZE,
+                "lazy": ForkPolicy.LAZY,
+            }[val]
+
+        except KeyError as ex:
+            raise ForkPolicyError(f'Unknown fork policy "{val}"') from ex
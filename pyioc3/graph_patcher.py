@@ -0,0 +1,181 @@
+from collections import deque
+from typing import Any, Dict, Iterable, Mapping, Set
+
+from .bound_member import BoundMember
+from .bound_member_factory import BoundMemberFactory
+from .errors import (
+    CircularDependencyError,
+    PyIOC3Error,
+    _MemberNotBoundErrorAsKeyError,
+)
+from .keyed_annotation import KeyedAnnotation
+from .keyed_scope_test import KeyedScopeTest
+from .queued_cycle_test import QueuedCycleTest
+
+
+class GraphPatcher:
+    """
+    GraphPatcher replaces members of a linked dependency graph without relinking it.
+
+    Replacing a member invalidates the member itself and every member that depends
+    on it, directly or transitively. Everything else can be shared with the original
+    graph. GraphPatcher computes that affected subgraph from a reverse dependency
+    index and produces new, linked members for it only.
+
+    Methods:
+        dependents(bound_members) -> Dict[Any, Set[Any]]:
+            Builds the reverse dependency index of a linked graph.
+
+        affected(dependents, annotations) -> Set[Any]:
+            Returns the annotations invalidated by replacing the given annotations.
+
+        patch(bound_members, replacements, affected) -> Dict[Any, BoundMember]:
+            Returns the linked members that replace the affected subgraph.
+
+    Example:
+        ```python
+        from collections import ChainMap
+        from pyioc3.graph_patcher import GraphPatcher
+
+        dependents = GraphPatcher.dependents(bound_members)
+        affected = GraphPatcher.affected(dependents, [MyInterface])
+        patched = GraphPatcher.patch(
+            bound_members, {MyInterface: my_bound_member}, affected
+        )
+        graph = ChainMap(patched, bound_members)
+        ```
+    """
+
+    @staticmethod
+    def dependents(bound_members: Mapping[Any, BoundMember]) -> Dict[Any, Set[Any]]:
+        """
+        Builds the reverse dependency index of a linked graph.
+
+        Args:
+            bound_members (Mapping[Any, BoundMember]): The linked graph.
+
+        Returns:
+            Dict[Any, Set[Any]]: The annotations that directly depend on, or
+            reference, each annotation.
+        """
+        index = {}
+        for annotation, member in bound_members.items():
+            for dep in (*member, *member.references):
+                index.setdefault(dep.annotation, set()).add(annotation)
+        return index
+
+    @staticmethod
+    def affected(
+        dependents: Dict[Any, Set[Any]], annotations: Iterable[Any]
+    ) -> Set[Any]:
+        """
+        Returns the annotations invalidated by replacing the given annotations.
+
+        Args:
+            dependents (Dict[Any, Set[Any]]): The reverse dependency index.
+            annotations (Iterable[Any]): The annotations being replaced.
+
+        Returns:
+            Set[Any]: The replaced annotations and all of their dependents.
+        """
+        ret = set()
+        queue = deque(annotations)
+        while queue:
+            annotation = queue.pop()
+            if annotation not in ret:
+                ret.add(annotation)
+                queue.extend(dependents.get(annotation, ()))
+        return ret
+
+    @staticmethod
+    def patch(
+        bound_members: Mapping[Any, BoundMember],
+        replacements: Dict[Any, BoundMember],
+        affected: Set[Any],
+    ) -> Dict[Any, BoundMember]:
+        """
+        Returns the linked members that replace the affected subgraph.
+
+        Members in `replacements` are used as given. Other affected members are
+        copied from `bound_members`. Every returned member is linked to the returned
+        members first and to `bound_members` second, so the result is meant to be
+        layered over the original graph.
+
+        Args:
+            bound_members (Mapping[Any, BoundMember]): The original linked graph.
+            replacements (Dict[Any, BoundMember]): Unlinked members to substitute.
+            affected (Set[Any]): The result of `GraphPatcher.affected`.
+
+        Returns:
+            Dict[Any, BoundMember]: The new members of the affected subgraph.
+
+        Raises:
+            MemberNotBoundError: If a replacement depends on an unbound annotation.
+            CircularDependencyError: If a replacement introduces a cycle.
+        """
+        patched = {}
+        for annotation in affected:
+            if annotation in replacements:
+                patched[annotation] = replacements[annotation]
+            elif annotation in bound_members:
+                patched[annotation] = GraphPatcher._copy(bound_members[annotation])
+
+        for member in patched.values():
+            if member.parameters is None:
+                continue
+            for annotation in member.parameters:
+                member.bind_dependant(
+                    GraphPatcher._lookup(patched, bound_members, member, annotation)
+                )
+            for annotation in BoundMemberFactory.references(member.implementation):
+                member.bind_reference(
+                    GraphPatcher._lookup(patched, bound_members, member, annotation)
+                )
+
+        cycle = QueuedCycleTest.find_cycle(
+            {a: m for a, m in patched.items() if m.parameters is not None}
+        )
+        if cycle:
+            raise CircularDependencyError(
+                "Circular Dependency Detected: "
+                + ", ".join([str(m.implementation) for m in cycle])
+            )
+
+        captive = KeyedScopeTest.find_singleton(
+            m for m in patched.values() if m.parameters is not None
+        )
+        if captive:
+            raise PyIOC3Error(
+                f"Singleton {captive[0].implementation} depends on the keyed"
+                f" binding {captive[1].annotation}. Members that depend on a keyed"
+                " binding must not be singletons."
+            )
+
+        return patched
+
+    @staticmethod
+    def _lookup(
+        patched: Dict[Any, BoundMember],
+        bound_members: Mapping[Any, BoundMember],
+        member: BoundMember,
+        annotation: Any,
+    ) -> BoundMember:
+        if KeyedAnnotation.contains(patched, annotation):
+            return KeyedAnnotation.lookup(patched, annotation)
+        elif KeyedAnnotation.contains(bound_members, annotation):
+            return KeyedAnnotation.lookup(bound_members, annotation)
+        raise _MemberNotBoundErrorAsKeyError(
+            f"Binding {member.implementation} depends "
+            f"on {annotation} which is not bound."
+        )
+
+    @staticmethod
+    def _copy(member: BoundMember) -> BoundMember:
+        return BoundMember(
+            annotation=member.annotation,
+            implementation=member.implementation,
+            scope=member.scope,
+            parameters=member.parameters,
+            on_activate=member.on_activate,
+            fork_policy=member.fork_policy,
+        )
@@ -0,0 +1,99 @@
+import importlib
+import sys
+from typing import Any, Optional
+
+from .errors import LazyBindingError
+
+
+class ImportPath:
+    """
+    ImportPath resolves the import paths used by lazy bindings.
+
+    An import path names an object by its module and qualified name, either as
+    "package.module:Qualified.Name" or as "package.module.Name". The module is only
+    imported when the path is resolved.
+
+    Methods:
+        resolve(path) -> Any:
+            Imports the module named by the path and returns the named object.
+
+        of(obj) -> Optional[str]:
+            Returns the import path of an object, if it can be imported.
+
+    Example:
+        ```python
+        from pyioc3.import_path import ImportPath
+
+        renderer_t = ImportPath.resolve("myapp.reports.pdf:PdfRenderer")
+        ```
+    """
+
+    @staticmethod
+    def resolve(path: str) -> Any:
+        """
+        Imports the module named by the path and returns the named object.
+
+        Args:
+            path (str): The import path.
+
+        Returns:
+            Any: The named object.
+
+        Raises:
+            LazyBindingError: If the path is malformed, the module cannot be
+                imported, or the module has no such attribute.
+        """
+        module_name, sep, qualname = path.partition(":")
+        if not sep:
+            module_name, _, qualname = path.rpartition(".")
+        if not module_name or not qualname:
+            raise LazyBindingError(f"'{path}' is not a valid import path.")
+
+        target = sys.modules.get(module_name)
+        try:
+            if target is None:
+                target = importlib.import_module(module_name)
+        except ImportError as ex:
+            raise LazyBindingError(
+                f"Unable to import '{module_name}' for '{path}'."
+            ) from ex
+
+        try:
+            for attr in qualname.split("."):
+                target = getattr(target, attr)
+        except AttributeError as ex:
+            raise LazyBindingError(
+                f"Module '{module_name}' has no attribute '{qualname}'."
+            ) from ex
+
+        return target
+
+    @staticmethod
+    def of(obj: Any) -> Optional[str]:
+        """
+        Returns the import path of an object, if it can be imported.
+
+        Args:
+            obj (Any): A class, function or other object with a module and a
+                qualified name.
+
+        Returns:
+            Optional[str]: A "package.module:Qualified.Name" path that resolves to
+            the object, or None if there is no such path. Objects defined in
+            `__main__` or inside functions have none.
+        """
+        module = getattr(obj, "__module__", None)
+        qualname = getattr(obj, "__qualname__", None)
+        if (
+            not isinstance(module, str)
+            or not isinstance(qualname, str)
+            or module == "__main__"
+            or "<" in qualname
+        ):
+            return None
+        path = f"{module}:{qualname}"
+        try:
+            resolved = ImportPath.resolve(path)
+        except LazyBindingError:
+            return None
+        return path if resolved is obj else None
@@ -0,0 +1,150 @@
+import functools
+import inspect
+import sys
+from typing import Any, Callable, List, Optional, Tuple
+
+from .bound_member_factory import BoundMemberFactory
+from .errors import InjectionError
+from .keyed_annotation import KeyedAnnotation
+from .scope_enum import ScopeEnum
+from .static_container import StaticContainer
+
+_MISSING = object()
+
+
+class Injector:
+    """
+    Injector resolves the annotated parameters of plain functions from a container.
+
+    Decorating a function introspects it once. Each call resolves the parameters
+    whose annotation is bound in the container and that the caller did not pass,
+    from a plan that is linked on the first call after a container is bound or
+    publishes a new graph version. Singleton arguments are kept by the plan, so
+    later calls only resolve the transient and requested ones, without
+    `get_type_hints` or `container.get()`. Arguments passed by the caller always
+    win. Positional-only parameters are never injected.
+
+    Args:
+        container (Optional[StaticContainer]): The container to resolve from. It
+            can also be bound later, after the functions are decorated.
+
+    Methods:
+        bind(container) -> None:
+            Binds the container used by every function decorated by the injector.
+
+        __call__(fn) -> Callable:
+            Decorates a function, or a coroutine function.
+
+    Example:
+        ```python
+        from pyioc3.injector import inject
+
+        @inject
+        def send_report(report_id: str, mailer: Mailer, reports: ReportRepository):
+            mailer.send(reports.get(report_id))
+
+        inject.bind(builder.build())
+        send_report("r-1")
+        ```
+    """
+
+    def __init__(self, container: Optional[StaticContainer] = None):
+        self._container = container
+
+    def bind(self, container: StaticContainer) -> None:
+        """
+        Binds the container used by every function decorated by the injector.
+
+        Args:
+            container (StaticContainer): The container to resolve from.
+        """
+        self._container = container
+
+    def __call__(self, fn: Callable) -> Callable:
+        """
+        Decorates a function, or a coroutine function.
+
+        Args:
+            fn (Callable): The function whose parameters are injected.
+
+        Returns:
+            Callable: The wrapped function.
+        """
+        hints = dict(BoundMemberFactory.introspection_cache.get_signature(fn))
+        # The (name, position, annotation) of every injectable parameter.
+        # Keyword-only parameters can never be passed by position.
+        injectable = tuple(
+            (
+                name,
+                (sys.maxsize if parameter.kind == parameter.KEYWORD_ONLY else position),
+                hints[name],
+            )
+            for position, (name, parameter) in enumerate(
+                inspect.signature(fn).parameters.items()
+            )
+            if name in hints
+            and parameter.kind
+            in (parameter.POSITIONAL_OR_KEYWORD, parameter.KEYWORD_ONLY)
+        )
+        # The container, the graph version and the [name, position, member,
+        # singleton value] of every injected parameter.
+        plan: List[Any] = [None, None, ()]
+
+        def arguments(args: Tuple[Any, ...], kwargs: dict) -> dict:
+            container = self._container
+            if container is None:
+                raise InjectionError(f"No container is bound to inject {fn!r}.")
+
+            if container._override_count:
+                # Overrides are resolved by their own container.
+                return {
+                    name: container.get(annotation)
+                    for name, position, annotation in injectable
+                    if position >= len(args)
+                    and name not in kwargs
+                    and KeyedAnnotation.contains(container._bound_members, annotation)
+                }
+
+            graph = container._graph
+            if plan[0] is not container or plan[1] is not graph:
+                entries = tuple(
+                    [name, position, container._lookup(annotation, graph), _MISSING]
+                    for name, position, annotation in injectable
+                    if KeyedAnnotation.contains(graph.bound_members, annotation)
+                )
+                plan[:] = [container, graph, entries]
+
+            needed = [
+                entry
+                for entry in plan[2]
+                if entry[1] >= len(args) and entry[0] not in kwargs
+            ]
+            resolved = {
+                entry[0]: entry[3] for entry in needed if entry[3] is not _MISSING
+            }
+            if len(resolved) < len(needed):
+                entries = [entry for entry in needed if entry[0] not in resolved]
+                values = container._resolve([entry[2] for entry in entries], graph)
+                for entry, value in zip(entries, values):
+                    resolved[entry[0]] = value
+                    if entry[2].scope == ScopeEnum.SINGLETON:
+                        entry[3] = value
+            return resolved
+
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                return await fn(*args, **kwargs, **arguments(args, kwargs))
+
+        else:
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                return fn(*args, **kwargs, **arguments(args, kwargs))
+
+        return wrapper
+
+
+# The process-wide injector. Bind it to the application container at startup.
+inject = Injector()
@@ -1,16 +1,19 @@
 from abc import ABC, abstractmethod
 from typing import (
+    Any,
     Callable,
+    Generic,
     NamedTuple,
     Optional,
+    Tuple,
     Type,
     TypeVar,
     Union,
 )
 
+from .fork_policy import ForkPolicy
 from .scope_enum import ScopeEnum
 
-
 TARGET_T = TypeVar("TARGET_T")
 PROVIDER_T = TypeVar("PROVIDER_T")
 FACTORY_T = Callable[..., PROVIDER_T]
@@ -23,6 +26,7 @@ class ProviderBinding(NamedTuple):
     implementation: Optional[Type[PROVIDER_T]] = None
     scope: Optional[Union[str, ScopeEnum]] = None
     on_activate: Optional[Callable[[PROVIDER_T], PROVIDER_T]] = None
+    fork_policy: Optional[Union[str, ForkPolicy]] = None
 
 
 class ConstantBinding(NamedTuple):
@@ -39,7 +43,98 @@ class FactoryBinding(NamedTuple):
     annotation: FACTORY_T
 
 
-Binding = Union[ProviderBinding, ConstantBinding, FactoryBinding]
+class MmapBinding(NamedTuple):
+    """Represents a binding for providing a read-only memory-mapped file."""
+
+    path: str
+    annotation: Type[PROVIDER_T]
+    loader: Optional[Callable[[memoryview], PROVIDER_T]] = None
+
+
+class SharedMemoryBinding(NamedTuple):
+    """Represents a binding for providing a constant placed in shared memory."""
+
+    value: Any
+    annotation: Type[PROVIDER_T]
+    loader: Optional[Callable[[memoryview], PROVIDER_T]] = None
+
+
+class LazyConstantBinding(NamedTuple):
+    """Represents a binding for providing a constant loaded on first use."""
+
+    loader: Callable[[], PROVIDER_T]
+    annotation: Type[PROVIDER_T]
+
+
+class AssistedBinding(NamedTuple):
+    """Represents a binding for providing a factory that mixes runtime arguments
+    with injected dependencies."""
+
+    annotation: "Factory"
+    implementation: Optional[Callable[..., PROVIDER_T]] = None
+    assisted: Tuple[str, ...] = ()
+
+
+class KeyedBinding(NamedTuple):
+    """Represents a binding for providing one cached instance per request key."""
+
+    annotation: Type[PROVIDER_T]
+    implementation: Optional[Callable[..., PROVIDER_T]] = None
+    key: str = "key"
+    maxsize: Optional[int] = 128
+    on_evict: Optional[Callable[[PROVIDER_T], None]] = None
+
+
+class PrefetchBinding(NamedTuple):
+    """Represents a binding for providing transient instances created ahead of
+    time by a background thread."""
+
+    annotation: Type[PROVIDER_T]
+    implementation: Optional[Callable[..., PROVIDER_T]] = None
+    size: int = 4
+    on_activate: Optional[Callable[[PROVIDER_T], PROVIDER_T]] = None
+
+
+class MultiBinding(NamedTuple):
+    """Represents one element of a collection injected as List[T] or
+    Tuple[T, ...]."""
+
+    annotation: Type[PROVIDER_T]
+    implementation: Optional[Type[PROVIDER_T]] = None
+    scope: Optional[Union[str, ScopeEnum]] = None
+    on_activate: Optional[Callable[[PROVIDER_T], PROVIDER_T]] = None
+    fork_policy: Optional[Union[str, ForkPolicy]] = None
+
+
+class MultiElement(NamedTuple):
+    """The annotation of the element of a multi-binding at the given index."""
+
+    annotation: Any
+    index: int
+
+
+class CollectionBinding(NamedTuple):
+    """Represents a binding for providing a list or tuple of multi-bound
+    elements."""
+
+    annotation: Any
+    elements: Tuple[MultiElement, ...]
+    collection: Callable[[Tuple[Any, ...]], Any] = list
+
+
+Binding = Union[
+    ProviderBinding,
+    ConstantBinding,
+    FactoryBinding,
+    MmapBinding,
+    SharedMemoryBinding,
+    LazyConstantBinding,
+    AssistedBinding,
+    KeyedBinding,
+    PrefetchBinding,
+    MultiBinding,
+    CollectionBinding,
+]
 
 
 class Scope(ABC):
@@ -101,6 +196,29 @@ class Container(ABC):
         raise NotImplementedError()
 
 
+class Factory(Generic[PROVIDER_T]):
+    """The annotation of an assisted factory.
+
+    `Factory[Handler]` is injected as a callable that takes the assisted
+    arguments of Handler, by position or by name, and returns a new Handler
+    whose other parameters are injected by the container.
+
+    Example:
+
+        class Handler:
+            def __init__(self, request_id: str, repository: Repository): ...
+
+        ioc_builder.bind_assisted(Handler, assisted=["request_id"])
+
+        class Router:
+            def __init__(self, handler_factory: Factory[Handler]):
+                self.handler = handler_factory("req-1")
+    """
+
+    def __call__(self, *args: Any, **kwargs: Any) -> PROVIDER_T:
+        raise NotImplementedError()
+
+
 class ContainerBuilder(ABC):
     """Bind classes, values, functions, and factories to a container."""
 
@@ -111,6 +229,7 @@ class ContainerBuilder(ABC):
         implementation: Optional[Type[PROVIDER_T]] = None,
         scope: Union[str, ScopeEnum] = ScopeEnum.TRANSIENT,
         on_activate: Callable[[PROVIDER_T], PROVIDER_T] = None,
+        fork_policy: Union[str, ForkPolicy] = ForkPolicy.SHARE,
     ):
         """Bind a class.
 
@@ -135,6 +254,10 @@ class ContainerBuilder(ABC):
                           or given as the return in container.get()
                           Default: None.
 
+          fork_policy:    Optional: What happens to a singleton instance when the
+                          process forks. Options are Share, Reinitialize, Lazy.
+                          Default: Share.
+
         Scopes:
             Transient scopes and not cached.
             Requested scopes are cached during the current execution of a container.get call.
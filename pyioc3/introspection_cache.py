@@ -0,0 +1,153 @@
+import sys
+from inspect import isclass
+from threading import Lock
+from types import FunctionType, MethodType
+from typing import Any, Dict, List, NamedTuple, Tuple, get_type_hints
+from weakref import WeakKeyDictionary
+
+Signature = Tuple[Tuple[str, Any], ...]
+
+if sys.version_info >= (3, 9):
+
+    def _type_hints(target: Any) -> Dict[str, Any]:
+        # Keep Annotated metadata, it selects keyed bindings.
+        return get_type_hints(target, include_extras=True)
+
+else:
+    _type_hints = get_type_hints
+
+
+class CacheStats(NamedTuple):
+    """A point-in-time snapshot of the introspection cache counters."""
+
+    hits: int
+    misses: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """The ratio of lookups served from the cache. 0.0 if nothing was looked up."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class IntrospectionCache:
+    """
+    IntrospectionCache memoizes the constructor signature of implementations.
+
+    Evaluating type hints is the most expensive part of building a bound member,
+    especially when hints are forward references that must be evaluated as strings.
+    The cache holds the evaluated (name, annotation) pairs of each implementation so
+    repeated builds of the same bindings skip `get_type_hints` completely.
+    `typing.Annotated` hints are kept with their metadata.
+
+    Keys are held through weak references so classes and functions can still be
+    garbage collected. Implementations that cannot be weakly referenced are
+    introspected on every call and counted as misses.
+
+    Methods:
+        get_parameters(implementation) -> List[Any]:
+            Returns the annotations of the parameters required by the implementation.
+
+        get_signature(implementation) -> Tuple[Tuple[str, Any], ...]:
+            Returns the (name, annotation) pairs required by the implementation.
+
+        stats() -> CacheStats:
+            Returns the hit, miss, and size counters of the cache.
+
+        clear() -> None:
+            Drops all cached signatures and resets the counters.
+
+    Example:
+        ```python
+        from pyioc3.bound_member_factory import BoundMemberFactory
+
+        stats = BoundMemberFactory.introspection_cache.stats()
+        print(f"{stats.hit_rate:.0%} of introspections served from the cache")
+        ```
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._cache = WeakKeyDictionary()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def _inspect(implementation: Any) -> Tuple[Any, Any]:
+        # Returns the cache key and the object whose hints describe the parameters.
+        if isclass(implementation):
+            return implementation, implementation.__init__
+        elif type(implementation) is FunctionType:
+            return implementation, implementation
+        elif type(implementation) is MethodType:
+            return implementation.__func__, implementation
+        elif hasattr(implementation, "__call__"):
+            return type(implementation), implementation.__call__
+        else:
+            return implementation, implementation
+
+    def get_signature(self, implementation: Any) -> Signature:
+        """
+        Returns the (name, annotation) pairs required by the implementation.
+
+        Args:
+            implementation: A class, function, or callable object.
+
+        Returns:
+            Tuple[Tuple[str, Any], ...]: The annotated parameters, in declaration
+            order, excluding the return annotation.
+        """
+        key, target = IntrospectionCache._inspect(implementation)
+        try:
+            with self._lock:
+                signature = self._cache[key]
+                self._hits += 1
+                return signature
+        except (KeyError, TypeError):
+            pass
+
+        signature = tuple(
+            (name, annotation)
+            for name, annotation in _type_hints(target).items()
+            if name != "return"
+        )
+
+        with self._lock:
+            self._misses += 1
+            try:
+                self._cache[key] = signature
+            except TypeError:
+                # Not hashable or not weakly referenceable; never cached.
+                pass
+
+        return signature
+
+    def get_parameters(self, implementation: Any) -> List[Any]:
+        """
+        Returns the annotations of the parameters required by the implementation.
+
+        Args:
+            implementation: A class, function, or callable object.
+
+        Returns:
+            List[Any]: The parameter annotations in declaration order.
+        """
+        return [annotation for _, annotation in self.get_signature(implementation)]
+
+    def stats(self) -> CacheStats:
+        """
+        Returns the hit, miss, and size counters of the cache.
+
+        Returns:
+            CacheStats: A snapshot of the cache counters.
+        """
+        with self._lock:
+            return CacheStats(self._hits, self._misses, len(self._cache))
+
+    def clear(self) -> None:
+        """Drops all cached signatures and resets the counters."""
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
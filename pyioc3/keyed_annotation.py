@@ -0,0 +1,132 @@
+from typing import Any, Mapping, Tuple
+
+from .bound_member import BoundMember
+from .errors import PyIOC3Error
+
+try:
+    from typing import Annotated, get_origin
+except ImportError:  # Python < 3.9
+    Annotated = None
+    get_origin = None
+
+
+class KeyedAnnotation:
+    """
+    KeyedAnnotation binds several implementations of one type under different keys.
+
+    A keyed annotation is `typing.Annotated[T, key]`. It is an ordinary annotation
+    for the container: bindings are stored in the bound member dict under it, and
+    two keyed annotations are equal when their type and keys are equal, so looking
+    one up is a single hash of (type, key). Constructor hints keep their Annotated
+    metadata when they are introspected, so a parameter annotated with
+    `Annotated[T, key]` is linked to the member bound to that key.
+
+    Annotated hints whose key is not bound fall back to the member bound to the
+    bare type. Metadata used by other libraries, such as validation constraints,
+    therefore keeps resolving as it did before the metadata was kept.
+
+    Keyed annotations require Python 3.9 or later.
+
+    Methods:
+        of(annotation, key) -> Any:
+            Returns the keyed annotation of a type.
+
+        split(annotation) -> Tuple[Any, Tuple[Any, ...]]:
+            Returns the type and the keys of an annotation.
+
+        lookup(bound_members, annotation) -> BoundMember:
+            Returns the member bound to an annotation, or to its bare type.
+
+        contains(bound_members, annotation) -> bool:
+            Returns True if `lookup` finds a member for the annotation.
+
+    Example:
+        ```python
+        from typing import Annotated
+
+        builder.bind(Annotated[Cache, "sessions"], RedisCache, "singleton")
+        builder.bind(Annotated[Cache, "pages"], MemoryCache, "singleton")
+
+        class SessionStore:
+            def __init__(self, cache: Annotated[Cache, "sessions"]): ...
+        ```
+    """
+
+    @staticmethod
+    def of(annotation: Any, key: Any) -> Any:
+        """
+        Returns the keyed annotation of a type.
+
+        Args:
+            annotation (Any): The type.
+            key (Any): A hashable key, usually a string.
+
+        Returns:
+            Any: `Annotated[annotation, key]`.
+
+        Raises:
+            PyIOC3Error: If typing.Annotated is not available.
+        """
+        if Annotated is None:
+            raise PyIOC3Error("Keyed annotations require Python 3.9 or later.")
+        return Annotated[annotation, key]
+
+    @staticmethod
+    def split(annotation: Any) -> Tuple[Any, Tuple[Any, ...]]:
+        """
+        Returns the type and the keys of an annotation.
+
+        Args:
+            annotation (Any): Any annotation.
+
+        Returns:
+            Tuple[Any, Tuple[Any, ...]]: The bare type and the Annotated metadata,
+            or the annotation and an empty tuple if it is not keyed.
+        """
+        if get_origin is not None and get_origin(annotation) is Annotated:
+            return annotation.__origin__, annotation.__metadata__
+        return annotation, ()
+
+    @staticmethod
+    def lookup(
+        bound_members: Mapping[Any, BoundMember], annotation: Any
+    ) -> BoundMember:
+        """
+        Returns the member bound to an annotation, or to its bare type.
+
+        Args:
+            bound_members (Mapping[Any, BoundMember]): The members by annotation.
+            annotation (Any): The annotation to look up.
+
+        Returns:
+            BoundMember: The member bound to the annotation, or, if the annotation
+            is keyed and its key is not bound, the member bound to its type.
+
+        Raises:
+            KeyError: If neither the annotation nor its type is bound.
+        """
+        try:
+            return bound_members[annotation]
+        except KeyError:
+            base, keys = KeyedAnnotation.split(annotation)
+            if not keys:
+                raise
+            return bound_members[base]
+
+    @staticmethod
+    def contains(bound_members: Mapping[Any, BoundMember], annotation: Any) -> bool:
+        """
+        Returns True if `lookup` finds a member for the annotation.
+
+        Args:
+            bound_members (Mapping[Any, BoundMember]): The members by annotation.
+            annotation (Any): The annotation to look up.
+
+        Returns:
+            bool: True if the annotation, or the type of a keyed annotation, is
+            bound.
+        """
+        return (
+            annotation in bound_members
+            or KeyedAnnotation.split(annotation)[0] in bound_members
+        )
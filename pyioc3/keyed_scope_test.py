@@ -0,0 +1,57 @@
+from typing import Dict, Iterable, Optional, Tuple
+
+from .adapters import KeyedInstanceAdapter
+from .bound_member import BoundMember
+from .scope_enum import ScopeEnum
+
+
+class KeyedScopeTest:
+    @staticmethod
+    def find_singleton(
+        members: Iterable[BoundMember],
+    ) -> Optional[Tuple[BoundMember, BoundMember]]:
+        """Find a singleton that depends on a keyed binding.
+
+        A singleton created during a keyed request would keep the instance of the
+        first key for every later request.
+
+        Arguments:
+        members: The linked, acyclic members to test.
+
+        Returns:
+        The singleton and the keyed member it depends on, directly or
+        transitively, or None.
+        """
+        reached: Dict[BoundMember, Optional[BoundMember]] = {}
+        for member in members:
+            if member.scope == ScopeEnum.SINGLETON:
+                keyed = KeyedScopeTest._find_keyed(member, reached)
+                if keyed is not None:
+                    return member, keyed
+        return None
+
+    @staticmethod
+    def _find_keyed(
+        root: BoundMember, reached: Dict[BoundMember, Optional[BoundMember]]
+    ) -> Optional[BoundMember]:
+        """Find a keyed member reachable from a member.
+
+        Arguments:
+        root: The bound member to begin the search.
+        reached: The keyed member reachable from each member already searched.
+        """
+        stack = [(root, 0)]
+        while stack:
+            v, s = stack.pop()
+            if v in reached:
+                continue
+            elif s == 0:
+                stack.append((v, 1))
+                stack.extend((d, 0) for d in v if d not in reached)
+            elif isinstance(v.implementation, KeyedInstanceAdapter):
+                reached[v] = v
+            else:
+                reached[v] = next(
+                    (reached[d] for d in v if reached.get(d) is not None), None
+                )
+        return reached[root]
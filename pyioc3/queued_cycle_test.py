@@ -35,7 +35,7 @@ class QueuedCycleTest:
             elif s == 0:
                 visited.add(v)
                 stack.append((v, 1))
-                [stack.append((d, 0)) for d in v]
+                [stack.append((d, 0)) for d in (*v, *v.references)]
             elif s == 1:
                 visited.remove(v)
         return None
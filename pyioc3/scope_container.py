@@ -1,4 +1,5 @@
-from typing import Type
+from threading import Lock
+from typing import Optional, Set, Type
 from .bound_member import BoundMember
 from .interface import Scope, PROVIDER_T
 from .scope_enum import ScopeEnum
@@ -88,6 +89,227 @@ class PersistentScope(Scope):
         return self._cache[annotation]
 
 
+class OverlayScope(Scope):
+    """
+    OverlayScope is an implementation of the Scope interface that layers a private
+    cache over a parent scope.
+
+    Instances of the overlaid annotations are kept in the private cache. Every other
+    annotation is read from and written to the parent, so instances are shared with
+    the parent scope.
+
+    Args:
+        parent (Scope): The scope shared with the parent.
+        overlaid (Set[Type[PROVIDER_T]]): The annotations kept in the private cache.
+
+    Methods:
+        __contains__(self, annotation: Type[PROVIDER_T]) -> bool:
+            Checks if an instance with the specified annotation exists in the scope.
+
+        add(self, annotation: Type[PROVIDER_T], instance: PROVIDER_T) -> None:
+            Adds an instance to the private cache or to the parent.
+
+        use(self, annotation: Type[PROVIDER_T]) -> object:
+            Retrieves an instance from the private cache or from the parent.
+
+    Example:
+        To share singletons with a parent scope, except for an overridden one:
+
+        ```python
+        from pyioc3.scope_container import OverlayScope, PersistentScope
+
+        parent = PersistentScope()
+        scope = OverlayScope(parent, {MyAnnotation})
+
+        # Stored in the parent.
+        scope.add(OtherAnnotation, other_instance)
+
+        # Stored in the overlay only.
+        scope.add(MyAnnotation, my_instance)
+        ```
+
+    See Also:
+        - `Scope`: The base interface for managing dependency scopes.
+        - `PersistentScope`: The scope used for the private cache.
+    """
+
+    def __init__(self, parent: Scope, overlaid: Set[Type[PROVIDER_T]]):
+        self._parent = parent
+        self._overlaid = overlaid
+        self._own = PersistentScope()
+
+    def _select(self, annotation: Type[PROVIDER_T]) -> Scope:
+        return self._own if annotation in self._overlaid else self._parent
+
+    def __contains__(self, annotation: Type[PROVIDER_T]) -> bool:
+        """
+        Checks if an instance with the specified annotation exists in the scope.
+
+        Args:
+            annotation (Type[PROVIDER_T]): The annotation of the instance.
+
+        Returns:
+            bool: True if an instance with the specified annotation exists;
+            otherwise, False.
+        """
+        return annotation in self._select(annotation)
+
+    def add(self, annotation: Type[PROVIDER_T], instance: PROVIDER_T) -> None:
+        """
+        Adds an instance to the private cache or to the parent.
+
+        Args:
+            annotation (Type[PROVIDER_T]): The annotation of the instance.
+            instance (PROVIDER_T): The instance to add to the scope.
+        """
+        self._select(annotation).add(annotation, instance)
+
+    def use(self, annotation: Type[PROVIDER_T]) -> object:
+        """
+        Retrieves an instance from the private cache or from the parent.
+
+        Args:
+            annotation (Type[PROVIDER_T]): The annotation of the instance.
+
+        Returns:
+            object: The instance associated with the specified annotation.
+        """
+        return self._select(annotation).use(annotation)
+
+
+class VersionedScope(Scope):
+    """
+    VersionedScope is an implementation of the Scope interface for the singletons
+    of a new version of a dependency graph.
+
+    Instances of annotations that were not invalidated are carried over from the
+    previous version when the scope is derived. Instances of invalidated
+    annotations are created again. The previous version is not kept, so its
+    invalidated instances are collected once no in-flight request uses them.
+    Only a scope still shared with a parent container, whose instances may be
+    created later, is read through on first use.
+
+    Args:
+        previous (Optional[Scope]): The shared scope to read through, if any.
+        invalidated (Set[Type[PROVIDER_T]]): The annotations that must not be read
+            from the shared scope.
+
+    Methods:
+        derive(previous, invalidated) -> VersionedScope:
+            Creates the scope of the next version.
+
+        __contains__(self, annotation: Type[PROVIDER_T]) -> bool:
+            Checks if an instance with the specified annotation exists in the scope.
+
+        add(self, annotation: Type[PROVIDER_T], instance: PROVIDER_T) -> None:
+            Adds an instance to the scope.
+
+        use(self, annotation: Type[PROVIDER_T]) -> object:
+            Retrieves an instance from the scope or the shared scope.
+
+    Example:
+        ```python
+        from pyioc3.scope_container import PersistentScope, VersionedScope
+
+        v1 = PersistentScope()
+        v2 = VersionedScope.derive(v1, {ChangedAnnotation})
+        ```
+
+    See Also:
+        - `Scope`: The base interface for managing dependency scopes.
+        - `OverlayScope`: A scope that keeps sharing instances with its parent.
+    """
+
+    def __init__(self, previous: Optional[Scope], invalidated: Set[Type[PROVIDER_T]]):
+        self._previous = previous
+        self._invalidated = invalidated
+        self._cache = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def derive(previous: Scope, invalidated: Set[Type[PROVIDER_T]]) -> "VersionedScope":
+        """
+        Creates the scope of the next version.
+
+        Args:
+            previous (Scope): The singleton scope of the current version.
+            invalidated (Set[Type[PROVIDER_T]]): The annotations whose instances
+                must be created again.
+
+        Returns:
+            VersionedScope: The singleton scope of the next version.
+        """
+        invalidated = set(invalidated)
+        if isinstance(previous, VersionedScope):
+            with previous._lock:
+                cache = dict(previous._cache)
+            shared, hidden = previous._previous, previous._invalidated
+        elif isinstance(previous, OverlayScope):
+            cache = dict(previous._own._cache)
+            shared, hidden = previous._parent, previous._overlaid
+        elif isinstance(previous, PersistentScope):
+            cache = dict(previous._cache)
+            shared, hidden = None, set()
+        else:
+            cache = {}
+            shared, hidden = previous, set()
+        scope = VersionedScope(shared, hidden | invalidated)
+        scope._cache = {
+            annotation: instance
+            for annotation, instance in cache.items()
+            if annotation not in invalidated
+        }
+        return scope
+
+    def _reads_through(self, annotation: Type[PROVIDER_T]) -> bool:
+        return self._previous is not None and annotation not in self._invalidated
+
+    def __contains__(self, annotation: Type[PROVIDER_T]) -> bool:
+        """
+        Checks if an instance with the specified annotation exists in the scope.
+
+        Args:
+            annotation (Type[PROVIDER_T]): The annotation of the instance.
+
+        Returns:
+            bool: True if an instance with the specified annotation exists;
+            otherwise, False.
+        """
+        return annotation in self._cache or (
+            self._reads_through(annotation) and annotation in self._previous
+        )
+
+    def add(self, annotation: Type[PROVIDER_T], instance: PROVIDER_T) -> None:
+        """
+        Adds an instance to the scope.
+
+        Args:
+            annotation (Type[PROVIDER_T]): The annotation of the instance.
+            instance (PROVIDER_T): The instance to add to the scope.
+        """
+        with self._lock:
+            self._cache[annotation] = instance
+
+    def use(self, annotation: Type[PROVIDER_T]) -> object:
+        """
+        Retrieves an instance from the scope or the shared scope.
+
+        Args:
+            annotation (Type[PROVIDER_T]): The annotation of the instance.
+
+        Returns:
+            object: The instance associated with the specified annotation.
+        """
+        try:
+            return self._cache[annotation]
+        except KeyError:
+            if not self._reads_through(annotation):
+                raise
+        instance = self._previous.use(annotation)
+        with self._lock:
+            return self._cache.setdefault(annotation, instance)
+
+
 class TransientScope(Scope):
     """
     TransientScope is an implementation of the Scope interface for managing transient
@@ -1,15 +1,79 @@
-from collections import deque
-from typing import Dict, Type
+import os
+import warnings
+from collections import ChainMap, deque
+from itertools import islice
+from contextvars import ContextVar
+from threading import RLock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Type,
+    Union,
+)
+from weakref import WeakSet
 
-from .errors import _MemberNotBoundErrorAsKeyError
+from .adapters import ResourceAdapter
+from .errors import (
+    CircularDependencyError,
+    PyIOC3Error,
+    _MemberNotBoundErrorAsKeyError,
+)
+from .fork_policy import ForkPolicy
 from .scope_enum import ScopeEnum
 from .bound_member import BoundMember
-from .scope_container import PersistentScope, ScopeContainer
+from .bound_member_factory import BoundMemberFactory
+from .graph_patcher import GraphPatcher
+from .keyed_annotation import KeyedAnnotation
+from .keyed_scope_test import KeyedScopeTest
+from .queued_cycle_test import QueuedCycleTest
+from .scope_container import (
+    OverlayScope,
+    PersistentScope,
+    ScopeContainer,
+    VersionedScope,
+)
 from .interface import (
+    AssistedBinding,
+    Binding,
+    CollectionBinding,
+    ConstantBinding,
     Container,
+    FactoryBinding,
+    KeyedBinding,
+    LazyConstantBinding,
+    PrefetchBinding,
+    MmapBinding,
+    MultiBinding,
     PROVIDER_T,
+    SharedMemoryBinding,
+    ProviderBinding,
+    Scope,
+)
+
+# The active overrides of the current context, by container.
+_active_overrides: ContextVar[Optional[Dict[Any, Any]]] = ContextVar(
+    "pyioc3_active_overrides", default=None
+)
+
+# The request of the outermost get() running in the current context.
+_active_request: ContextVar[Optional["_ActiveRequest"]] = ContextVar(
+    "pyioc3_active_request", default=None
 )
 
+# The key of a request made without one.
+_NO_KEY = object()
+
+# Every live container, so forked processes can reset them.
+_containers: "WeakSet[StaticContainer]" = WeakSet()
+
 
 class StaticContainer(Container):
     """
@@ -19,25 +83,86 @@ class StaticContainer(Container):
     Args:
         bound_members (Dict[Type[PROVIDER_T], BoundMember]): A dictionary containing
             bound members (providers) and their associated metadata.
+        singletons (Optional[Scope]): The scope holding singleton instances. If not
+            given, a new PersistentScope is used.
 
     Attributes:
-        _singletons (PersistentScope): A persistent scope for managing singleton
-            instances.
-        _bound_members (Dict[Type[PROVIDER_T], BoundMember]): A dictionary containing
-            bound members and their associated metadata.
+        _graph (_GraphVersion): The current version of the dependency graph.
+        _singletons (Scope): A persistent scope for managing singleton
+            instances of the current version.
+        _bound_members (Mapping[Type[PROVIDER_T], BoundMember]): A mapping
+            containing the bound members of the current version and their
+            associated metadata.
+        _validated (Set[BoundMember]): The members whose dependency subgraph is
+            known to be linked and free of cycles.
+        _override_count (int): The number of active overrides in any context.
+        _complete (bool): True once every member of the current version is known
+            to be validated.
 
     Methods:
-        _build_scope(requested_member: BoundMember) -> ScopeContainer:
+        _build_scope(requested_member: BoundMember, singletons: Scope)
+                -> ScopeContainer:
             Builds a scope for resolving dependencies for the requested member.
 
-        get(annotation: Type[PROVIDER_T]) -> PROVIDER_T:
+        _populate(scope: ScopeContainer, requested_member: BoundMember) -> None:
+            Adds the requested member and its dependencies to a scope.
+
+        _link(requested_member: BoundMember, graph: _GraphVersion) -> None:
+            Links the deferred members reachable from the requested member.
+
+        get(annotation: Type[PROVIDER_T], key: Any = ...) -> PROVIDER_T:
             Retrieves an instance of the specified annotation from the container.
 
+        get_batch(annotation: Type[PROVIDER_T], n: int) -> List[PROVIDER_T]:
+            Creates n instances of the specified annotation in one request.
+
+        iter(annotation: Type[PROVIDER_T]) -> Iterator[PROVIDER_T]:
+            Yields new instances of the specified annotation, without end.
+
+        validate() -> None:
+            Links every deferred member and checks the whole graph for cycles.
+
+        child(overrides: List[Binding]) -> StaticContainer:
+            Creates an overlay container that replaces some bindings.
+
+        rebind(overrides: List[Binding]) -> None:
+            Replaces bindings by publishing a new version of the dependency graph.
+
+        override(annotation, implementation, scope, on_activate)
+                -> ContainerOverride:
+            Replaces a binding within the current thread or context only.
+
+        inject(fn: Callable) -> Callable:
+            Decorates a function whose annotated parameters are injected.
+
+        warm_up(annotations: Optional[Iterable[Any]] = None) -> None:
+            Creates singletons ahead of time, typically before forking workers.
+
+        close() -> None:
+            Releases the resources held by the bindings of the container.
+
+        __reduce__() -> tuple:
+            Pickles the container as a ContainerSpec.
+
     Note:
         The `StaticContainer` class is used to manage dependencies with statically
         defined bindings. It implements the `Container` interface and allows you to
         retrieve instances of bound members (providers) based on their annotations.
 
+        Deferred members, whose parameters are None, are introspected and linked
+        the first time a `get` reaches them. The subgraph of each requested member
+        is checked for cycles once, on its first `get`.
+
+        A `get` called while another `get` of the same container is creating
+        instances on the same thread or task, for example by a factory or by a
+        member that injects the container, resolves into the request scope of the
+        outer call. REQUESTED members are shared by both calls.
+
+        When the process forks, the child process replaces the singletons whose
+        fork policy is not SHARE, and the singletons that depend on them, before
+        any other code runs. Every other singleton keeps being shared with the
+        parent process.
+
     Example:
         To create a `StaticContainer` with bound members and retrieve an instance of a
         specific annotation:
@@ -64,16 +189,50 @@ class StaticContainer(Container):
 
     """
 
-    def __init__(self, bound_members: Dict[Type[PROVIDER_T], BoundMember]):
-        self._singletons = PersistentScope()
-        self._bound_members = bound_members
+    def __init__(
+        self,
+        bound_members: Dict[Type[PROVIDER_T], BoundMember],
+        singletons: Optional[Scope] = None,
+    ):
+        self._graph = _GraphVersion(
+            bound_members,
+            singletons if singletons is not None else PersistentScope(),
+        )
+        self._validated = set()
+        self._override_count = 0
+        self._lock = RLock()
+        # The state adapters keep per container, such as prefetch queues.
+        self._adapter_state: Dict[Any, Any] = {}
+        _containers.add(self)
 
-    def _build_scope(self, requested_member: BoundMember):
-        # Build a scope using a post-order traversal of the
+    @property
+    def _bound_members(self) -> Mapping[Type[PROVIDER_T], BoundMember]:
+        return self._graph.bound_members
+
+    @property
+    def _singletons(self) -> Scope:
+        return self._graph.singletons
+
+    @property
+    def _complete(self) -> bool:
+        return self._graph.complete
+
+    @_complete.setter
+    def _complete(self, value: bool) -> None:
+        self._graph.complete = value
+
+    def _build_scope(
+        self, requested_member: BoundMember, singletons: Optional[Scope] = None
+    ):
+        scope = ScopeContainer(self._singletons if singletons is None else singletons)
+        self._populate(scope, requested_member)
+        return scope
+
+    def _populate(self, scope: ScopeContainer, requested_member: BoundMember) -> None:
+        # Fill the scope using a post-order traversal of the
         # dependency tree.  This will guarantee the scope has
         # all dependencies for each object it is given to build.
 
-        scope = ScopeContainer(self._singletons)
         stack = deque()
         stack.append((requested_member, 0))
         while len(stack) > 0:
@@ -85,27 +244,759 @@ class StaticContainer(Container):
                 [stack.append((v, 0)) for v in m]
             else:
                 scope.add(m)
-        return scope
 
-    def get(self, annotation: Type[PROVIDER_T]) -> PROVIDER_T:
+    def _link(self, requested_member: BoundMember, graph: "_GraphVersion") -> None:
+        # Link every deferred member reachable from the requested member and
+        # check the subgraph for cycles before it is marked as validated.
+
+        with self._lock:
+            reachable = set()
+            stack = [requested_member]
+            while stack:
+                m = stack.pop()
+                if m in reachable:
+                    continue
+                reachable.add(m)
+                if m.parameters is None:
+                    self._link_member(m, graph.bound_members)
+                stack.extend(m)
+                stack.extend(m.references)
+
+            cycle = QueuedCycleTest._find_cycle(requested_member)
+            if cycle:
+                raise CircularDependencyError(
+                    "Circular Dependency Detected: "
+                    + ", ".join([str(m.implementation) for m in cycle])
+                )
+
+            captive = KeyedScopeTest.find_singleton(reachable)
+            if captive:
+                raise PyIOC3Error(
+                    f"Singleton {captive[0].implementation} depends on the keyed"
+                    f" binding {captive[1].annotation}. Members that depend on a keyed"
+                    " binding must not be singletons."
+                )
+
+            self._validated.update(reachable)
+
+    def _link_member(
+        self,
+        member: BoundMember,
+        bound_members: Mapping[Type[PROVIDER_T], BoundMember],
+    ) -> None:
+        # Dependencies are resolved before the member is modified so a failure
+        # leaves it deferred.
+        implementation, parameters = BoundMemberFactory.introspect(member)
+        references = BoundMemberFactory.references(implementation)
+        dependencies = []
+        for annotation in [*parameters, *references]:
+            try:
+                dependencies.append(KeyedAnnotation.lookup(bound_members, annotation))
+            except KeyError:
+                raise _MemberNotBoundErrorAsKeyError(
+                    f"Binding {implementation} depends "
+                    f"on {annotation} which is not bound."
+                )
+        member.implementation = implementation
+        for dependency in dependencies[: len(parameters)]:
+            member.bind_dependant(dependency)
+        for reference in dependencies[len(parameters) :]:
+            member.bind_reference(reference)
+        member.parameters = parameters
+
+    def get(self, annotation: Type[PROVIDER_T], key: Any = _NO_KEY) -> PROVIDER_T:
         """
         Retrieve an instance of the specified annotation from the container.
 
+        The call resolves against the graph version that is current when it starts,
+        even if `rebind` publishes a new version before it returns. Calls made
+        while an outer call is creating instances share its REQUESTED instances.
+
+        Requests made with a key always start a new request scope. Keyed bindings
+        reached by the request provide their cached instance for that key, and
+        nested calls made while the request creates instances inherit the key.
+
         Args:
             annotation (Type[PROVIDER_T]): The annotation (provider) for which an
                 instance is requested.
+            key (Any): Optional: The key of the request, such as a shard id.
 
         Returns:
             PROVIDER_T: An instance of the specified annotation.
 
         Raises:
             MemberNotBoundError: If the requested annotation is not bound in the
-                container.
+                container, or a deferred dependency depends on an unbound
+                annotation.
+            CircularDependencyError: If the dependencies of the requested annotation
+                contain a cycle.
+            LazyBindingError: If a lazy binding cannot be imported.
+            PyIOC3Error: If a keyed binding is reached by a request without a key.
+
+        Example:
+            ```python
+            client = container.get(ShardClient, key=shard_id)
+            ```
         """
+        if self._override_count:
+            active = _active_overrides.get()
+            if active is not None and self in active:
+                return active[self].get_container().get(annotation, key)
+
+        graph = self._graph
+        if key is not _NO_KEY:
+            return self._resolve([self._lookup(annotation, graph)], graph, key)[0]
+
+        try:
+            member = graph.bound_members[annotation]
+        except KeyError:
+            member = self._lookup(annotation, graph)
+            return self._resolve([member], graph)[0]
+        else:
+            if not graph.complete and member not in self._validated:
+                self._link(member, graph)
+
+            request = _active_request.get()
+            if request is not None and request.graph is graph and request.open:
+                self._populate(request.scope, member)
+                return request.scope.get_instance_of(member)
+
+            request = _ActiveRequest(graph, ScopeContainer(graph.singletons))
+            token = _active_request.set(request)
+            try:
+                self._populate(request.scope, member)
+                return request.scope.get_instance_of(member)
+            finally:
+                # Tasks created meanwhile copied the context, close it for them.
+                request.open = False
+                _active_request.reset(token)
+
+    def _request_key(self) -> Any:
+        # Returns the key of the request that is creating instances.
+        request = _active_request.get()
+        if request is None or request.key is _NO_KEY:
+            raise PyIOC3Error(
+                "A keyed binding was resolved without a key."
+                " Use get(annotation, key=...)."
+            )
+        return request.key
+
+    def _lookup(self, annotation: Any, graph: "_GraphVersion") -> BoundMember:
+        # Returns the linked and validated member bound to the annotation.
         try:
-            member = self._bound_members[annotation]
+            member = KeyedAnnotation.lookup(graph.bound_members, annotation)
         except KeyError:
             raise _MemberNotBoundErrorAsKeyError(f"{annotation} is not bound.")
+        if not graph.complete and member not in self._validated:
+            self._link(member, graph)
+        return member
+
+    def _resolve(
+        self,
+        members: Sequence[BoundMember],
+        graph: "_GraphVersion",
+        key: Any = _NO_KEY,
+    ) -> List[Any]:
+        # Resolves the members in one request, or in the request of the get()
+        # that is creating instances in the current context. Requests with a key
+        # always start a new request. get() inlines this for a single member.
+        request = _active_request.get()
+        if (
+            key is _NO_KEY
+            and request is not None
+            and request.graph is graph
+            and request.open
+        ):
+            for member in members:
+                self._populate(request.scope, member)
+            return [request.scope.get_instance_of(member) for member in members]
+
+        request = _ActiveRequest(graph, ScopeContainer(graph.singletons), key)
+        token = _active_request.set(request)
+        try:
+            for member in members:
+                self._populate(request.scope, member)
+            return [request.scope.get_instance_of(member) for member in members]
+        finally:
+            # Tasks created meanwhile copied the context, close it for them.
+            request.open = False
+            _active_request.reset(token)
+
+    def get_batch(self, annotation: Type[PROVIDER_T], n: int) -> List[PROVIDER_T]:
+        """
+        Create n instances of the specified annotation in one request.
+
+        The SINGLETON and REQUESTED members reachable from the annotation are
+        resolved once and shared by every instance. Only the TRANSIENT part of the
+        dependency graph is created again for each instance, by replaying a plan
+        computed once for the batch instead of traversing the graph and allocating
+        a request scope per instance.
+
+        Args:
+            annotation (Type[PROVIDER_T]): The annotation to create.
+            n (int): The number of instances.
+
+        Returns:
+            List[PROVIDER_T]: The instances. If the annotation itself is not
+            TRANSIENT, the same instance n times.
+
+        Raises:
+            PyIOC3Error: If n is negative.
+            MemberNotBoundError: If the requested annotation is not bound.
+            CircularDependencyError: If its dependencies contain a cycle.
+
+        Example:
+            ```python
+            processors = container.get_batch(RecordProcessor, len(records))
+            ```
+        """
+        if n < 0:
+            raise PyIOC3Error(f"Cannot create a batch of {n} instances.")
+        return list(islice(self.iter(annotation), n))
+
+    def iter(self, annotation: Type[PROVIDER_T]) -> Iterator[PROVIDER_T]:
+        """
+        Yield new instances of the specified annotation, without end.
+
+        This is the streaming form of `get_batch`. The shared members are resolved
+        when the first instance is requested, and every instance belongs to the
+        same request, so REQUESTED members are shared by all of them.
+
+        Args:
+            annotation (Type[PROVIDER_T]): The annotation to create.
+
+        Yields:
+            PROVIDER_T: A new instance for each iteration.
+
+        Raises:
+            MemberNotBoundError: If the requested annotation is not bound.
+            CircularDependencyError: If its dependencies contain a cycle.
+
+        Example:
+            ```python
+            for record, processor in zip(records, container.iter(RecordProcessor)):
+                processor.process(record)
+            ```
+        """
+        if self._override_count:
+            active = _active_overrides.get()
+            if active is not None and self in active:
+                yield from active[self].get_container().iter(annotation)
+                return
+
+        graph = self._graph
+        member = self._lookup(annotation, graph)
+        shared, steps, root = StaticContainer._plan_batch(member)
+
+        request = _ActiveRequest(graph, ScopeContainer(graph.singletons))
+        token = _active_request.set(request)
+        try:
+            for m in shared:
+                self._populate(request.scope, m)
+            values = [request.scope.get_instance_of(m) for m in shared]
+        finally:
+            _active_request.reset(token)
+
+        try:
+            while True:
+                # Nested get() calls made by the members share the request.
+                token = _active_request.set(request)
+                try:
+                    instances = values[:]
+                    for implementation, on_activate, refs in steps:
+                        instances.append(
+                            on_activate(implementation(*[instances[i] for i in refs]))
+                        )
+                finally:
+                    _active_request.reset(token)
+                yield instances[root]
+        finally:
+            request.open = False
+
+    @staticmethod
+    def _plan_batch(member: BoundMember):
+        # Splits the subgraph of the member into the non-transient members, which
+        # are resolved once, and the steps that create the transient members in
+        # post-order. Each step reads its arguments by index from a list holding
+        # the shared values followed by the results of the previous steps.
+        shared = {}
+        planned = []
+        stack = [(member, False)]
+        refs = []
+        while stack:
+            m, visited = stack.pop()
+            if m.scope != ScopeEnum.TRANSIENT:
+                refs.append(("shared", shared.setdefault(m, len(shared))))
+            elif not visited:
+                stack.append((m, True))
+                stack.extend((d, False) for d in reversed(list(m)))
+            else:
+                start = len(refs) - len(m.parameters)
+                planned.append((m, refs[start:]))
+                del refs[start:]
+                refs.append(("step", len(planned) - 1))
+
+        offset = len(shared)
+
+        def index(ref):
+            return ref[1] if ref[0] == "shared" else offset + ref[1]
+
+        steps = [
+            (m.implementation, m.on_activate, [index(r) for r in args])
+            for m, args in planned
+        ]
+        return list(shared), steps, index(refs[-1])
+
+    def validate(self) -> None:
+        """
+        Link every deferred member and check the whole graph for cycles.
+
+        Lazy bindings are imported and introspected by this call. Use it in tests
+        or at startup to surface binding errors without waiting for the first `get`.
+
+        Raises:
+            MemberNotBoundError: If a member depends on an unbound annotation.
+            CircularDependencyError: If the graph contains a cycle.
+            LazyBindingError: If a lazy binding cannot be imported.
+        """
+        graph = self._graph
+        if graph.complete:
+            return
+        for member in list(graph.bound_members.values()):
+            if member not in self._validated:
+                self._link(member, graph)
+        graph.complete = True
+
+    def child(self, overrides: Optional[List[Binding]] = None) -> "StaticContainer":
+        """
+        Create an overlay container that replaces some bindings.
+
+        The child reuses the linked graph and the singleton cache of this container.
+        Only the overridden members and the members that depend on them, directly
+        or transitively, are replanned, and only their singletons are cached
+        separately. Creating a child costs time proportional to that subgraph.
+        Factories and members that inject the container are always replanned so
+        they receive the child. Later calls to `rebind` on this container do not
+        affect the child.
+
+        The graph of this container is validated once, on the first call, so lazy
+        bindings are imported and linked.
+
+        Args:
+            overrides (Optional[List[Binding]]): The bindings to replace or add.
+
+        Returns:
+            StaticContainer: The child container.
+
+        Raises:
+            MemberNotBoundError: If an override depends on an unbound annotation.
+            CircularDependencyError: If an override introduces a cycle.
+            PyIOC3Error: If an override is a MultiBinding. Override an element with
+                a binding for MultiElement(T, index), or the whole collection with
+                a CollectionBinding.
+
+        Example:
+            ```python
+            tenant = container.child([
+                ProviderBinding(StorageInterface, TenantStorage, "singleton"),
+            ])
+            storage = tenant.get(StorageInterface)
+            ```
+        """
+        from .static_container_builder import StaticContainerBuilder
+
+        self.validate()
+        graph = self._graph
+        replacements = {
+            binding.annotation: BoundMemberFactory.build(binding)
+            for binding in overrides or []
+        }
+        affected = GraphPatcher.affected(
+            graph.get_dependents(), [*replacements, Container, StaticContainer]
+        )
+
+        patched = {}
+        maps = getattr(graph.bound_members, "maps", [graph.bound_members])
+        child = StaticContainer(
+            ChainMap(patched, *maps), OverlayScope(graph.singletons, affected)
+        )
+        replacements.update(StaticContainerBuilder._container_members(child))
+        patched.update(GraphPatcher.patch(graph.bound_members, replacements, affected))
+        child._complete = all(m.parameters is not None for m in patched.values())
+        return child
+
+    def rebind(self, overrides: List[Binding]) -> None:
+        """
+        Replace bindings by publishing a new version of the dependency graph.
+
+        The current graph is never modified. The overridden members and the members
+        that depend on them are replanned into a copy of the graph, which is then
+        published with a single assignment, so readers take no lock. Calls to `get`
+        that already started finish on the previous version and later calls see
+        the new one. Only the singletons of the replanned members are created
+        again; every other singleton is carried over.
+
+        The graph is validated once, on the first call, so lazy bindings are
+        imported and linked. Concurrent calls to `rebind` are serialized.
+
+        Args:
+            overrides (List[Binding]): The bindings to replace or add.
+
+        Raises:
+            MemberNotBoundError: If an override depends on an unbound annotation.
+            CircularDependencyError: If an override introduces a cycle.
+            PyIOC3Error: If an override is a MultiBinding. Override an element with
+                a binding for MultiElement(T, index), or the whole collection with
+                a CollectionBinding.
+
+        Example:
+            ```python
+            # Switch to the fallback backend during an incident.
+            container.rebind([
+                ProviderBinding(BackendInterface, FallbackBackend, "singleton"),
+            ])
+            ```
+        """
+        with self._lock:
+            self.validate()
+            graph = self._graph
+            replacements = {
+                binding.annotation: BoundMemberFactory.build(binding)
+                for binding in overrides
+            }
+            affected = GraphPatcher.affected(graph.get_dependents(), replacements)
+            patched = GraphPatcher.patch(graph.bound_members, replacements, affected)
+
+            bound_members = dict(graph.bound_members)
+            bound_members.update(patched)
+            version = _GraphVersion(
+                bound_members,
+                VersionedScope.derive(graph.singletons, affected),
+            )
+            version.complete = all(m.parameters is not None for m in patched.values())
+            self._graph = version
+
+    def override(
+        self,
+        annotation: Any,
+        implementation: Optional[Any] = None,
+        scope: Optional[Union[str, ScopeEnum]] = None,
+        on_activate: Optional[Callable[[PROVIDER_T], PROVIDER_T]] = None,
+    ) -> "ContainerOverride":
+        """
+        Replace a binding within the current thread or context only.
+
+        The returned context manager activates the override for the current
+        contextvars context, which is the current thread or asyncio task. Entering
+        it takes constant time. The overlay container is created by `child` on the
+        first `get` inside the block, and dependents of the overridden annotation
+        are resolved with the override. Other threads and tasks keep using this
+        container unchanged, and while no override is active `get` pays a single
+        attribute check.
+
+        Overrides nest. The innermost override of an annotation wins.
+
+        Args:
+            annotation (Any): The annotation to override, or a complete Binding such
+                as `ConstantBinding(mock, Service)` to override with a constant or
+                a factory.
+            implementation (Optional[Any]): The implementation of a provider
+                binding. Defaults to the annotation.
+            scope (Optional[Union[str, ScopeEnum]]): The scope of a provider
+                binding. Defaults to transient.
+            on_activate (Optional[Callable[[PROVIDER_T], PROVIDER_T]]): An optional
+                activation callback for a provider binding.
+
+        Returns:
+            ContainerOverride: A single use context manager.
+
+        Raises:
+            PyIOC3Error: If the annotation is a MultiBinding.
+
+        Example:
+            ```python
+            with container.override(ConstantBinding(mock_mailer, MailerInterface)):
+                container.get(SignupService).register("duck@pond.org")
+                mock_mailer.send.assert_called_once()
+            ```
+        """
+        if isinstance(annotation, MultiBinding):
+            raise PyIOC3Error(BoundMemberFactory._MULTI_BINDING_UNSUPPORTED)
+        elif isinstance(
+            annotation,
+            (
+                ProviderBinding,
+                ConstantBinding,
+                FactoryBinding,
+                MmapBinding,
+                SharedMemoryBinding,
+                LazyConstantBinding,
+                AssistedBinding,
+                CollectionBinding,
+                KeyedBinding,
+                PrefetchBinding,
+            ),
+        ):
+            binding = annotation
         else:
-            scope = self._build_scope(member)
-            return scope.get_instance_of(member)
+            binding = ProviderBinding(
+                annotation=annotation,
+                implementation=implementation,
+                scope=scope,
+                on_activate=on_activate,
+            )
+        return ContainerOverride(self, [binding])
+
+    def inject(self, fn: Callable) -> Callable:
+        """
+        Decorate a function whose annotated parameters are injected.
+
+        The function is introspected once, here. Each call resolves the parameters
+        whose annotation is bound in this container and that the caller did not
+        pass, from a plan that is linked on the first call and kept until the
+        container publishes a new graph version. See `Injector`.
+
+        Args:
+            fn (Callable): A function, method or coroutine function.
+
+        Returns:
+            Callable: The wrapped function.
+
+        Example:
+            ```python
+            @container.inject
+            def handle(task_id: str, mailer: Mailer):
+                mailer.send(task_id)
+
+            handle("t-1")
+            ```
+        """
+        from .injector import Injector
+
+        return Injector(self)(fn)
+
+    def warm_up(self, annotations: Optional[Iterable[Any]] = None) -> None:
+        """
+        Create singletons ahead of time, typically before forking workers.
+
+        Singletons created before the process forks are inherited by the workers,
+        and their memory is shared copy-on-write instead of being allocated again
+        by each worker. Singletons whose fork policy is REINITIALIZE or LAZY are
+        created again in every worker, and so are the singletons that depend on
+        them, so they are skipped unless they are requested explicitly.
+
+        Args:
+            annotations (Optional[Iterable[Any]]): The annotations to resolve.
+                Defaults to every singleton whose fork policy is SHARE and that
+                does not depend, directly or transitively, on a member whose
+                fork policy is not.
+
+        Raises:
+            MemberNotBoundError: If an annotation is not bound.
+            CircularDependencyError: If the dependencies of an annotation contain
+                a cycle.
+            LazyBindingError: If a lazy binding cannot be imported.
+
+        Example:
+            ```python
+            # gunicorn.conf.py with preload_app = True
+            container = builder.build()
+            container.warm_up()
+            gc.freeze()
+            ```
+        """
+        if annotations is None:
+            self.validate()
+            graph = self._graph
+            unsafe = GraphPatcher.affected(
+                graph.get_dependents(),
+                [
+                    annotation
+                    for annotation, member in graph.bound_members.items()
+                    if member.fork_policy != ForkPolicy.SHARE
+                ],
+            )
+            annotations = [
+                annotation
+                for annotation, member in list(graph.bound_members.items())
+                if member.scope == ScopeEnum.SINGLETON and annotation not in unsafe
+            ]
+        for annotation in annotations:
+            self.get(annotation)
+
+    def close(self) -> None:
+        """
+        Release the resources held by the bindings of the container.
+
+        Memory-mapped files are unmapped, and shared memory blocks are closed and,
+        in the process that created them, unlinked. Values resolved from those
+        bindings must not be used afterwards. Children share the resources of their
+        parent, so close the container returned by `build()`, once, at shutdown.
+
+        The singletons of the container are discarded first, so values decoded
+        from those resources are collected before they are released.
+        """
+        with self._lock:
+            graph = self._graph
+            version = _GraphVersion(graph.bound_members, PersistentScope())
+            version.complete = graph.complete
+            self._graph = version
+        for member in list(version.bound_members.values()):
+            if isinstance(member.implementation, ResourceAdapter):
+                member.implementation.release()
+
+    def _after_fork(self) -> None:
+        # Runs in the child process. The lock may have been held by another thread
+        # of the parent, which does not exist in the child.
+        self._lock = RLock()
+        graph = self._graph
+        unsafe = [
+            member
+            for member in graph.bound_members.values()
+            if member.scope == ScopeEnum.SINGLETON
+            and member.fork_policy != ForkPolicy.SHARE
+        ]
+        if not unsafe:
+            return
+
+        dependents = (
+            graph.get_dependents()
+            if graph.complete
+            else GraphPatcher.dependents(graph.bound_members)
+        )
+        affected = GraphPatcher.affected(dependents, [m.annotation for m in unsafe])
+        version = _GraphVersion(
+            graph.bound_members,
+            VersionedScope.derive(graph.singletons, affected),
+        )
+        version.complete = graph.complete
+        self._graph = version
+
+        for member in unsafe:
+            if member.fork_policy == ForkPolicy.REINITIALIZE:
+                if not version.complete and member not in self._validated:
+                    self._link(member, version)
+                scope = self._build_scope(member, version.singletons)
+                scope.get_instance_of(member)
+
+    def __reduce__(self):
+        """
+        Pickle the container as a ContainerSpec.
+
+        Unpickling rebuilds the container from the spec. Singleton instances and
+        active overrides are not carried over.
+
+        Returns:
+            tuple: The callable and arguments that rebuild the container.
+        """
+        from .container_spec import ContainerSpec
+
+        return (ContainerSpec.build, (ContainerSpec.from_container(self),))
+
+
+class ContainerOverride:
+    """
+    ContainerOverride is the context manager returned by `StaticContainer.override`.
+
+    Entering it registers the override for the current contextvars context and
+    leaving it restores the previous state. The overlay container that resolves
+    the overridden graph is created on first use and lives as long as the block.
+
+    Args:
+        container (StaticContainer): The overridden container.
+        bindings (List[Binding]): The overriding bindings.
+
+    Methods:
+        get_container() -> StaticContainer:
+            Returns the overlay container that resolves the overridden graph.
+    """
+
+    def __init__(self, container: StaticContainer, bindings: List[Binding]):
+        self._container = container
+        self._bindings = bindings
+        self._enclosing: Optional[ContainerOverride] = None
+        self._child: Optional[StaticContainer] = None
+        self._token = None
+
+    def __enter__(self) -> "ContainerOverride":
+        active = _active_overrides.get() or {}
+        self._enclosing = active.get(self._container)
+        self._token = _active_overrides.set({**active, self._container: self})
+        with self._container._lock:
+            self._container._override_count += 1
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        _active_overrides.reset(self._token)
+        with self._container._lock:
+            self._container._override_count -= 1
+
+    def get_container(self) -> StaticContainer:
+        """
+        Returns the overlay container that resolves the overridden graph.
+
+        Returns:
+            StaticContainer: A child of the container, or of the enclosing
+            override's container if overrides are nested.
+        """
+        if self._child is None:
+            with self._container._lock:
+                if self._child is None:
+                    base = (
+                        self._enclosing.get_container()
+                        if self._enclosing is not None
+                        else self._container
+                    )
+                    self._child = base.child(self._bindings)
+        return self._child
+
+
+class _ActiveRequest:
+    # The request scope of a running get(), shared by the nested get() calls made
+    # while it creates instances.
+
+    __slots__ = ("graph", "scope", "open", "key")
+
+    def __init__(
+        self, graph: "_GraphVersion", scope: ScopeContainer, key: Any = _NO_KEY
+    ):
+        self.graph = graph
+        self.scope = scope
+        self.open = True
+        self.key = key
+
+
+class _GraphVersion:
+    # One immutable version of the dependency graph of a StaticContainer. The
+    # container publishes a new version by replacing its reference.
+
+    def __init__(
+        self,
+        bound_members: Mapping[Type[PROVIDER_T], BoundMember],
+        singletons: Scope,
+    ):
+        self.bound_members = bound_members
+        self.singletons = singletons
+        self.complete = False
+        self._dependents: Optional[Dict[Any, Set[Any]]] = None
+
+    def get_dependents(self) -> Dict[Any, Set[Any]]:
+        if self._dependents is None:
+            self._dependents = GraphPatcher.dependents(self.bound_members)
+        return self._dependents
+
+
+def _after_fork_in_child() -> None:
+    for container in list(_containers):
+        try:
+            container._after_fork()
+        except Exception as ex:
+            # The member is created again on its first get instead.
+            warnings.warn(
+                f"Failed to reinitialize a singleton after fork: {ex!r}",
+                RuntimeWarning,
+            )
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -1,17 +1,36 @@
-from typing import Dict, Union, Type, Callable, Optional, List
+import sys
+from typing import Any, Dict, Union, Type, Callable, Optional, List, Sequence, Tuple
 
+from .bound_member import BoundMember
 from .bound_member_factory import BoundMemberFactory
-from .errors import CircularDependencyError, _MemberNotBoundErrorAsKeyError
+from .keyed_annotation import KeyedAnnotation
+from .errors import (
+    CircularDependencyError,
+    PyIOC3Error,
+    _MemberNotBoundErrorAsKeyError,
+)
+from .keyed_scope_test import KeyedScopeTest
 from .queued_cycle_test import QueuedCycleTest
+from .fork_policy import ForkPolicy
 from .scope_enum import ScopeEnum
 from .static_container import StaticContainer
 from .interface import (
+    AssistedBinding,
+    CollectionBinding,
     ConstantBinding,
     Container,
     ContainerBuilder,
     FACTORY_T,
+    Factory,
     FactoryBinding,
+    KeyedBinding,
+    LazyConstantBinding,
+    MmapBinding,
+    MultiBinding,
+    MultiElement,
+    PrefetchBinding,
     PROVIDER_T,
+    SharedMemoryBinding,
     ProviderBinding,
     Binding,
 )
@@ -34,14 +53,18 @@ class StaticContainerBuilder(ContainerBuilder):
         """
         self._bindings: Dict[Type[PROVIDER_T], Binding] = {}
         for binding in bindings or []:
-            self._bindings[binding.annotation] = binding
+            if isinstance(binding, MultiBinding):
+                self._add_element(binding)
+            else:
+                self._bindings[binding.annotation] = binding
 
     def bind(
         self,
         annotation: Type[PROVIDER_T],
-        implementation: Optional[Type[PROVIDER_T]] = None,
+        implementation: Optional[Union[Type[PROVIDER_T], str]] = None,
         scope: Union[str, ScopeEnum] = ScopeEnum.TRANSIENT,
         on_activate: Callable[[PROVIDER_T], PROVIDER_T] = None,
+        fork_policy: Union[str, ForkPolicy] = ForkPolicy.SHARE,
     ) -> "StaticContainerBuilder":
         """Bind a class.
 
@@ -56,6 +79,9 @@ class StaticContainerBuilder(ContainerBuilder):
           implementation: Optional: A callable type who's result will be stored return
                           and stored according to the scope. If implementation is not
                           inlcuded Annotation will be used in it's place.
+                          An import path such as "package.module:Class" binds
+                          lazily: the module is imported and the implementation
+                          introspected when the binding is first resolved.
 
           scope:          Optional: Identifies how the object should be cached.
                           Options are Transient, Requested, Singleton
@@ -66,6 +92,10 @@ class StaticContainerBuilder(ContainerBuilder):
                           or given as the return in container.get()
                           Default: None.
 
+          fork_policy:    Optional: What happens to a singleton instance when the
+                          process forks. Options are Share, Reinitialize, Lazy.
+                          Default: Share.
+
         Scopes:
             Transient scopes and not cached.
             Requested scopes are cached during the current execution of a container.get call.
@@ -81,6 +111,11 @@ class StaticContainerBuilder(ContainerBuilder):
                 annotation="duck",
                 implementation=Duck)
 
+            ioc_builder.bind(
+                annotation="reports.Renderer",
+                implementation="myapp.reports.pdf:PdfRenderer",
+                scope="singleton")
+
         Returns:
             StaticContainerBuilder
         """
@@ -89,6 +124,140 @@ class StaticContainerBuilder(ContainerBuilder):
             annotation=annotation,
             scope=scope,
             on_activate=on_activate,
+            fork_policy=fork_policy,
+        )
+        return self
+
+    def bind_multi(
+        self,
+        annotation: Type[PROVIDER_T],
+        implementation: Optional[Union[Type[PROVIDER_T], str]] = None,
+        scope: Union[str, ScopeEnum] = ScopeEnum.TRANSIENT,
+        on_activate: Callable[[PROVIDER_T], PROVIDER_T] = None,
+        fork_policy: Union[str, ForkPolicy] = ForkPolicy.SHARE,
+    ) -> "StaticContainerBuilder":
+        """Add a class to a multi-binding.
+
+        Every implementation bound with bind_multi for the same annotation is
+        injected, in the order it was bound, into parameters annotated as
+        List[annotation] or Tuple[annotation, ...] (and list[annotation] or
+        tuple[annotation, ...] on Python 3.9+). Each element is a member of the
+        dependency graph with its own scope, and the whole collection is created
+        in one pass with the rest of the request. A new list or tuple is created
+        for every injection.
+
+        Arguments:
+          annotation:     The element type of the collection.
+
+          implementation: Optional: The class of the element. Default: The
+                          annotation. An import path binds lazily, as with bind.
+
+          scope:          Optional: The scope of the element.
+                          Default: Transient.
+
+          on_activate:    Optional: A function called with the new element.
+                          Default: None.
+
+          fork_policy:    Optional: What happens to a singleton element when the
+                          process forks. Default: Share.
+
+        Example:
+
+            ioc_builder.bind_multi(Middleware, AuthMiddleware, "singleton")
+            ioc_builder.bind_multi(Middleware, LoggingMiddleware)
+
+            class Pipeline:
+                def __init__(self, middleware: List[Middleware]): ...
+
+        Returns:
+            StaticContainerBuilder
+        """
+        self._add_element(
+            MultiBinding(
+                annotation=annotation,
+                implementation=implementation,
+                scope=scope,
+                on_activate=on_activate,
+                fork_policy=fork_policy,
+            )
+        )
+        return self
+
+    def _add_element(self, binding: MultiBinding) -> None:
+        # Each element is bound to its own key. The collections depend on the keys.
+        collections = StaticContainerBuilder._collection_annotations(binding.annotation)
+        existing = self._bindings.get(collections[0][0])
+        elements = existing.elements if isinstance(existing, CollectionBinding) else ()
+        key = MultiElement(binding.annotation, len(elements))
+        self._bindings[key] = ProviderBinding(
+            annotation=key,
+            implementation=binding.implementation or binding.annotation,
+            scope=binding.scope,
+            on_activate=binding.on_activate,
+            fork_policy=binding.fork_policy,
+        )
+        for annotation, collection in collections:
+            self._bindings[annotation] = CollectionBinding(
+                annotation=annotation,
+                elements=(*elements, key),
+                collection=collection,
+            )
+
+    @staticmethod
+    def _collection_annotations(annotation: Any) -> List[Tuple[Any, type]]:
+        ret = [(List[annotation], list), (Tuple[annotation, ...], tuple)]
+        if sys.version_info >= (3, 9):
+            ret += [(list[annotation], list), (tuple[annotation, ...], tuple)]
+        return ret
+
+    def bind_prefetched(
+        self,
+        annotation: Type[PROVIDER_T],
+        implementation: Optional[Callable[..., PROVIDER_T]] = None,
+        size: int = 4,
+        on_activate: Callable[[PROVIDER_T], PROVIDER_T] = None,
+    ) -> "StaticContainerBuilder":
+        """Bind a transient class that is created ahead of time
+
+        For transients with slow constructors. A daemon thread, started on the
+        first resolution, keeps up to size new instances ready, each created
+        with its injected parameters like any other transient. Resolving the
+        annotation takes a ready instance, or creates one inline if none is
+        ready, so construction leaves the caller's critical path. Instances are
+        never reused.
+
+        The instances are created outside of the caller's request, so REQUESTED
+        dependencies are not shared with it. The thread is replaced when the
+        container publishes a new graph version or the process forks, stopped
+        by container.close(), and ends once the container is garbage collected.
+        The injected parameters are still checked for missing bindings and
+        cycles when the container is built.
+
+        Arguments:
+          annotation:     The hint used to inject the instance.
+
+          implementation: Optional: The class or function that creates the
+                          instances. Default: The annotation.
+
+          size:           Optional: The number of instances kept ready.
+                          Default: 4.
+
+          on_activate:    Optional: A function called with each instance when
+                          it is resolved, on the caller's thread.
+                          Default: None.
+
+        Example:
+
+            ioc_builder.bind_prefetched(ReportRenderer, size=8)
+
+        Returns:
+            StaticContainerBuilder
+        """
+        self._bindings[annotation] = PrefetchBinding(
+            annotation=annotation,
+            implementation=implementation,
+            size=size,
+            on_activate=on_activate,
         )
         return self
 
@@ -156,46 +325,310 @@ class StaticContainerBuilder(ContainerBuilder):
         )
         return self
 
-    def build(self) -> Container:
+    def bind_assisted(
+        self,
+        annotation: Type[PROVIDER_T],
+        implementation: Optional[Callable[..., PROVIDER_T]] = None,
+        assisted: Sequence[str] = (),
+    ) -> "StaticContainerBuilder":
+        """Bind an assisted factory
+
+        Binds Factory[annotation] to a factory that takes the assisted
+        arguments, by position or by name, and returns a new instance of the
+        implementation whose other parameters are injected by the container.
+        The implementation is introspected here, once. The factory resolves the
+        injected parameters from a plan that is linked on its first call, not
+        through container.get(). The injected parameters are still checked for
+        missing bindings and cycles when the container is built.
+
+        Arguments:
+          annotation:     The type created by the factory. The factory is
+                          injected as Factory[annotation].
+
+          implementation: Optional: The class or function that creates the
+                          instances. Default: The annotation.
+
+          assisted:       The names of the parameters passed by the caller.
+                          build() raises PyIOC3Error if one of them is not a
+                          parameter of the implementation.
+
+        Example:
+
+            class Handler:
+                def __init__(self, request_id: str, repository: Repository): ...
+
+            ioc_builder.bind_assisted(Handler, assisted=["request_id"])
+
+            handler = ioc.get(Factory[Handler])("req-1")
+
+        Returns:
+            StaticContainerBuilder
+        """
+        binding = AssistedBinding(
+            annotation=Factory[annotation],
+            implementation=implementation or annotation,
+            assisted=tuple(assisted),
+        )
+        self._bindings[binding.annotation] = binding
+        return self
+
+    def bind_keyed(
+        self,
+        annotation: Type[PROVIDER_T],
+        implementation: Optional[Callable[..., PROVIDER_T]] = None,
+        key: str = "key",
+        maxsize: Optional[int] = 128,
+        on_evict: Optional[Callable[[PROVIDER_T], None]] = None,
+    ) -> "StaticContainerBuilder":
+        """Bind a class that has one instance per request key
+
+        The instance is selected by the key of container.get(annotation,
+        key=...), or of the get() call whose request reaches the binding. It is
+        created on first use by passing the key to the parameter named by key
+        and injecting the other parameters, from a plan shared by every key, and
+        cached in a least recently used map. One binding serves any number of
+        keys, so adding a shard needs neither a binding nor a new container.
+
+        The cache of a container is emptied when it publishes a new graph
+        version, when the process forks and by container.close(). Members that
+        depend on a keyed binding must not be singletons: linking a singleton
+        that depends on one, directly or transitively, raises PyIOC3Error.
+
+        Arguments:
+          annotation:     The hint used to inject the instance.
+
+          implementation: Optional: The class or function that creates the
+                          instances. Default: The annotation.
+
+          key:            Optional: The name of the parameter that receives the
+                          key. Default: "key".
+
+          maxsize:        Optional: The number of instances kept, or None to
+                          keep every instance. Default: 128.
+
+          on_evict:       Optional: A function called with each instance dropped
+                          from the cache, for example to close it.
+                          Default: None.
+
+        Example:
+
+            class ShardClient:
+                def __init__(self, shard_id: str, config: Config): ...
+
+            ioc_builder.bind_keyed(
+                ShardClient, key="shard_id", maxsize=64, on_evict=ShardClient.close)
+
+            client = ioc.get(ShardClient, key="eu-1")
+
+        Returns:
+            StaticContainerBuilder
+        """
+        self._bindings[annotation] = KeyedBinding(
+            annotation=annotation,
+            implementation=implementation,
+            key=key,
+            maxsize=maxsize,
+            on_evict=on_evict,
+        )
+        return self
+
+    def bind_lazy_constant(
+        self,
+        annotation: Type[PROVIDER_T],
+        loader: Callable[[], PROVIDER_T],
+    ) -> "StaticContainerBuilder":
+        """Bind a constant value loaded on first use
+
+        The loader runs once, on the first resolution of the annotation, even if
+        several threads resolve it concurrently. Its result is cached like a
+        singleton. If the loader raises, the next resolution runs it again.
+
+        If the loader is a coroutine function, the injected value is an
+        awaitable. Awaiting it runs the loader once and returns its result.
+
+        Arguments:
+          annotation: The hint used to inject the constant
+          loader:     A function, or coroutine function, without arguments that
+                      returns the value.
+
+        Example:
+
+            ioc_builder.bind_lazy_constant(
+                annotation="words",
+                loader=lambda: Path("words.txt").read_text().split())
+
+            async def load_model():
+                return await storage.fetch("model.bin")
+
+            ioc_builder.bind_lazy_constant(
+                annotation="model",
+                loader=load_model)
+
+            model = await ioc.get("model")
+
+        Returns:
+            StaticContainerBuilder
+        """
+        self._bindings[annotation] = LazyConstantBinding(
+            loader=loader,
+            annotation=annotation,
+        )
+        return self
+
+    def bind_mmap_constant(
+        self,
+        annotation: Type[PROVIDER_T],
+        path: str,
+        loader: Optional[Callable[[memoryview], PROVIDER_T]] = None,
+    ) -> "StaticContainerBuilder":
+        """Bind a read-only memory-mapped file
+
+        The file is mapped on first resolution and kept as a singleton. The
+        injected value is a read-only memoryview of the mapping, or the result of
+        passing that memoryview to the loader. Nothing is copied into the heap, so
+        worker processes share one page cache copy of the file. The mapping is
+        closed by container.close().
+
+        Arguments:
+          annotation: The hint used to inject the constant
+          path:       The path of the file to map.
+          loader:     Optional: A function that decodes the memoryview. Keep
+                      the decoded value zero-copy, for example with
+                      memoryview.cast() or numpy.frombuffer().
+                      Default: None.
+
+        Example:
+
+            ioc_builder.bind_mmap_constant(
+                annotation="embeddings",
+                path="/srv/model/embeddings.f32",
+                loader=lambda buf: buf.cast("f"))
+
+        Returns:
+            StaticContainerBuilder
+        """
+        self._bindings[annotation] = MmapBinding(
+            path=path,
+            annotation=annotation,
+            loader=loader,
+        )
+        return self
+
+    def bind_shared_constant(
+        self,
+        annotation: Type[PROVIDER_T],
+        value: Any,
+        loader: Optional[Callable[[memoryview], PROVIDER_T]] = None,
+    ) -> "StaticContainerBuilder":
+        """Bind a constant placed in shared memory
+
+        On first resolution, or when the container is pickled for worker
+        processes, the value is copied once into a multiprocessing.shared_memory
+        block. The injected value is a read-only memoryview of the block, or the
+        result of passing that memoryview to the loader. Containers unpickled in
+        worker processes attach to the block by name instead of receiving a copy
+        of the value. The process that created the block unlinks it on
+        container.close().
+
+        Each container built by this builder creates its own block.
+
+        Arguments:
+          annotation: The hint used to inject the constant
+          value:      A bytes-like object, such as bytes, an array or a NumPy
+                      array.
+          loader:     Optional: A function that decodes the memoryview. It must
+                      be importable to pickle the container. Keep the decoded
+                      value zero-copy, for example with numpy.frombuffer().
+                      Default: None.
+
+        Example:
+
+            ioc_builder.bind_shared_constant(
+                annotation="weights",
+                value=weights,
+                loader=decode_weights)
+
+        Returns:
+            StaticContainerBuilder
+        """
+        self._bindings[annotation] = SharedMemoryBinding(
+            value=value,
+            annotation=annotation,
+            loader=loader,
+        )
+        return self
+
+    def build(self, validate: Optional[str] = None) -> Container:
         """Compute dependency graph and return the container
 
         This call will roll over all the objects and compute the dependants of each
         member. The container itself is also added to the graph and can thus be
         injected using it's Type as the annotation.
 
+        Arguments:
+          validate: Optional: How much of the graph is validated up front.
+                    None:   Every binding is introspected, linked and checked for
+                            cycles. Lazy import path bindings are linked on first
+                            use.
+                    "full": Like None, and lazy import path bindings are imported
+                            and linked too.
+                    "lazy": Nothing is introspected or linked. Each annotation is
+                            linked and checked for cycles on its first get(), along
+                            with the part of the graph it depends on.
+                    Default: None.
+
+        Raises:
+          MemberNotBoundError:     If a validated binding depends on an unbound
+                                   annotation.
+          CircularDependencyError: If the validated graph contains a cycle.
+          PyIOC3Error:             If the validation mode is unknown.
+
         Example:
             ioc_builder = StaticContainerBuilder()
             ioc = ioc_builder.build()
             container = ioc.get(Container)
             container == ioc ## True
+
+            # Only link what the command actually uses.
+            ioc = ioc_builder.build(validate="lazy")
         """
 
+        if validate not in (None, "full", "lazy"):
+            raise PyIOC3Error(f"Unknown validation mode '{validate}'.")
+
+        deferred = validate == "lazy"
         bound_members = {
-            binding.annotation: BoundMemberFactory.build(binding)
+            binding.annotation: BoundMemberFactory.build(binding, deferred)
             for binding in self._bindings.values()
         }
 
         container = StaticContainer(bound_members)
+        bound_members.update(StaticContainerBuilder._container_members(container))
 
-        bound_members[Container] = BoundMemberFactory.build(
-            ConstantBinding(
-                annotation=Container,
-                value=container,
-            )
-        )
-
-        # This is here for backwards compatability
-        bound_members[StaticContainer] = BoundMemberFactory.build(
-            ConstantBinding(
-                annotation=StaticContainer,
-                value=container,
-            )
-        )
+        if deferred:
+            return container
 
         for bound_member in bound_members.values():
+            if bound_member.parameters is None:
+                # Lazy bindings are linked by the container on first use.
+                continue
             for annotation in bound_member.parameters:
                 try:
-                    bound_member.bind_dependant(bound_members[annotation])
+                    bound_member.bind_dependant(
+                        KeyedAnnotation.lookup(bound_members, annotation)
+                    )
+                except KeyError:
+                    raise _MemberNotBoundErrorAsKeyError(
+                        f"Binding {bound_member.implementation} depends "
+                        f"on {annotation} which is not bound."
+                    )
+            for annotation in BoundMemberFactory.references(
+                bound_member.implementation
+            ):
+                try:
+                    bound_member.bind_reference(
+                        KeyedAnnotation.lookup(bound_members, annotation)
+                    )
                 except KeyError:
                     raise _MemberNotBoundErrorAsKeyError(
                         f"Binding {bound_member.implementation} depends "
@@ -210,4 +643,31 @@ class StaticContainerBuilder(ContainerBuilder):
                 + ", ".join([str(m.implementation) for m in cycle])
             )
 
+        captive = KeyedScopeTest.find_singleton(
+            m for m in bound_members.values() if m.parameters is not None
+        )
+        if captive:
+            raise PyIOC3Error(
+                f"Singleton {captive[0].implementation} depends on the keyed"
+                f" binding {captive[1].annotation}. Members that depend on a keyed"
+                " binding must not be singletons."
+            )
+
+        if validate == "full":
+            container.validate()
+        elif all(m.parameters is not None for m in bound_members.values()):
+            # The whole graph is linked and acyclic, skip the first use checks.
+            container._complete = True
+
         return container
+
+    @staticmethod
+    def _container_members(container: Container) -> Dict[Type, BoundMember]:
+        # The container itself is injectable as Container and, for backwards
+        # compatability, as StaticContainer.
+        return {
+            annotation: BoundMemberFactory.build(
+                ConstantBinding(annotation=annotation, value=container)
+            )
+            for annotation in (Container, StaticContainer)
+        }
@@ -0,0 +1,3 @@
+from .interface import DuckInterface
+
+__all__ = ["DuckInterface"]
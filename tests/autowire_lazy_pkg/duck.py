@@ -0,0 +1,11 @@
+from pyioc3 import autowire
+from .interface import DuckInterface, QuackInterface
+
+
+@autowire.bind(DuckInterface, scope="singleton")
+class Duck(DuckInterface):
+    def __init__(self, quack: "QuackInterface") -> None:
+        self._quack = quack
+
+    def quack(self) -> str:
+        return self._quack.quack()
@@ -0,0 +1,9 @@
+from pyioc3.autowire import bind
+from .interface import HeavyInterface
+
+
+@bind(HeavyInterface)
+class Heavy(HeavyInterface): ...
+
+
+raise RuntimeError("This should not be imported")
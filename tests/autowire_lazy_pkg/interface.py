@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+
+
+class DuckInterface(ABC):
+    @abstractmethod
+    def quack(self) -> str: ...
+
+
+class QuackInterface(ABC):
+    @abstractmethod
+    def quack(self) -> str: ...
+
+
+class HeavyInterface(ABC): ...
@@ -0,0 +1,8 @@
+from pyioc3.autowire import bind
+from . import interface
+
+
+@bind(interface.QuackInterface)
+class Squeak(interface.QuackInterface):
+    def quack(self) -> str:
+        return "Squeak"
@@ -0,0 +1,8 @@
+from pyioc3.autowire import bind
+
+
+class PluginDuck: ...
+
+
+@bind(PluginDuck)
+class RubberDuck(PluginDuck): ...
@@ -0,0 +1 @@
+raise RuntimeError("This should not be imported")
@@ -0,0 +1,39 @@
+from pyioc3 import Container, StaticContainerBuilder
+
+from .fixtures import DuckA, DuckInterface, QuackBehavior, Sqeak
+
+
+class Pond:
+    def __init__(self, duck: DuckInterface, name: "PondName"):
+        self.duck = duck
+        self.name = name
+
+
+class PondName(str): ...
+
+
+class Visit:
+    def __init__(self, pond: Pond, quack: QuackBehavior):
+        self.pond = pond
+        self.quack = quack
+
+
+def mark(instance):
+    instance.marked = True
+    return instance
+
+
+def visit_factory(ctx: Container):
+    return lambda: ctx.get(Visit)
+
+
+builder = (
+    StaticContainerBuilder()
+    .bind(DuckInterface, DuckA, "singleton", on_activate=mark)
+    .bind(QuackBehavior, Sqeak, "requested")
+    .bind(Pond)
+    .bind(Visit)
+    .bind_constant(PondName, "Walden")
+    .bind_constant("depth", 30)
+    .bind_factory("visit_factory", visit_factory)
+)
@@ -0,0 +1,11 @@
+from tests.lazy_bindings.interface import ChickenInterface, EggInterface
+
+
+class Chicken(ChickenInterface):
+    def __init__(self, egg: EggInterface):
+        self.egg = egg
+
+
+class Egg(EggInterface):
+    def __init__(self, chicken: ChickenInterface):
+        self.chicken = chicken
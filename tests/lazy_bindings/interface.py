@@ -0,0 +1,7 @@
+class RendererInterface: ...
+
+
+class ChickenInterface: ...
+
+
+class EggInterface: ...
@@ -0,0 +1,9 @@
+from tests.fixtures import QuackBehavior
+from tests.lazy_bindings.interface import RendererInterface
+
+
+class PdfRenderer(RendererInterface):
+    def __init__(self, quack: QuackBehavior):
+        self.quack = quack
+
+    class Options: ...
@@ -0,0 +1,129 @@
+import pickle
+from unittest import TestCase
+
+from pyioc3 import Container, Factory, StaticContainerBuilder
+from pyioc3.errors import CircularDependencyError, MemberNotBoundError, PyIOC3Error
+from pyioc3.interface import ProviderBinding
+
+from .fixtures import DuckA, DuckInterface, QuackBehavior, Sqeak
+
+
+class Session: ...
+
+
+class Handler:
+    def __init__(self, request_id: str, duck: DuckInterface, session: Session, payload):
+        self.request_id = request_id
+        self.duck = duck
+        self.session = session
+        self.payload = payload
+
+
+class Router:
+    def __init__(self, make_handler: Factory[Handler]):
+        self.make_handler = make_handler
+
+
+class Loop:
+    def __init__(self, name: str, router: "LoopRouter"):
+        self.router = router
+
+
+class LoopRouter:
+    def __init__(self, make_loop: Factory[Loop]):
+        self.make_loop = make_loop
+
+
+class Goose(DuckInterface):
+    def quack(self):
+        return "honk"
+
+
+class AssistedFactoryTest(TestCase):
+    def setUp(self):
+        self.container = (
+            StaticContainerBuilder()
+            .bind(DuckInterface, DuckA, "singleton")
+            .bind(QuackBehavior, Sqeak)
+            .bind(Session, scope="requested")
+            .bind(Router)
+            .bind_assisted(Handler, assisted=["request_id", "payload"])
+            .build()
+        )
+
+    def test_factory_mixes_runtime_arguments_and_dependencies(self):
+        make_handler = self.container.get(Router).make_handler
+        handler = make_handler("req-1", payload={"a": 1})
+        self.assertEqual(handler.request_id, "req-1")
+        self.assertDictEqual(handler.payload, {"a": 1})
+        self.assertIs(handler.duck, self.container.get(DuckInterface))
+        self.assertIsInstance(handler.session, Session)
+
+    def test_each_call_resolves_non_singletons_again(self):
+        make_handler = self.container.get(Factory[Handler])
+        self.assertIsNot(
+            make_handler("a", None).session, make_handler("b", None).session
+        )
+
+    def test_factory_is_a_singleton(self):
+        self.assertIs(
+            self.container.get(Router).make_handler,
+            self.container.get(Factory[Handler]),
+        )
+
+    def test_rejects_unknown_arguments(self):
+        make_handler = self.container.get(Factory[Handler])
+        with self.assertRaises(TypeError):
+            make_handler("a", None, "extra")
+        with self.assertRaises(TypeError):
+            make_handler("a", None, session=Session())
+
+    def test_factory_follows_rebind(self):
+        make_handler = self.container.get(Factory[Handler])
+        self.container.rebind([ProviderBinding(DuckInterface, Goose, "singleton")])
+        self.assertIsInstance(make_handler("a", None).duck, Goose)
+
+    def test_factory_of_child_uses_child(self):
+        child = self.container.child([ProviderBinding(DuckInterface, Goose)])
+        self.assertIsInstance(child.get(Factory[Handler])("a", None).duck, Goose)
+        self.assertIsInstance(child.get(Container), type(child))
+
+    def test_raises_on_unbound_dependencies_on_build(self):
+        builder = StaticContainerBuilder().bind_assisted(
+            Handler, assisted=["request_id", "payload"]
+        )
+        with self.assertRaises(MemberNotBoundError):
+            builder.build()
+
+    def test_raises_on_unbound_dependencies_on_first_lazy_get(self):
+        container = (
+            StaticContainerBuilder()
+            .bind_assisted(Handler, assisted=["request_id", "payload"])
+            .build(validate="lazy")
+        )
+        with self.assertRaises(MemberNotBoundError):
+            container.get(Factory[Handler])
+
+    def test_raises_on_cycle_through_factory_on_build(self):
+        builder = (
+            StaticContainerBuilder()
+            .bind(LoopRouter)
+            .bind_assisted(Loop, assisted=["name"])
+        )
+        with self.assertRaises(CircularDependencyError):
+            builder.build()
+
+    def test_raises_on_unknown_assisted_name(self):
+        builder = (
+            StaticContainerBuilder()
+            .bind(DuckInterface, DuckA)
+            .bind(QuackBehavior, Sqeak)
+            .bind(Session)
+            .bind_assisted(Handler, assisted=["request_id", "payload", "nope"])
+        )
+        with self.assertRaises(PyIOC3Error):
+            builder.build()
+
+    def test_spec_keeps_assisted_factories(self):
+        container = pickle.loads(pickle.dumps(self.container))
+        self.assertEqual(container.get(Factory[Handler])("a", 1).payload, 1)
@@ -1,20 +1,27 @@
+import os
+import sys
 from unittest import TestCase
 from pyioc3 import ScopeEnum
-from pyioc3.errors import AutoWireError
-from pyioc3.autowire import bind, bind_factory, AutoWireContainerBuilder
+from pyioc3.errors import AutoWireError, MemberNotBoundError
+from pyioc3.autowire import (
+    bind,
+    bind_factory,
+    AutoWireContainerBuilder,
+    ENTRY_POINT_GROUP,
+)
 from pyioc3.interface import ProviderBinding, FactoryBinding
 
 
 class AutoWireDecoratorTests(TestCase):
     def setUp(self):
-        AutoWireContainerBuilder._staged_bindings = []
+        AutoWireContainerBuilder.registry.reset()
 
     def test_binding_decorator_stages_binding_with_defaults(self):
         @bind()
         class MyClass: ...
 
         self.assertListEqual(
-            AutoWireContainerBuilder._staged_bindings,
+            list(AutoWireContainerBuilder.registry),
             [
                 (
                     "tests.test_autowire",
@@ -28,7 +35,7 @@ class AutoWireDecoratorTests(TestCase):
         class MyClass: ...
 
         self.assertListEqual(
-            AutoWireContainerBuilder._staged_bindings,
+            list(AutoWireContainerBuilder.registry),
             [
                 (
                     "tests.test_autowire",
@@ -44,7 +51,7 @@ class AutoWireDecoratorTests(TestCase):
         class MyClass: ...
 
         self.assertListEqual(
-            AutoWireContainerBuilder._staged_bindings,
+            list(AutoWireContainerBuilder.registry),
             [
                 (
                     "tests.test_autowire",
@@ -63,7 +70,7 @@ class AutoWireDecoratorTests(TestCase):
         class MyClass: ...
 
         self.assertListEqual(
-            AutoWireContainerBuilder._staged_bindings,
+            list(AutoWireContainerBuilder.registry),
             [
                 (
                     "tests.test_autowire",
@@ -82,7 +89,7 @@ class AutoWireDecoratorTests(TestCase):
             return wrapped
 
         self.assertListEqual(
-            AutoWireContainerBuilder._staged_bindings,
+            list(AutoWireContainerBuilder.registry),
             [
                 (
                     "tests.test_autowire",
@@ -103,7 +110,7 @@ class AutoWireDecoratorTests(TestCase):
 
 class AutoWireDiscoveryTests(TestCase):
     def setUp(self):
-        AutoWireContainerBuilder._staged_bindings = []
+        AutoWireContainerBuilder.registry.reset()
 
     def test_autowire_can_build_simple_module(self):
         output = []
@@ -165,3 +172,66 @@ class AutoWireDiscoveryTests(TestCase):
 
         with self.assertRaises(AutoWireError):
             AutoWireContainerBuilder("tests.test_autowire").build()
+
+    def test_autowire_selects_bindings_registered_under_package(self):
+        class Staged: ...
+
+        class Excluded: ...
+
+        registry = AutoWireContainerBuilder.registry
+        registry.register(
+            "tests.test_autowire.staged",
+            ProviderBinding(Staged, Staged, ScopeEnum.TRANSIENT, None),
+        )
+        registry.register(
+            "tests.test_autowire.excluded.inner",
+            ProviderBinding(Excluded, Excluded, ScopeEnum.TRANSIENT, None),
+        )
+        container = AutoWireContainerBuilder(
+            "tests.test_autowire", excludes=["tests.test_autowire.excluded"]
+        ).build()
+        self.assertIsInstance(container.get(Staged), Staged)
+        with self.assertRaises(MemberNotBoundError):
+            container.get(Excluded)
+
+
+class AutoWireEntryPointTests(TestCase):
+    DIST_PATH = os.path.join(os.path.dirname(__file__), "plugin_dist")
+
+    def setUp(self):
+        AutoWireContainerBuilder.registry.reset()
+        sys.modules.pop("tests.autowire_plugin.ducks", None)
+        sys.path.insert(0, self.DIST_PATH)
+
+    def tearDown(self):
+        sys.path.remove(self.DIST_PATH)
+
+    def test_autowire_imports_entry_point_modules(self):
+        container = AutoWireContainerBuilder(
+            entry_point_group=ENTRY_POINT_GROUP
+        ).build()
+
+        from tests.autowire_plugin.ducks import PluginDuck, RubberDuck
+
+        self.assertIsInstance(container.get(PluginDuck), RubberDuck)
+        self.assertNotIn("tests.autowire_plugin.unused", sys.modules)
+
+    def test_autowire_combines_modules_and_entry_points(self):
+        from tests.autowire_pkg.interface import GreeterInterface
+
+        builder = AutoWireContainerBuilder(
+            "tests.test_autowire", entry_point_group="pyioc3.bindings"
+        )
+        self.assertEqual(len(builder._bindings), 1)
+        self.assertNotIn(GreeterInterface, builder._bindings)
+
+    def test_autowire_excludes_entry_point_modules(self):
+        builder = AutoWireContainerBuilder(
+            entry_point_group="pyioc3.test_excluded",
+            excludes=["tests.autowire_plugin.unused"],
+        )
+        self.assertEqual(len(builder._bindings), 1)
+
+    def test_autowire_ignores_unknown_entry_point_groups(self):
+        builder = AutoWireContainerBuilder(entry_point_group="pyioc3.no_such_group")
+        self.assertDictEqual(builder._bindings, {})
@@ -0,0 +1,111 @@
+import sys
+from unittest import TestCase
+
+from pyioc3.autowire import AutoWireContainerBuilder
+from pyioc3.autowire_index import AutoWireIndex, IndexedBinding
+from pyioc3.errors import AutoWireError
+
+PKG = "tests.autowire_lazy_pkg"
+
+
+def unload(pkg):
+    # Unload binding modules so their decorators run again on import.
+    for name in [m for m in sys.modules if m.startswith(f"{pkg}.")]:
+        if name != f"{pkg}.interface":
+            del sys.modules[name]
+
+
+class AutoWireIndexTests(TestCase):
+    def setUp(self):
+        unload(PKG)
+        self.index = AutoWireIndex.scan([PKG], [])
+
+    def test_scan_does_not_import_modules(self):
+        self.assertNotIn(f"{PKG}.duck", sys.modules)
+        self.assertNotIn(f"{PKG}.heavy", sys.modules)
+
+    def test_scan_finds_decorated_classes(self):
+        self.assertTupleEqual(
+            self.index.records[f"{PKG}.duck"].bindings,
+            (
+                IndexedBinding(
+                    module=f"{PKG}.duck",
+                    qualname="Duck",
+                    kind="provider",
+                    provides=(f"{PKG}.interface.DuckInterface",),
+                    scope="singleton",
+                    depends=(f"{PKG}.interface.QuackInterface",),
+                ),
+            ),
+        )
+
+    def test_scan_resolves_attribute_annotations(self):
+        (binding,) = self.index.records[f"{PKG}.quack"].bindings
+        self.assertTupleEqual(binding.provides, (f"{PKG}.interface.QuackInterface",))
+
+    def test_scan_finds_factories(self):
+        index = AutoWireIndex.scan(
+            ["tests.autowire_pkg"], ["tests.autowire_pkg.script"]
+        )
+        (factory,) = [
+            b
+            for b in index.records["tests.autowire_pkg.formatter"].bindings
+            if b.kind == "factory"
+        ]
+        self.assertEqual(factory.qualname, "fomatter_factory")
+        self.assertEqual(factory.scope, "singleton")
+        self.assertIn("tests.autowire_pkg.formatter.Formatter_ES_MX", factory.depends)
+
+    def test_modules_for_follows_dependencies(self):
+        from tests.autowire_lazy_pkg.interface import DuckInterface
+
+        self.assertSetEqual(
+            self.index.modules_for([DuckInterface]),
+            {f"{PKG}.duck", f"{PKG}.quack"},
+        )
+
+    def test_modules_for_follows_reexported_names(self):
+        self.assertSetEqual(
+            self.index.modules_for([f"{PKG}.DuckInterface"]),
+            {f"{PKG}.duck", f"{PKG}.quack"},
+        )
+
+    def test_modules_for_without_roots_returns_all_binding_modules(self):
+        self.assertSetEqual(
+            self.index.modules_for(),
+            {f"{PKG}.duck", f"{PKG}.quack", f"{PKG}.heavy"},
+        )
+
+    def test_scan_raises_if_module_is_missing(self):
+        with self.assertRaises(AutoWireError):
+            AutoWireIndex.scan(["tests.no_such_module"], [])
+
+
+class AutoWireAstDiscoveryTests(TestCase):
+    def setUp(self):
+        AutoWireContainerBuilder.registry.reset()
+        unload(PKG)
+
+    def test_only_imports_reachable_modules(self):
+        from tests.autowire_lazy_pkg.interface import DuckInterface
+
+        container = AutoWireContainerBuilder(
+            PKG, roots=[DuckInterface], discovery="ast"
+        ).build()
+        self.assertEqual(container.get(DuckInterface).quack(), "Squeak")
+        self.assertNotIn(f"{PKG}.heavy", sys.modules)
+
+    def test_imports_all_binding_modules_without_roots(self):
+        with self.assertRaises(RuntimeError):
+            AutoWireContainerBuilder(PKG, discovery="ast")
+
+    def test_skips_modules_without_bindings(self):
+        from tests.autowire_pkg.interface import GreeterInterface
+
+        unload("tests.autowire_pkg")
+        builder = AutoWireContainerBuilder("tests.autowire_pkg", discovery="ast")
+        self.assertIn(GreeterInterface, builder._bindings)
+
+    def test_raises_on_unknown_discovery_mode(self):
+        with self.assertRaises(AutoWireError):
+            AutoWireContainerBuilder(PKG, discovery="magic")
@@ -0,0 +1,151 @@
+import importlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from unittest import TestCase
+
+from pyioc3.__main__ import main
+from pyioc3.autowire import AutoWireContainerBuilder
+from pyioc3.autowire_index import AutoWireIndex
+from pyioc3.autowire_manifest import AutoWireManifest
+from pyioc3.errors import AutoWireError
+
+PKG = "pyioc3_manifest_pkg"
+
+SOURCE = """
+from pyioc3.autowire import bind
+
+
+class Duck: ...
+
+
+@bind(Duck, scope="singleton")
+class Mallard(Duck): ...
+"""
+
+
+class AutoWireManifestTests(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.pkg = os.path.join(self.tmp.name, PKG)
+        os.mkdir(self.pkg)
+        open(os.path.join(self.pkg, "__init__.py"), "w").close()
+        with open(os.path.join(self.pkg, "ducks.py"), "w") as fh:
+            fh.write(SOURCE)
+        self.manifest = os.path.join(self.tmp.name, "manifest.json")
+        sys.path.insert(0, self.tmp.name)
+
+    def tearDown(self):
+        sys.path.remove(self.tmp.name)
+        for name in [m for m in sys.modules if m.split(".")[0] == PKG]:
+            del sys.modules[name]
+        self.tmp.cleanup()
+
+    def touch(self, name, source=SOURCE):
+        path = os.path.join(self.pkg, name)
+        stat = os.stat(path)
+        with open(path, "w") as fh:
+            fh.write(source)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    def test_manifest_round_trips_index(self):
+        index = AutoWireIndex.scan([PKG], [])
+        AutoWireManifest.save(index, self.manifest)
+        loaded = AutoWireManifest.load(self.manifest)
+        self.assertDictEqual(loaded.records, index.records)
+        self.assertEqual(loaded.modules, (PKG,))
+        self.assertFalse(loaded.stale)
+
+    def test_manifest_stores_paths_relative_to_package_root(self):
+        AutoWireManifest.save(AutoWireIndex.scan([PKG], []), self.manifest)
+        with open(self.manifest, encoding="utf-8") as fh:
+            records = json.load(fh)["records"]
+        self.assertEqual(records[PKG]["path"], f"{PKG}/__init__.py")
+        self.assertEqual(records[f"{PKG}.ducks"]["path"], f"{PKG}/ducks.py")
+        self.assertNotIn(self.tmp.name, json.dumps(records))
+
+    def test_manifest_matches_package_installed_elsewhere(self):
+        AutoWireManifest.save(AutoWireIndex.scan([PKG], []), self.manifest)
+        with tempfile.TemporaryDirectory() as other:
+            shutil.copytree(self.pkg, os.path.join(other, PKG))
+            sys.path[sys.path.index(self.tmp.name)] = other
+            try:
+                importlib.invalidate_caches()
+                previous = AutoWireManifest.load(self.manifest)
+                index = AutoWireIndex.scan([PKG], [], previous, check="hash")
+            finally:
+                sys.path[sys.path.index(other)] = self.tmp.name
+                importlib.invalidate_caches()
+        self.assertFalse(index.stale)
+
+    def test_manifest_records_binding_details(self):
+        index = AutoWireIndex.scan([PKG], [])
+        (binding,) = index.records[f"{PKG}.ducks"].bindings
+        self.assertEqual(binding.qualname, "Mallard")
+        self.assertEqual(binding.provides, (f"{PKG}.ducks.Duck",))
+        self.assertEqual(binding.scope, "singleton")
+
+    def test_load_returns_none_if_missing(self):
+        self.assertIsNone(AutoWireManifest.load(self.manifest))
+
+    def test_load_returns_none_if_corrupt(self):
+        with open(self.manifest, "w") as fh:
+            fh.write("{")
+        self.assertIsNone(AutoWireManifest.load(self.manifest))
+
+    def test_scan_reuses_unchanged_records(self):
+        previous = AutoWireIndex.scan([PKG], [])
+        index = AutoWireIndex.scan([PKG], [], previous)
+        self.assertFalse(index.stale)
+        self.assertIs(index.records[f"{PKG}.ducks"], previous.records[f"{PKG}.ducks"])
+
+    def test_scan_reparses_modules_with_new_mtime(self):
+        previous = AutoWireIndex.scan([PKG], [])
+        self.touch("ducks.py")
+        index = AutoWireIndex.scan([PKG], [], previous)
+        self.assertTrue(index.stale)
+        self.assertIs(index.records[PKG], previous.records[PKG])
+
+    def test_scan_with_hash_check_ignores_mtime(self):
+        previous = AutoWireIndex.scan([PKG], [])
+        self.touch("ducks.py")
+        index = AutoWireIndex.scan([PKG], [], previous, check="hash")
+        self.assertFalse(index.stale)
+
+    def test_scan_with_hash_check_reparses_changed_source(self):
+        previous = AutoWireIndex.scan([PKG], [])
+        self.touch("ducks.py", SOURCE.replace("singleton", "transient"))
+        index = AutoWireIndex.scan([PKG], [], previous, check="hash")
+        self.assertTrue(index.stale)
+        (binding,) = index.records[f"{PKG}.ducks"].bindings
+        self.assertEqual(binding.scope, "transient")
+
+    def test_scan_with_no_check_skips_walking(self):
+        previous = AutoWireIndex.scan([PKG], [])
+        self.touch("ducks.py", "")
+        self.assertIs(AutoWireIndex.scan([PKG], [], previous, check="none"), previous)
+
+    def test_scan_raises_on_unknown_check(self):
+        with self.assertRaises(AutoWireError):
+            AutoWireIndex.scan([PKG], [], check="ctime")
+
+    def test_builder_writes_and_reads_manifest(self):
+        AutoWireContainerBuilder.registry.reset()
+        AutoWireContainerBuilder(PKG, manifest=self.manifest)
+        self.assertIsNotNone(AutoWireManifest.load(self.manifest))
+
+        from pyioc3_manifest_pkg.ducks import Duck, Mallard
+
+        container = AutoWireContainerBuilder(PKG, manifest=self.manifest).build()
+        self.assertIsInstance(container.get(Duck), Mallard)
+
+    def test_cli_writes_manifest(self):
+        with redirect_stdout(io.StringIO()):
+            code = main(["manifest", PKG, "-o", self.manifest])
+        self.assertEqual(code, 0)
+        loaded = AutoWireManifest.load(self.manifest)
+        self.assertIn(f"{PKG}.ducks", loaded.records)
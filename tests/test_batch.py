@@ -0,0 +1,93 @@
+from unittest import TestCase
+
+from pyioc3 import StaticContainerBuilder
+from pyioc3.errors import PyIOC3Error
+from pyioc3.interface import Container
+
+from .fixtures import DuckA, DuckInterface, QuackBehavior, Sqeak
+
+created = []
+
+
+class Config:
+    def __init__(self):
+        created.append(self)
+
+
+class Buffer:
+    def __init__(self, config: Config):
+        self.config = config
+
+
+class Processor:
+    def __init__(self, config: Config, left: Buffer, right: Buffer, ctx: Container):
+        self.config = config
+        self.left = left
+        self.right = right
+        self.ctx = ctx
+
+
+class BatchTest(TestCase):
+    def setUp(self):
+        created.clear()
+        self.container = (
+            StaticContainerBuilder()
+            .bind(Config, scope="requested")
+            .bind(Buffer)
+            .bind(Processor, on_activate=self.activate)
+            .bind(DuckInterface, DuckA, "singleton")
+            .bind(QuackBehavior, Sqeak)
+            .build()
+        )
+        self.activated = 0
+
+    def activate(self, processor):
+        self.activated += 1
+        return processor
+
+    def test_creates_transients_for_each_instance(self):
+        processors = self.container.get_batch(Processor, 3)
+        self.assertEqual(len({id(p) for p in processors}), 3)
+        buffers = [b for p in processors for b in (p.left, p.right)]
+        self.assertEqual(len({id(b) for b in buffers}), 6)
+        self.assertEqual(self.activated, 3)
+
+    def test_shares_requested_members(self):
+        processors = self.container.get_batch(Processor, 3)
+        self.assertEqual(len(created), 1)
+        self.assertTrue(all(p.config is created[0] for p in processors))
+        self.assertTrue(all(p.left.config is created[0] for p in processors))
+        self.container.get_batch(Processor, 2)
+        self.assertEqual(len(created), 2)
+
+    def test_non_transient_annotation_repeats_the_instance(self):
+        ducks = self.container.get_batch(DuckInterface, 2)
+        self.assertIs(ducks[0], ducks[1])
+        self.assertIs(ducks[0], self.container.get(DuckInterface))
+
+    def test_iter_streams_instances(self):
+        stream = self.container.iter(Processor)
+        first, second = next(stream), next(stream)
+        self.assertIsNot(first, second)
+        self.assertIs(first.config, second.config)
+        self.assertEqual(len(created), 1)
+
+    def test_honors_overrides(self):
+        with self.container.override(Buffer, scope="singleton"):
+            processors = self.container.get_batch(Processor, 2)
+        self.assertIs(processors[0].left, processors[1].right)
+
+    def test_supports_lazy_validation(self):
+        container = (
+            StaticContainerBuilder()
+            .bind(Config)
+            .bind(Buffer)
+            .bind(Processor)
+            .build(validate="lazy")
+        )
+        self.assertEqual(len(container.get_batch(Processor, 2)), 2)
+        self.assertListEqual(container.get_batch(Processor, 0), [])
+
+    def test_rejects_negative_sizes(self):
+        with self.assertRaises(PyIOC3Error):
+            self.container.get_batch(Processor, -1)
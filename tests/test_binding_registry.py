@@ -0,0 +1,71 @@
+from unittest import TestCase
+
+from pyioc3.binding_registry import BindingRegistry
+from pyioc3.interface import ProviderBinding
+from pyioc3.scope_enum import ScopeEnum
+
+
+class A: ...
+
+
+class B: ...
+
+
+class C: ...
+
+
+def binding(impl):
+    return ProviderBinding(impl, impl, ScopeEnum.TRANSIENT, None)
+
+
+class BindingRegistryTests(TestCase):
+    def setUp(self):
+        self.registry = BindingRegistry()
+        self.registry.register("pkg.a", binding(A))
+        self.registry.register("pkg.sub.b", binding(B))
+        self.registry.register("other", binding(C))
+
+    def test_register_deduplicates_bindings(self):
+        self.registry.register("pkg.a", binding(A))
+        self.assertEqual(len(self.registry), 3)
+
+    def test_select_returns_bindings_of_given_modules(self):
+        self.assertListEqual(
+            self.registry.select(["other", "pkg.a", "missing"]),
+            [binding(C), binding(A)],
+        )
+
+    def test_walk_yields_modules_in_package(self):
+        self.assertSetEqual(set(self.registry.walk("pkg")), {"pkg.a", "pkg.sub.b"})
+        self.assertSetEqual(set(self.registry.walk("pkg.sub")), {"pkg.sub.b"})
+        self.assertSetEqual(set(self.registry.walk("other")), {"other"})
+        self.assertSetEqual(set(self.registry.walk("pk")), set())
+
+    def test_iter_yields_module_binding_pairs(self):
+        self.assertListEqual(
+            list(self.registry),
+            [
+                ("pkg.a", binding(A)),
+                ("pkg.sub.b", binding(B)),
+                ("other", binding(C)),
+            ],
+        )
+
+    def test_reset_removes_bindings(self):
+        self.registry.reset()
+        self.assertEqual(len(self.registry), 0)
+        self.assertListEqual(list(self.registry.walk("pkg")), [])
+
+    def test_restore_replaces_bindings_with_snapshot(self):
+        snapshot = self.registry.snapshot()
+        self.registry.reset()
+        self.registry.register("pkg.c", binding(C))
+        self.registry.restore(snapshot)
+        self.assertListEqual(self.registry.select(["pkg.c"]), [])
+        self.assertSetEqual(set(self.registry.walk("pkg")), {"pkg.a", "pkg.sub.b"})
+
+    def test_snapshot_is_not_affected_by_later_registrations(self):
+        snapshot = self.registry.snapshot()
+        self.registry.register("pkg.a", binding(B))
+        self.registry.restore(snapshot)
+        self.assertListEqual(self.registry.select(["pkg.a"]), [binding(A)])
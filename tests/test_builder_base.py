@@ -1,9 +1,11 @@
 import unittest
 from typing import Callable
+from unittest.mock import patch
 
 from pyioc3.builder import BuilderBase
+from pyioc3.errors import MemberNotBoundError
 from pyioc3.interface import ProviderBinding, ConstantBinding, FactoryBinding
-
+from pyioc3.static_container import StaticContainer
 
 GreeterFactory = Callable[[str], str]
 
@@ -107,3 +109,91 @@ class BuilderTest(unittest.TestCase):
 
         assert isinstance(bar, Bar)
         assert bar.greeting == "Hello, World!"
+
+
+class Name(str): ...
+
+
+class Greeting:
+    def __init__(self, name: Name, greet: GreeterFactory):
+        self.greeting = greet(name)
+
+
+class GreetingBuilder(BuilderBase[Greeting]):
+    def __init__(self):
+        super().__init__(
+            Greeting,
+            [
+                ConstantBinding(Name("World"), Name),
+                FactoryBinding(eng_greeter_factory, GreeterFactory),
+            ],
+        )
+
+
+class BuilderTemplateTest(unittest.TestCase):
+    def test_template_builds_target(self):
+        template = GreetingBuilder().compile()
+        self.assertEqual(template.build().greeting, "Hello, World!")
+
+    def test_template_builds_new_instances(self):
+        template = GreetingBuilder().compile()
+        self.assertIsNot(template.build(), template.build())
+
+    def test_template_build_applies_overrides(self):
+        template = GreetingBuilder().compile()
+        greeting = template.build([ConstantBinding(Name("Duck"), Name)])
+        self.assertEqual(greeting.greeting, "Hello, Duck!")
+        self.assertEqual(template.build().greeting, "Hello, World!")
+
+    def test_template_build_applies_on_activate_override(self):
+        def shout(greeting):
+            greeting.greeting = greeting.greeting.upper()
+            return greeting
+
+        template = GreetingBuilder().compile()
+        greeting = template.build([ProviderBinding(Greeting, on_activate=shout)])
+        self.assertEqual(greeting.greeting, "HELLO, WORLD!")
+
+    def test_template_does_not_share_singletons_between_builds(self):
+        class Bar: ...
+
+        class Foo_Test(Foo):
+            def __init__(self, bar: Bar):
+                self.bar = bar
+
+        template = (
+            FooBuilder()
+            .using_provider(Foo, Foo_Test)
+            .using_provider(Bar, scope="singleton")
+            .compile()
+        )
+        self.assertIsNot(template.build().bar, template.build().bar)
+
+    def test_template_build_does_not_link_again(self):
+        template = GreetingBuilder().compile()
+        with patch.object(StaticContainer, "_link") as link:
+            template.build()
+            template.build([ConstantBinding(Name("Duck"), Name)])
+        link.assert_not_called()
+
+    def test_derived_template_does_not_modify_original(self):
+        template = GreetingBuilder().compile()
+        derived = template.using_constant(Name, Name("Duck"))
+        self.assertEqual(derived.build().greeting, "Hello, Duck!")
+        self.assertEqual(template.build().greeting, "Hello, World!")
+
+    def test_template_is_not_modified_by_builder(self):
+        builder = GreetingBuilder()
+        template = builder.compile()
+        builder.using_constant(Name, Name("Duck"))
+        self.assertEqual(template.build().greeting, "Hello, World!")
+
+    def test_template_build_raises_if_override_is_not_satisfied(self):
+        class Bar: ...
+
+        class Foo_Test(Foo):
+            def __init__(self, bar: Bar): ...
+
+        template = FooBuilder().compile()
+        with self.assertRaises(MemberNotBoundError):
+            template.build([ProviderBinding(Foo, Foo_Test)])
@@ -0,0 +1,129 @@
+from unittest import TestCase
+
+from pyioc3 import StaticContainerBuilder
+from pyioc3.errors import CircularDependencyError, MemberNotBoundError
+from pyioc3.interface import ConstantBinding, Container, ProviderBinding
+
+from .fixtures import (
+    DuckA,
+    DuckInterface,
+    HalfCircle1,
+    HalfCircle2,
+    QuackBehavior,
+    Sqeak,
+)
+
+
+class Honk(QuackBehavior):
+    def quack(self):
+        return "honk"
+
+
+class Pond:
+    def __init__(self, duck: DuckInterface):
+        self.duck = duck
+
+
+class Weather: ...
+
+
+def pond_factory(ctx: Container):
+    def factory():
+        return ctx.get(Pond)
+
+    return factory
+
+
+class ChildContainerTest(TestCase):
+    def setUp(self):
+        self.container = (
+            StaticContainerBuilder()
+            .bind(DuckInterface, DuckA, "singleton")
+            .bind(QuackBehavior, Sqeak, "singleton")
+            .bind(Pond, scope="singleton")
+            .bind(Weather, scope="singleton")
+            .bind_factory("pond_factory", pond_factory)
+            .build()
+        )
+
+    def test_child_uses_overrides(self):
+        child = self.container.child([ProviderBinding(QuackBehavior, Honk)])
+        self.assertIsInstance(child.get(QuackBehavior), Honk)
+        self.assertIsInstance(child.get(DuckInterface)._quack_behavior, Honk)
+
+    def test_child_does_not_change_parent(self):
+        self.container.child([ProviderBinding(QuackBehavior, Honk)])
+        self.assertIsInstance(self.container.get(QuackBehavior), Sqeak)
+        self.assertIsInstance(self.container.get(Pond).duck._quack_behavior, Sqeak)
+
+    def test_child_shares_unaffected_singletons(self):
+        weather = self.container.get(Weather)
+        child = self.container.child([ProviderBinding(QuackBehavior, Honk)])
+        self.assertIs(child.get(Weather), weather)
+
+    def test_child_shares_singletons_created_by_child(self):
+        child = self.container.child([ProviderBinding(QuackBehavior, Honk)])
+        self.assertIs(child.get(Weather), self.container.get(Weather))
+
+    def test_child_caches_affected_singletons_separately(self):
+        pond = self.container.get(Pond)
+        child = self.container.child([ProviderBinding(QuackBehavior, Honk)])
+        self.assertIsNot(child.get(Pond), pond)
+        self.assertIs(child.get(Pond), child.get(Pond))
+        self.assertIs(self.container.get(Pond), pond)
+
+    def test_child_injects_itself(self):
+        child = self.container.child()
+        self.assertIs(child.get(Container), child)
+        self.assertIsInstance(child.get("pond_factory")().duck, DuckA)
+
+    def test_child_factories_resolve_overrides(self):
+        child = self.container.child([ProviderBinding(QuackBehavior, Honk)])
+        pond = child.get("pond_factory")()
+        self.assertIsInstance(pond.duck._quack_behavior, Honk)
+
+    def test_child_can_add_bindings(self):
+        child = self.container.child([ConstantBinding("new", "name")])
+        self.assertEqual(child.get("name"), "new")
+        with self.assertRaises(MemberNotBoundError):
+            self.container.get("name")
+
+    def test_grandchild_layers_overrides(self):
+        child = self.container.child([ProviderBinding(QuackBehavior, Honk)])
+        grandchild = child.child([ConstantBinding("new", "name")])
+        self.assertIsInstance(grandchild.get(QuackBehavior), Honk)
+        self.assertEqual(grandchild.get("name"), "new")
+        self.assertIs(grandchild.get(Weather), self.container.get(Weather))
+
+    def test_child_of_lazy_container(self):
+        container = (
+            StaticContainerBuilder()
+            .bind(DuckInterface, DuckA)
+            .bind(QuackBehavior, Sqeak)
+            .build(validate="lazy")
+        )
+        child = container.child([ProviderBinding(QuackBehavior, Honk)])
+        self.assertIsInstance(child.get(DuckInterface)._quack_behavior, Honk)
+
+    def test_child_raises_if_override_is_not_bound(self):
+        with self.assertRaises(MemberNotBoundError):
+            self.container.child([ProviderBinding(Pond, HalfCircle1)])
+
+    def test_child_raises_if_override_is_cyclic(self):
+        container = StaticContainerBuilder().bind(HalfCircle2, Weather).build()
+        with self.assertRaises(CircularDependencyError):
+            container.child(
+                [ProviderBinding(HalfCircle1), ProviderBinding(HalfCircle2)]
+            )
+
+    def test_child_links_lazy_overrides_on_first_get(self):
+        from tests.lazy_bindings.interface import RendererInterface
+
+        child = self.container.child(
+            [
+                ProviderBinding(
+                    RendererInterface, "tests.lazy_bindings.renderer:PdfRenderer"
+                )
+            ]
+        )
+        self.assertIsInstance(child.get(RendererInterface).quack, Sqeak)
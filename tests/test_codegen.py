@@ -0,0 +1,174 @@
+import importlib.util
+import io
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from unittest import TestCase, skipIf
+
+from pyioc3 import Container, Factory, StaticContainerBuilder
+from pyioc3.__main__ import main
+from pyioc3.codegen import ContainerCompiler
+from pyioc3.compiled_container import CompiledContainer
+from pyioc3.errors import CodegenError, MemberNotBoundError
+from pyioc3.keyed_annotation import KeyedAnnotation
+
+from .compile_target import Pond, Visit
+from .fixtures import DuckA, DuckInterface, QuackBehavior, Sqeak
+
+TARGET = "tests.compile_target:builder"
+
+
+def load(path):
+    spec = importlib.util.spec_from_file_location("_wired", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class ContainerCompilerTest(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "_wired.py")
+        source = ContainerCompiler.compile(ContainerCompiler.load(TARGET), TARGET)
+        with open(self.path, "w") as fh:
+            fh.write(source)
+        self.module = load(self.path)
+        self.container = self.module.container
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_generated_module_exposes_container(self):
+        self.assertIsInstance(self.container, CompiledContainer)
+        self.assertIs(self.container.get(Container), self.container)
+
+    def test_generated_container_injects_dependencies(self):
+        pond = self.container.get(Pond)
+        self.assertIsInstance(pond.duck, DuckA)
+        self.assertEqual(pond.name, "Walden")
+        self.assertEqual(self.container.get("depth"), 30)
+
+    def test_generated_container_respects_scopes(self):
+        visit = self.container.get(Visit)
+        self.assertIs(visit.quack, visit.pond.duck._quack_behavior)
+        self.assertIsNot(visit.quack, self.container.get(QuackBehavior))
+        self.assertIs(self.container.get(DuckInterface), self.container.get(Pond).duck)
+        self.assertIsNot(self.container.get(Pond), self.container.get(Pond))
+
+    def test_generated_container_calls_on_activate(self):
+        self.assertTrue(self.container.get(DuckInterface).marked)
+
+    def test_generated_container_passes_itself_to_factories(self):
+        self.assertIsInstance(self.container.get("visit_factory")(), Visit)
+
+    def test_build_creates_new_singletons(self):
+        other = self.module.build()
+        self.assertIsNot(other.get(DuckInterface), self.container.get(DuckInterface))
+
+    def test_generated_container_raises_if_not_bound(self):
+        with self.assertRaises(MemberNotBoundError):
+            self.container.get("missing")
+
+    def test_generated_source_does_not_introspect(self):
+        with open(self.path) as fh:
+            source = fh.read()
+        self.assertNotIn("get_type_hints", source)
+        self.assertIn("from tests.compile_target import Pond as", source)
+
+
+class ContainerCompilerErrorTest(TestCase):
+    def test_raises_on_local_classes(self):
+        class LocalDuck(DuckA): ...
+
+        container = (
+            StaticContainerBuilder()
+            .bind(DuckInterface, LocalDuck)
+            .bind(QuackBehavior, Sqeak)
+            .build()
+        )
+        with self.assertRaises(CodegenError):
+            ContainerCompiler.compile(container)
+
+    def test_raises_on_unimportable_constants(self):
+        container = StaticContainerBuilder().bind_constant("value", object()).build()
+        with self.assertRaises(CodegenError):
+            ContainerCompiler.compile(container)
+
+    def test_raises_on_multi_bindings(self):
+        container = (
+            StaticContainerBuilder()
+            .bind_multi(DuckInterface, DuckA)
+            .bind(QuackBehavior, Sqeak)
+            .build()
+        )
+        with self.assertRaisesRegex(CodegenError, "Multi-bindings are not supported"):
+            ContainerCompiler.compile(container)
+
+    @skipIf(sys.version_info < (3, 9), "Keyed annotations require Python 3.9")
+    def test_raises_on_keyed_bindings(self):
+        container = (
+            StaticContainerBuilder()
+            .bind(KeyedAnnotation.of(DuckInterface, "pond"), DuckA)
+            .bind(QuackBehavior, Sqeak)
+            .build()
+        )
+        with self.assertRaisesRegex(CodegenError, "Keyed bindings"):
+            ContainerCompiler.compile(container)
+
+    def test_raises_on_assisted_factories(self):
+        container = (
+            StaticContainerBuilder()
+            .bind(QuackBehavior, Sqeak)
+            .bind_assisted(DuckInterface, DuckA)
+            .build()
+        )
+        self.assertIsInstance(container.get(Factory[DuckInterface])(), DuckA)
+        with self.assertRaisesRegex(CodegenError, "Assisted factory bindings"):
+            ContainerCompiler.compile(container)
+
+    def test_raises_on_keyed_request_bindings(self):
+        class Shard:
+            def __init__(self, key: str, quack: QuackBehavior): ...
+
+        container = (
+            StaticContainerBuilder()
+            .bind(QuackBehavior, Sqeak)
+            .bind_keyed(Shard)
+            .build()
+        )
+        with self.assertRaisesRegex(CodegenError, "Keyed request bindings"):
+            ContainerCompiler.compile(container)
+
+    def test_raises_on_prefetched_bindings(self):
+        container = (
+            StaticContainerBuilder()
+            .bind(QuackBehavior, Sqeak)
+            .bind_prefetched(DuckInterface, DuckA)
+            .build()
+        )
+        with self.assertRaisesRegex(CodegenError, "Prefetched bindings"):
+            ContainerCompiler.compile(container)
+
+    def test_raises_on_lazy_constants(self):
+        container = (
+            StaticContainerBuilder()
+            .bind_lazy_constant("words", lambda: ["quack"])
+            .build()
+        )
+        with self.assertRaisesRegex(CodegenError, "Lazy constant bindings"):
+            ContainerCompiler.compile(container)
+
+    def test_raises_if_target_is_not_a_container(self):
+        with self.assertRaises(CodegenError):
+            ContainerCompiler.load("tests.compile_target:PondName")
+
+
+class CompileCommandTest(TestCase):
+    def test_cli_writes_module(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "_wired.py")
+            with redirect_stdout(io.StringIO()):
+                code = main(["compile", TARGET, "-o", path])
+            self.assertEqual(code, 0)
+            self.assertIsInstance(load(path).container.get(Pond), Pond)
@@ -0,0 +1,61 @@
+import pickle
+from unittest import TestCase
+
+from pyioc3 import Container, StaticContainerBuilder
+from pyioc3.bound_member_factory import BoundMemberFactory
+from pyioc3.container_spec import ContainerSpec
+from pyioc3.errors import ContainerSpecError
+from pyioc3.introspection_cache import IntrospectionCache
+
+from .compile_target import Pond, Visit, builder
+from .fixtures import DuckA, DuckInterface, QuackBehavior, Sqeak
+
+
+class ContainerSpecTest(TestCase):
+    def setUp(self):
+        self.spec = ContainerSpec.from_container(builder.build())
+
+    def test_spec_references_implementations_by_import_path(self):
+        (duck,) = [m for m in self.spec.members if m.annotation is DuckInterface]
+        self.assertEqual(duck.target, "tests.fixtures:DuckA")
+        self.assertEqual(duck.on_activate, "tests.compile_target:mark")
+        self.assertEqual(duck.parameters, (QuackBehavior,))
+
+    def test_spec_round_trips_through_pickle(self):
+        self.assertEqual(pickle.loads(pickle.dumps(self.spec)), self.spec)
+
+    def test_build_does_not_introspect(self):
+        cache = BoundMemberFactory.introspection_cache
+        BoundMemberFactory.introspection_cache = IntrospectionCache()
+        try:
+            container = pickle.loads(pickle.dumps(self.spec)).build()
+            container.get(Visit)
+            self.assertEqual(BoundMemberFactory.introspection_cache.stats().misses, 0)
+        finally:
+            BoundMemberFactory.introspection_cache = cache
+
+    def test_built_container_resolves_dependencies(self):
+        container = self.spec.build()
+        visit = container.get(Visit)
+        self.assertIsInstance(visit.pond.duck, DuckA)
+        self.assertTrue(visit.pond.duck.marked)
+        self.assertIs(visit.quack, visit.pond.duck._quack_behavior)
+        self.assertEqual(container.get("depth"), 30)
+        self.assertIs(container.get(Container), container)
+        self.assertIsInstance(container.get("visit_factory")(), Visit)
+
+    def test_built_containers_do_not_share_singletons(self):
+        self.assertIsNot(
+            self.spec.build().get(DuckInterface), self.spec.build().get(DuckInterface)
+        )
+
+    def test_static_container_can_be_pickled(self):
+        container = pickle.loads(pickle.dumps(builder.build()))
+        self.assertIsInstance(container.get(Pond), Pond)
+
+    def test_raises_on_local_classes(self):
+        class LocalSqeak(Sqeak): ...
+
+        container = StaticContainerBuilder().bind(QuackBehavior, LocalSqeak).build()
+        with self.assertRaises(ContainerSpecError):
+            ContainerSpec.from_container(container)
@@ -0,0 +1,117 @@
+import os
+import pickle
+from unittest import TestCase, skipUnless
+
+from pyioc3 import ForkPolicy, StaticContainerBuilder
+from pyioc3.codegen import ContainerCompiler
+from pyioc3.errors import CodegenError, ForkPolicyError
+
+from .fixtures import DuckA, DuckInterface, QuackBehavior, Sqeak
+
+created = []
+
+
+class Socket:
+    def __init__(self):
+        created.append(self)
+
+
+class Pool:
+    def __init__(self):
+        created.append(self)
+
+
+class Client:
+    def __init__(self, socket: Socket):
+        self.socket = socket
+
+
+class ForkPolicyTest(TestCase):
+    def setUp(self):
+        created.clear()
+        self.container = (
+            StaticContainerBuilder()
+            .bind(DuckInterface, DuckA, "singleton")
+            .bind(QuackBehavior, Sqeak, "singleton")
+            .bind(Socket, scope="singleton", fork_policy="lazy")
+            .bind(Pool, scope="singleton", fork_policy=ForkPolicy.REINITIALIZE)
+            .bind(Client, scope="singleton")
+            .build()
+        )
+
+    def test_from_string(self):
+        self.assertEqual(ForkPolicy.from_string("share"), ForkPolicy.SHARE)
+        self.assertEqual(ForkPolicy.from_string("LAZY"), ForkPolicy.LAZY)
+        with self.assertRaises(ForkPolicyError):
+            ForkPolicy.from_string("copy")
+
+    def test_warm_up_skips_fork_unsafe_singletons(self):
+        self.container.warm_up()
+        self.assertListEqual(created, [])
+        self.assertIs(
+            self.container.get(DuckInterface)._quack_behavior,
+            self.container.get(QuackBehavior),
+        )
+
+    def test_warm_up_resolves_given_annotations(self):
+        self.container.warm_up([Pool])
+        self.assertListEqual(created, [self.container.get(Pool)])
+
+    def test_after_fork_keeps_shared_singletons(self):
+        self.container.warm_up()
+        duck = self.container.get(DuckInterface)
+        self.container._after_fork()
+        self.assertIs(self.container.get(DuckInterface), duck)
+
+    def test_after_fork_rebuilds_lazy_singletons_and_dependents(self):
+        client = self.container.get(Client)
+        self.container._after_fork()
+        self.assertEqual(len(created), 2)
+        self.assertIsNot(self.container.get(Client), client)
+        self.assertIsNot(self.container.get(Client).socket, client.socket)
+
+    def test_after_fork_reinitializes_eagerly(self):
+        pool = self.container.get(Pool)
+        self.container._after_fork()
+        self.assertEqual(len(created), 2)
+        self.assertIs(created[1], self.container.get(Pool))
+        self.assertIsNot(self.container.get(Pool), pool)
+
+    def test_child_containers_rebuild_their_own_singletons(self):
+        child = self.container.child()
+        socket = child.get(Socket)
+        child._after_fork()
+        self.assertIsNot(child.get(Socket), socket)
+
+    def test_spec_keeps_fork_policies(self):
+        container = pickle.loads(pickle.dumps(self.container))
+        self.assertEqual(
+            container._bound_members[Pool].fork_policy, ForkPolicy.REINITIALIZE
+        )
+
+    def test_compiler_rejects_fork_policies(self):
+        with self.assertRaises(CodegenError):
+            ContainerCompiler.compile(self.container)
+
+    @skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_forked_process_replaces_unsafe_singletons(self):
+        self.container.warm_up()
+        client = self.container.get(Client)
+        duck = self.container.get(DuckInterface)
+        count = len(created)
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            # The pool was created by the fork hook, before any get.
+            fresh = created[count:]
+            ok = (
+                self.container.get(DuckInterface) is duck
+                and self.container.get(Client) is not client
+                and any(p is self.container.get(Pool) for p in fresh)
+            )
+            os.write(write, b"1" if ok else b"0")
+            os._exit(0)
+        os.close(write)
+        os.waitpid(pid, 0)
+        self.assertEqual(os.read(read, 1), b"1")
+        os.close(read)
@@ -0,0 +1,100 @@
+import asyncio
+from unittest import TestCase
+
+from pyioc3 import StaticContainerBuilder
+from pyioc3.bound_member_factory import BoundMemberFactory
+from pyioc3.errors import InjectionError
+from pyioc3.injector import Injector
+from pyioc3.interface import ProviderBinding
+
+from .fixtures import DuckA, DuckInterface, QuackBehavior, Sqeak
+
+
+class Session: ...
+
+
+class Goose(DuckInterface):
+    def quack(self):
+        return "honk"
+
+
+class InjectorTest(TestCase):
+    def setUp(self):
+        self.container = (
+            StaticContainerBuilder()
+            .bind(DuckInterface, DuckA, "singleton")
+            .bind(QuackBehavior, Sqeak)
+            .bind(Session)
+            .build()
+        )
+
+    def test_injects_bound_parameters(self):
+        @self.container.inject
+        def handle(task_id: str, duck: DuckInterface, session: Session):
+            return task_id, duck, session
+
+        task_id, duck, session = handle("t-1")
+        self.assertEqual(task_id, "t-1")
+        self.assertIs(duck, self.container.get(DuckInterface))
+        self.assertIsInstance(session, Session)
+        self.assertIsNot(handle("t-2")[2], session)
+
+    def test_passed_arguments_win(self):
+        @self.container.inject
+        def handle(duck: DuckInterface, *, session: Session):
+            return duck, session
+
+        goose, session = Goose(), Session()
+        self.assertTupleEqual(handle(goose, session=session), (goose, session))
+
+    def test_does_not_introspect_on_calls(self):
+        @self.container.inject
+        def handle(duck: DuckInterface):
+            return duck
+
+        handle()
+        misses = BoundMemberFactory.introspection_cache.stats().misses
+        for _ in range(3):
+            handle()
+        self.assertEqual(BoundMemberFactory.introspection_cache.stats().misses, misses)
+
+    def test_injects_methods(self):
+        container = self.container
+
+        class Command:
+            @container.inject
+            def run(self, duck: DuckInterface):
+                return duck.quack()
+
+        self.assertEqual(Command().run(), DuckA(Sqeak()).quack())
+
+    def test_injects_coroutine_functions(self):
+        @self.container.inject
+        async def handle(session: Session):
+            return session
+
+        self.assertTrue(asyncio.iscoroutinefunction(handle))
+        self.assertIsInstance(asyncio.run(handle()), Session)
+
+    def test_follows_rebind_and_overrides(self):
+        @self.container.inject
+        def handle(duck: DuckInterface):
+            return duck
+
+        with self.container.override(DuckInterface, Goose):
+            self.assertIsInstance(handle(), Goose)
+        self.assertIsInstance(handle(), DuckA)
+        self.container.rebind([ProviderBinding(DuckInterface, Goose)])
+        self.assertIsInstance(handle(), Goose)
+
+    def test_container_can_be_bound_later(self):
+        injector = Injector()
+
+        @injector
+        def handle(session: Session):
+            return session
+
+        with self.assertRaises(InjectionError):
+            handle()
+        injector.bind(self.container)
+        self.assertIsInstance(handle(), Session)
@@ -0,0 +1,68 @@
+import gc
+import unittest
+from unittest.mock import patch
+
+from pyioc3.adapters import FactoryAsImplAdapter, ValueAsImplAdapter
+from pyioc3.interface import Container
+from pyioc3.introspection_cache import IntrospectionCache
+
+from .fixtures import DuckA, DuckB, DuckC, QuackBehavior, duck_d
+
+
+class IntrospectionCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = IntrospectionCache()
+
+    def test_returns_parameter_annotations(self):
+        self.assertListEqual(self.cache.get_parameters(DuckA), [QuackBehavior])
+        self.assertListEqual(self.cache.get_parameters(DuckB), [QuackBehavior])
+        self.assertListEqual(self.cache.get_parameters(DuckC), [])
+        self.assertListEqual(self.cache.get_parameters(duck_d), [QuackBehavior])
+
+    def test_returns_parameter_names(self):
+        self.assertTupleEqual(
+            self.cache.get_signature(DuckA), (("squeak", QuackBehavior),)
+        )
+
+    def test_repeated_lookups_skip_get_type_hints(self):
+        self.cache.get_parameters(DuckB)
+        with patch("pyioc3.introspection_cache.get_type_hints") as hints:
+            self.cache.get_parameters(DuckB)
+            hints.assert_not_called()
+
+    def test_tracks_hits_and_misses(self):
+        self.cache.get_parameters(DuckA)
+        self.cache.get_parameters(DuckA)
+        self.cache.get_parameters(DuckA)
+        self.cache.get_parameters(DuckC)
+        stats = self.cache.stats()
+        self.assertEqual(stats.hits, 2)
+        self.assertEqual(stats.misses, 2)
+        self.assertEqual(stats.size, 2)
+        self.assertEqual(stats.hit_rate, 0.5)
+
+    def test_hit_rate_is_zero_when_unused(self):
+        self.assertEqual(self.cache.stats().hit_rate, 0.0)
+
+    def test_callable_instances_share_the_type_signature(self):
+        self.cache.get_parameters(FactoryAsImplAdapter(lambda ctx: None))
+        params = self.cache.get_parameters(FactoryAsImplAdapter(lambda ctx: None))
+        self.assertListEqual(params, [Container])
+        self.assertEqual(self.cache.stats().hits, 1)
+        self.assertListEqual(self.cache.get_parameters(ValueAsImplAdapter(1)), [])
+
+    def test_does_not_keep_classes_alive(self):
+        class Temporary:
+            def __init__(self, quack: QuackBehavior): ...
+
+        self.cache.get_parameters(Temporary)
+        self.assertEqual(self.cache.stats().size, 1)
+        del Temporary
+        gc.collect()
+        self.assertEqual(self.cache.stats().size, 0)
+
+    def test_clear_resets_entries_and_counters(self):
+        self.cache.get_parameters(DuckA)
+        self.cache.get_parameters(DuckA)
+        self.cache.clear()
+        self.assertEqual(self.cache.stats(), (0, 0, 0))
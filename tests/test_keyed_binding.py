@@ -0,0 +1,101 @@
+import pickle
+import sys
+from unittest import TestCase, skipIf
+
+from pyioc3 import StaticContainerBuilder
+from pyioc3.errors import MemberNotBoundError
+from pyioc3.interface import ProviderBinding
+from pyioc3.keyed_annotation import KeyedAnnotation
+
+if sys.version_info >= (3, 9):
+    from typing import Annotated
+else:
+    Annotated = None
+
+
+class Cache: ...
+
+
+class RedisCache(Cache): ...
+
+
+class MemoryCache(Cache): ...
+
+
+class Limit: ...
+
+
+if Annotated is not None:
+
+    class Store:
+        def __init__(
+            self,
+            sessions: Annotated[Cache, "sessions"],
+            pages: Annotated[Cache, "pages"],
+            limit: Annotated[Limit, "validated"],
+        ):
+            self.sessions = sessions
+            self.pages = pages
+            self.limit = limit
+
+
+@skipIf(Annotated is None, "Keyed annotations require Python 3.9")
+class KeyedBindingTest(TestCase):
+    def setUp(self):
+        self.container = (
+            StaticContainerBuilder()
+            .bind(Annotated[Cache, "sessions"], RedisCache, "singleton")
+            .bind(Annotated[Cache, "pages"], MemoryCache, "singleton")
+            .bind(Limit)
+            .bind(Store)
+            .build()
+        )
+
+    def test_injects_by_key(self):
+        store = self.container.get(Store)
+        self.assertIsInstance(store.sessions, RedisCache)
+        self.assertIsInstance(store.pages, MemoryCache)
+        self.assertIs(store.sessions, self.container.get(Annotated[Cache, "sessions"]))
+
+    def test_unbound_key_falls_back_to_the_type(self):
+        self.assertIsInstance(self.container.get(Store).limit, Limit)
+        self.assertIsInstance(self.container.get(Annotated[Limit, "other"]), Limit)
+
+    def test_unbound_key_without_type_raises(self):
+        with self.assertRaises(MemberNotBoundError):
+            self.container.get(Annotated[Cache, "other"])
+        with self.assertRaises(MemberNotBoundError):
+            self.container.get(Cache)
+
+    def test_of_builds_keyed_annotations(self):
+        self.assertIsInstance(
+            self.container.get(KeyedAnnotation.of(Cache, "pages")), MemoryCache
+        )
+        self.assertTupleEqual(
+            KeyedAnnotation.split(KeyedAnnotation.of(Cache, "pages")),
+            (Cache, ("pages",)),
+        )
+        self.assertTupleEqual(KeyedAnnotation.split(Cache), (Cache, ()))
+
+    def test_supports_lazy_validation(self):
+        container = (
+            StaticContainerBuilder()
+            .bind(Annotated[Cache, "sessions"], RedisCache)
+            .bind(Annotated[Cache, "pages"], MemoryCache)
+            .bind(Limit)
+            .bind(Store)
+            .build(validate="lazy")
+        )
+        self.assertIsInstance(container.get(Store).pages, MemoryCache)
+
+    def test_rebind_replaces_one_key(self):
+        self.container.rebind(
+            [ProviderBinding(Annotated[Cache, "pages"], RedisCache, "singleton")]
+        )
+        store = self.container.get(Store)
+        self.assertIsInstance(store.pages, RedisCache)
+        self.assertIsNot(store.pages, store.sessions)
+
+    def test_survives_pickling(self):
+        container = pickle.loads(pickle.dumps(self.container))
+        self.assertIsInstance(container.get(Store).sessions, RedisCache)
@@ -0,0 +1,192 @@
+import gc
+import os
+import pickle
+import threading
+import weakref
+from unittest import TestCase
+
+from pyioc3 import StaticContainerBuilder
+from pyioc3.errors import CircularDependencyError, MemberNotBoundError, PyIOC3Error
+from pyioc3.interface import ProviderBinding
+
+closed = []
+
+
+class Config: ...
+
+
+class ShardClient:
+    def __init__(self, shard_id: str, config: Config):
+        self.shard_id = shard_id
+        self.config = config
+
+    def close(self):
+        closed.append(self.shard_id)
+
+
+class Repository:
+    def __init__(self, client: ShardClient):
+        self.client = client
+
+
+class Service:
+    def __init__(self, repository: Repository):
+        self.repository = repository
+
+
+class LoopClient:
+    def __init__(self, shard_id: str, service: "LoopService"):
+        self.service = service
+
+
+class LoopService:
+    def __init__(self, client: LoopClient):
+        self.client = client
+
+
+class ClientConfig(Config):
+    def __init__(self, client: ShardClient):
+        self.client = client
+
+
+class KeyedGetTest(TestCase):
+    def setUp(self):
+        closed.clear()
+        self.container = (
+            StaticContainerBuilder()
+            .bind(Config, scope="singleton")
+            .bind_keyed(
+                ShardClient, key="shard_id", maxsize=2, on_evict=ShardClient.close
+            )
+            .bind(Repository)
+            .build()
+        )
+
+    def test_caches_one_instance_per_key(self):
+        a = self.container.get(ShardClient, key="a")
+        b = self.container.get(ShardClient, key="b")
+        self.assertEqual((a.shard_id, b.shard_id), ("a", "b"))
+        self.assertIs(self.container.get(ShardClient, key="a"), a)
+        self.assertIs(a.config, b.config)
+
+    def test_dependents_receive_the_keyed_instance(self):
+        repository = self.container.get(Repository, key="a")
+        self.assertIs(repository.client, self.container.get(ShardClient, key="a"))
+        self.assertIsNot(self.container.get(Repository, key="a"), repository)
+
+    def test_evicts_least_recently_used(self):
+        self.container.get(ShardClient, key="a")
+        self.container.get(ShardClient, key="b")
+        self.container.get(ShardClient, key="a")
+        self.container.get(ShardClient, key="c")
+        self.assertListEqual(closed, ["b"])
+
+    def test_requires_a_key(self):
+        with self.assertRaises(PyIOC3Error):
+            self.container.get(Repository)
+
+    def test_nested_gets_inherit_the_key(self):
+        keys = []
+        container = (
+            StaticContainerBuilder()
+            .bind(Config)
+            .bind_keyed(ShardClient, key="shard_id")
+            .bind_factory(
+                "lookup", lambda ctx: keys.append(ctx.get(ShardClient).shard_id)
+            )
+            .build()
+        )
+        container.get("lookup", key="a")
+        self.assertListEqual(keys, ["a"])
+
+    def test_rejects_singletons_depending_on_keyed_bindings(self):
+        builder = (
+            StaticContainerBuilder()
+            .bind(Config)
+            .bind_keyed(ShardClient, key="shard_id")
+            .bind(Repository)
+            .bind(Service, scope="singleton")
+        )
+        with self.assertRaisesRegex(PyIOC3Error, "Service.*ShardClient"):
+            builder.build()
+        container = builder.build(validate="lazy")
+        with self.assertRaisesRegex(PyIOC3Error, "Service.*ShardClient"):
+            container.get(Service, key="a")
+
+    def test_child_rejects_singletons_depending_on_keyed_bindings(self):
+        with self.assertRaises(PyIOC3Error):
+            self.container.child([ProviderBinding(Repository, scope="singleton")])
+
+    def test_raises_on_unbound_dependencies_on_build(self):
+        builder = StaticContainerBuilder().bind_keyed(ShardClient, key="shard_id")
+        with self.assertRaises(MemberNotBoundError):
+            builder.build()
+
+    def test_raises_on_cycles_on_build(self):
+        builder = (
+            StaticContainerBuilder()
+            .bind_keyed(LoopClient, key="shard_id")
+            .bind(LoopService)
+        )
+        with self.assertRaises(CircularDependencyError):
+            builder.build()
+
+    def test_rebind_rejects_cycles_through_keyed_references(self):
+        with self.assertRaises(CircularDependencyError):
+            self.container.rebind([ProviderBinding(Config, ClientConfig)])
+        self.assertEqual(self.container.get(ShardClient, key="b").shard_id, "b")
+
+    def test_spec_keeps_keyed_references(self):
+        container = pickle.loads(pickle.dumps(self.container))
+        with self.assertRaises(CircularDependencyError):
+            container.rebind([ProviderBinding(Config, ClientConfig)])
+
+    def test_child_containers_are_collected(self):
+        children = []
+        for _ in range(5):
+            child = self.container.child()
+            child.get(ShardClient, key="a")
+            children.append(weakref.ref(child))
+        del child
+        gc.collect()
+        self.assertListEqual([c() for c in children], [None] * 5)
+
+    def test_rebind_and_close_empty_the_cache(self):
+        a = self.container.get(ShardClient, key="a")
+        self.container.rebind([ProviderBinding(Config, scope="singleton")])
+        self.assertIsNot(self.container.get(ShardClient, key="a"), a)
+        self.assertListEqual(closed, ["a"])
+        self.container.close()
+        self.assertListEqual(closed, ["a", "a"])
+
+    def test_concurrent_gets_share_an_instance(self):
+        barrier = threading.Barrier(4)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(self.container.get(ShardClient, key="a"))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        [t.start() for t in threads]
+        [t.join() for t in threads]
+        self.assertEqual(len({id(r) for r in results}), 1)
+
+    def test_survives_pickling(self):
+        container = pickle.loads(pickle.dumps(self.container))
+        self.assertEqual(container.get(Repository, key="x").client.shard_id, "x")
+
+    def test_forked_processes_create_their_own_instances(self):
+        if not hasattr(os, "fork"):
+            self.skipTest("Requires os.fork")
+        a = self.container.get(ShardClient, key="a")
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            same = self.container.get(ShardClient, key="a") is a
+            os.write(write, b"1" if same else b"0")
+            os._exit(0)
+        os.close(write)
+        os.waitpid(pid, 0)
+        self.assertEqual(os.read(read, 1), b"0")
+        os.close(read)
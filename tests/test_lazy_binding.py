@@ -0,0 +1,165 @@
+import sys
+from unittest import TestCase
+
+from pyioc3 import StaticContainerBuilder
+from pyioc3.builder import BuilderBase
+from pyioc3.errors import (
+    CircularDependencyError,
+    LazyBindingError,
+    MemberNotBoundError,
+)
+from pyioc3.import_path import ImportPath
+from tests.fixtures import QuackBehavior, Sqeak
+from tests.lazy_bindings.interface import (
+    ChickenInterface,
+    EggInterface,
+    RendererInterface,
+)
+
+PKG = "tests.lazy_bindings"
+
+
+def unload():
+    for name in (f"{PKG}.renderer", f"{PKG}.cyclic"):
+        sys.modules.pop(name, None)
+
+
+class ImportPathTest(TestCase):
+    def test_resolves_colon_path(self):
+        self.assertIs(
+            ImportPath.resolve(f"{PKG}.interface:RendererInterface"),
+            RendererInterface,
+        )
+
+    def test_resolves_dotted_path(self):
+        self.assertIs(
+            ImportPath.resolve(f"{PKG}.interface.RendererInterface"),
+            RendererInterface,
+        )
+
+    def test_resolves_nested_qualname(self):
+        from tests.lazy_bindings.renderer import PdfRenderer
+
+        self.assertIs(
+            ImportPath.resolve(f"{PKG}.renderer:PdfRenderer.Options"),
+            PdfRenderer.Options,
+        )
+
+    def test_raises_if_malformed(self):
+        with self.assertRaises(LazyBindingError):
+            ImportPath.resolve("PdfRenderer")
+
+    def test_raises_if_module_is_missing(self):
+        with self.assertRaises(LazyBindingError):
+            ImportPath.resolve(f"{PKG}.missing:PdfRenderer")
+
+    def test_raises_if_attribute_is_missing(self):
+        with self.assertRaises(LazyBindingError):
+            ImportPath.resolve(f"{PKG}.renderer:Missing")
+
+
+class LazyBindingTest(TestCase):
+    def setUp(self):
+        unload()
+
+    def test_does_not_import_until_resolved(self):
+        container = (
+            StaticContainerBuilder()
+            .bind(RendererInterface, f"{PKG}.renderer:PdfRenderer")
+            .bind(QuackBehavior, Sqeak)
+            .build()
+        )
+        self.assertNotIn(f"{PKG}.renderer", sys.modules)
+        renderer = container.get(RendererInterface)
+        self.assertEqual(type(renderer).__name__, "PdfRenderer")
+        self.assertIsInstance(renderer.quack, Sqeak)
+
+    def test_respects_scope(self):
+        container = (
+            StaticContainerBuilder()
+            .bind(RendererInterface, f"{PKG}.renderer.PdfRenderer", "singleton")
+            .bind(QuackBehavior, Sqeak)
+            .build()
+        )
+        self.assertIs(
+            container.get(RendererInterface), container.get(RendererInterface)
+        )
+
+    def test_can_be_injected(self):
+        class Report:
+            def __init__(self, renderer: RendererInterface):
+                self.renderer = renderer
+
+        container = (
+            StaticContainerBuilder()
+            .bind(Report)
+            .bind(RendererInterface, f"{PKG}.renderer:PdfRenderer")
+            .bind(QuackBehavior, Sqeak)
+            .build()
+        )
+        self.assertNotIn(f"{PKG}.renderer", sys.modules)
+        self.assertIsInstance(container.get(Report).renderer, RendererInterface)
+
+    def test_raises_on_get_if_dependency_is_not_bound(self):
+        container = (
+            StaticContainerBuilder()
+            .bind(RendererInterface, f"{PKG}.renderer:PdfRenderer")
+            .build()
+        )
+        with self.assertRaises(MemberNotBoundError):
+            container.get(RendererInterface)
+        with self.assertRaises(MemberNotBoundError):
+            container.get(RendererInterface)
+
+    def test_raises_on_get_if_import_fails(self):
+        container = (
+            StaticContainerBuilder()
+            .bind(RendererInterface, f"{PKG}.missing:PdfRenderer")
+            .build()
+        )
+        with self.assertRaises(LazyBindingError):
+            container.get(RendererInterface)
+
+    def test_raises_on_get_if_cyclic(self):
+        container = (
+            StaticContainerBuilder()
+            .bind(ChickenInterface, f"{PKG}.cyclic:Chicken")
+            .bind(EggInterface, f"{PKG}.cyclic:Egg")
+            .build()
+        )
+        with self.assertRaises(CircularDependencyError):
+            container.get(ChickenInterface)
+        with self.assertRaises(CircularDependencyError):
+            container.get(EggInterface)
+
+    def test_validate_links_every_binding(self):
+        container = (
+            StaticContainerBuilder()
+            .bind(RendererInterface, f"{PKG}.renderer:PdfRenderer")
+            .build()
+        )
+        with self.assertRaises(MemberNotBoundError):
+            container.validate()
+
+    def test_validate_imports_lazy_bindings(self):
+        container = (
+            StaticContainerBuilder()
+            .bind(RendererInterface, f"{PKG}.renderer:PdfRenderer")
+            .bind(QuackBehavior, Sqeak)
+            .build()
+        )
+        container.validate()
+        self.assertIn(f"{PKG}.renderer", sys.modules)
+
+    def test_compiled_template_resolves_lazy_bindings(self):
+        class RendererBuilder(BuilderBase[RendererInterface]):
+            def __init__(self):
+                super().__init__(RendererInterface)
+
+        template = (
+            RendererBuilder()
+            .using_provider(RendererInterface, f"{PKG}.renderer:PdfRenderer")
+            .using_provider(QuackBehavior, Sqeak)
+            .compile()
+        )
+        self.assertIsInstance(template.build().quack, Sqeak)
@@ -0,0 +1,88 @@
+import asyncio
+import pickle
+from threading import Barrier, Thread
+from unittest import TestCase
+
+from pyioc3 import StaticContainerBuilder
+from pyioc3.adapters import AsyncLazyValue
+
+calls = []
+
+
+def load_words():
+    calls.append("words")
+    return ["duck", "goose"]
+
+
+async def load_model():
+    calls.append("model")
+    await asyncio.sleep(0)
+    return "model"
+
+
+class Dictionary:
+    def __init__(self, words: "Words"):
+        self.words = words
+
+
+class Words: ...
+
+
+class LazyConstantTest(TestCase):
+    def setUp(self):
+        calls.clear()
+        self.container = (
+            StaticContainerBuilder()
+            .bind_lazy_constant(Words, load_words)
+            .bind_lazy_constant("model", load_model)
+            .bind(Dictionary)
+            .build()
+        )
+
+    def test_loads_on_first_resolution(self):
+        self.assertListEqual(calls, [])
+        self.assertListEqual(self.container.get(Dictionary).words, ["duck", "goose"])
+        self.assertIs(self.container.get(Words), self.container.get(Dictionary).words)
+        self.assertListEqual(calls, ["words"])
+
+    def test_loads_once_across_threads(self):
+        barrier = Barrier(8)
+
+        def resolve():
+            barrier.wait()
+            self.container.get(Words)
+
+        threads = [Thread(target=resolve) for _ in range(8)]
+        [t.start() for t in threads]
+        [t.join() for t in threads]
+        self.assertListEqual(calls, ["words"])
+
+    def test_retries_failed_loads(self):
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise OSError("not yet")
+            return "ok"
+
+        container = StaticContainerBuilder().bind_lazy_constant("flaky", flaky).build()
+        with self.assertRaises(OSError):
+            container.get("flaky")
+        self.assertEqual(container.get("flaky"), "ok")
+
+    def test_async_loader_injects_awaitable(self):
+        model = self.container.get("model")
+        self.assertIsInstance(model, AsyncLazyValue)
+
+        async def main():
+            return await asyncio.gather(model, model, self.container.get("model"))
+
+        self.assertListEqual(asyncio.run(main()), ["model"] * 3)
+        self.assertListEqual(calls, ["model"])
+
+    def test_spec_reloads_in_built_container(self):
+        self.container.get(Words)
+        container = pickle.loads(pickle.dumps(self.container))
+        self.assertListEqual(container.get(Words), ["duck", "goose"])
+        self.assertListEqual(calls, ["words", "words"])
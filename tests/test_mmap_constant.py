@@ -0,0 +1,78 @@
+import array
+import os
+import pickle
+import tempfile
+from unittest import TestCase
+
+from pyioc3 import StaticContainerBuilder
+from pyioc3.codegen import ContainerCompiler
+from pyioc3.errors import CodegenError
+
+loaded = []
+
+
+def decode(buf):
+    loaded.append(buf)
+    return buf.cast("i")
+
+
+class Values: ...
+
+
+class Table:
+    def __init__(self, values: Values):
+        self.values = values
+
+
+class MmapConstantTest(TestCase):
+    def setUp(self):
+        loaded.clear()
+        fd, self.path = tempfile.mkstemp()
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(array.array("i", range(16)).tobytes())
+        self.container = (
+            StaticContainerBuilder()
+            .bind_mmap_constant("raw", self.path)
+            .bind_mmap_constant(Values, self.path, decode)
+            .bind(Table)
+            .build()
+        )
+
+    def tearDown(self):
+        self.container.close()
+        os.unlink(self.path)
+
+    def test_injects_read_only_view(self):
+        raw = self.container.get("raw")
+        self.assertIsInstance(raw, memoryview)
+        self.assertTrue(raw.readonly)
+        self.assertEqual(raw.nbytes, 16 * array.array("i").itemsize)
+
+    def test_loads_on_first_access_once(self):
+        self.assertListEqual(loaded, [])
+        table = self.container.get(Table).values
+        self.assertEqual(table[5], 5)
+        self.assertIs(self.container.get(Table).values, table)
+        self.assertEqual(len(loaded), 1)
+
+    def test_close_releases_views(self):
+        raw = self.container.get("raw")
+        self.container.close()
+        with self.assertRaises(ValueError):
+            raw[0]
+
+    def test_maps_empty_files(self):
+        open(self.path, "wb").close()
+        self.assertEqual(self.container.get("raw").nbytes, 0)
+
+    def test_spec_maps_file_again(self):
+        container = pickle.loads(pickle.dumps(self.container))
+        try:
+            self.assertEqual(container.get(Table).values[3], 3)
+            self.assertEqual(len(loaded), 1)
+        finally:
+            container.close()
+
+    def test_compiler_rejects_mapped_files(self):
+        with self.assertRaises(CodegenError):
+            ContainerCompiler.compile(self.container)
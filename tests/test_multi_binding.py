@@ -0,0 +1,141 @@
+import pickle
+import sys
+from typing import List, Tuple
+from unittest import TestCase, skipIf
+
+from pyioc3 import StaticContainerBuilder
+from pyioc3.autowire import AutoWireContainerBuilder, bind_multi
+from pyioc3.errors import MemberNotBoundError, PyIOC3Error
+from pyioc3.interface import MultiBinding, MultiElement, ProviderBinding
+
+from .fixtures import QuackBehavior, Sqeak
+
+
+class Plugin: ...
+
+
+class PluginA(Plugin):
+    def __init__(self, quack: QuackBehavior):
+        self.quack = quack
+
+
+class PluginB(Plugin): ...
+
+
+class PluginC(Plugin): ...
+
+
+class Host:
+    def __init__(self, plugins: List[Plugin], frozen: Tuple[Plugin, ...]):
+        self.plugins = plugins
+        self.frozen = frozen
+
+
+class MultiBindingTest(TestCase):
+    def setUp(self):
+        self.container = (
+            StaticContainerBuilder()
+            .bind(QuackBehavior, Sqeak, "requested")
+            .bind_multi(Plugin, PluginA, "singleton")
+            .bind_multi(Plugin, PluginB)
+            .bind_multi(Plugin, PluginC, "requested")
+            .bind(Host)
+            .build()
+        )
+
+    def test_injects_elements_in_binding_order(self):
+        host = self.container.get(Host)
+        self.assertListEqual(
+            [type(p) for p in host.plugins], [PluginA, PluginB, PluginC]
+        )
+        self.assertIsInstance(host.frozen, tuple)
+        self.assertListEqual(
+            [type(p) for p in host.frozen], [PluginA, PluginB, PluginC]
+        )
+
+    def test_respects_element_scopes(self):
+        host = self.container.get(Host)
+        other = self.container.get(Host)
+        # Singleton, shared by every request.
+        self.assertIs(host.plugins[0], other.plugins[0])
+        self.assertIs(host.plugins[0], host.frozen[0])
+        # Transient, created for each injection.
+        self.assertIsNot(host.plugins[1], host.frozen[1])
+        # Requested, shared within the request.
+        self.assertIs(host.plugins[2], host.frozen[2])
+        self.assertIsNot(host.plugins[2], other.plugins[2])
+
+    def test_creates_a_new_collection_for_each_injection(self):
+        plugins = self.container.get(List[Plugin])
+        plugins.clear()
+        self.assertEqual(len(self.container.get(List[Plugin])), 3)
+
+    @skipIf(sys.version_info < (3, 9), "Builtin generics require Python 3.9")
+    def test_injects_builtin_generic_annotations(self):
+        self.assertEqual(len(self.container.get(list[Plugin])), 3)
+        self.assertEqual(len(self.container.get(tuple[Plugin, ...])), 3)
+
+    def test_unbound_collection_raises(self):
+        with self.assertRaises(MemberNotBoundError):
+            StaticContainerBuilder().build().get(List[Plugin])
+
+    def test_supports_lazy_validation(self):
+        container = (
+            StaticContainerBuilder()
+            .bind(QuackBehavior, Sqeak)
+            .bind_multi(Plugin, PluginA)
+            .bind_multi(Plugin, f"{__name__}:PluginB")
+            .build(validate="lazy")
+        )
+        self.assertListEqual(
+            [type(p) for p in container.get(List[Plugin])], [PluginA, PluginB]
+        )
+
+    def test_rebind_replaces_the_collection_dependents(self):
+        self.container.get(Host)
+        self.container.rebind([ProviderBinding(QuackBehavior, Sqeak, "singleton")])
+        host = self.container.get(Host)
+        self.assertIs(host.plugins[0].quack, self.container.get(QuackBehavior))
+
+    def test_child_rejects_multi_bindings(self):
+        with self.assertRaisesRegex(PyIOC3Error, "MultiElement"):
+            self.container.child([MultiBinding(Plugin, PluginB)])
+        with self.assertRaisesRegex(PyIOC3Error, "MultiElement"):
+            self.container.rebind([MultiBinding(Plugin, PluginB)])
+        with self.assertRaisesRegex(PyIOC3Error, "MultiElement"):
+            self.container.override(MultiBinding(Plugin, PluginB))
+
+    def test_child_replaces_an_element(self):
+        child = self.container.child(
+            [ProviderBinding(MultiElement(Plugin, 1), PluginC)]
+        )
+        self.assertListEqual(
+            [type(p) for p in child.get(Host).plugins], [PluginA, PluginC, PluginC]
+        )
+        self.assertListEqual(
+            [type(p) for p in self.container.get(Host).plugins],
+            [PluginA, PluginB, PluginC],
+        )
+
+    def test_survives_pickling(self):
+        container = pickle.loads(pickle.dumps(self.container))
+        self.assertListEqual(
+            [type(p) for p in container.get(Host).frozen], [PluginA, PluginB, PluginC]
+        )
+
+
+class AutoWireMultiBindingTest(TestCase):
+    def setUp(self):
+        self.snapshot = AutoWireContainerBuilder.registry.snapshot()
+
+    def tearDown(self):
+        AutoWireContainerBuilder.registry.restore(self.snapshot)
+
+    def test_collects_decorated_elements(self):
+        AutoWireContainerBuilder.registry.reset()
+        bind_multi(Plugin)(PluginB)
+        bind_multi(Plugin, scope="singleton")(PluginC)
+        container = AutoWireContainerBuilder(__name__).build()
+        plugins = container.get(Tuple[Plugin, ...])
+        self.assertListEqual([type(p) for p in plugins], [PluginB, PluginC])
+        self.assertIs(plugins[1], container.get(Tuple[Plugin, ...])[1])
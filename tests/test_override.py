@@ -0,0 +1,109 @@
+import asyncio
+from threading import Thread
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from pyioc3 import StaticContainerBuilder
+from pyioc3.interface import ConstantBinding, Container
+
+from .fixtures import DuckA, DuckInterface, QuackBehavior, Sqeak
+
+
+class Honk(QuackBehavior):
+    def quack(self):
+        return "honk"
+
+
+class Weather: ...
+
+
+class Pond:
+    def __init__(self, duck: DuckInterface, weather: Weather):
+        self.duck = duck
+        self.weather = weather
+
+
+def pond_factory(ctx: Container):
+    return lambda: ctx.get(Pond)
+
+
+class OverrideTest(TestCase):
+    def setUp(self):
+        self.container = (
+            StaticContainerBuilder()
+            .bind(DuckInterface, DuckA, "singleton")
+            .bind(QuackBehavior, Sqeak, "singleton")
+            .bind(Weather, scope="singleton")
+            .bind(Pond)
+            .bind_factory("pond_factory", pond_factory)
+            .build()
+        )
+
+    def test_override_applies_within_block(self):
+        with self.container.override(QuackBehavior, Honk):
+            self.assertIsInstance(self.container.get(QuackBehavior), Honk)
+        self.assertIsInstance(self.container.get(QuackBehavior), Sqeak)
+
+    def test_override_applies_to_dependents(self):
+        with self.container.override(QuackBehavior, Honk):
+            pond = self.container.get(Pond)
+            self.assertIsInstance(pond.duck._quack_behavior, Honk)
+            pond = self.container.get("pond_factory")()
+            self.assertIsInstance(pond.duck._quack_behavior, Honk)
+
+    def test_override_does_not_leak_affected_singletons(self):
+        with self.container.override(QuackBehavior, Honk):
+            duck = self.container.get(DuckInterface)
+        self.assertIsNot(self.container.get(DuckInterface), duck)
+        self.assertIsInstance(self.container.get(DuckInterface)._quack_behavior, Sqeak)
+
+    def test_override_shares_unaffected_singletons(self):
+        weather = self.container.get(Weather)
+        with self.container.override(QuackBehavior, Honk):
+            self.assertIs(self.container.get(Weather), weather)
+
+    def test_override_with_constant(self):
+        mock = MagicMock()
+        with self.container.override(ConstantBinding(mock, QuackBehavior)):
+            self.assertIs(self.container.get(DuckInterface)._quack_behavior, mock)
+
+    def test_overrides_nest(self):
+        with self.container.override(QuackBehavior, Honk):
+            with self.container.override(ConstantBinding("sunny", Weather)):
+                pond = self.container.get(Pond)
+                self.assertEqual(pond.weather, "sunny")
+                self.assertIsInstance(pond.duck._quack_behavior, Honk)
+            self.assertIsInstance(self.container.get(Weather), Weather)
+            self.assertIsInstance(self.container.get(QuackBehavior), Honk)
+
+    def test_override_is_local_to_thread(self):
+        seen = []
+        thread = Thread(target=lambda: seen.append(self.container.get(QuackBehavior)))
+        with self.container.override(QuackBehavior, Honk):
+            thread.start()
+            thread.join()
+        self.assertIsInstance(seen[0], Sqeak)
+
+    def test_override_is_local_to_task(self):
+        async def overridden():
+            with self.container.override(QuackBehavior, Honk):
+                await asyncio.sleep(0.01)
+                return self.container.get(QuackBehavior)
+
+        async def plain():
+            await asyncio.sleep(0)
+            return self.container.get(QuackBehavior)
+
+        async def main():
+            return await asyncio.gather(overridden(), plain())
+
+        honk, squeak = asyncio.run(main())
+        self.assertIsInstance(honk, Honk)
+        self.assertIsInstance(squeak, Sqeak)
+
+    def test_override_is_released_on_exit(self):
+        with self.assertRaises(ValueError):
+            with self.container.override(QuackBehavior, Honk):
+                self.assertEqual(self.container._override_count, 1)
+                raise ValueError()
+        self.assertEqual(self.container._override_count, 0)
@@ -0,0 +1,118 @@
+import gc
+import pickle
+import threading
+import time
+from unittest import TestCase
+
+from pyioc3 import StaticContainerBuilder
+from pyioc3.errors import CircularDependencyError, MemberNotBoundError
+from pyioc3.interface import ProviderBinding
+
+
+class Templates: ...
+
+
+class Renderer:
+    def __init__(self, templates: Templates):
+        self.templates = templates
+        self.thread = threading.current_thread()
+
+
+class Failing:
+    def __init__(self):
+        raise ValueError("broken")
+
+
+class LoopRenderer:
+    def __init__(self, view: "LoopView"): ...
+
+
+class LoopView:
+    def __init__(self, renderer: LoopRenderer): ...
+
+
+def prefetch_threads():
+    return [t for t in threading.enumerate() if t.name == "pyioc3-prefetch"]
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("Timed out")
+        time.sleep(0.005)
+
+
+class PrefetchTest(TestCase):
+    def setUp(self):
+        self.container = (
+            StaticContainerBuilder()
+            .bind(Templates, scope="singleton")
+            .bind_prefetched(Renderer, size=2)
+            .build()
+        )
+        self.addCleanup(self.container.close)
+
+    def ready(self):
+        member = self.container._bound_members[Renderer]
+        return self.container._adapter_state[member.implementation].queue
+
+    def test_first_get_creates_inline(self):
+        renderer = self.container.get(Renderer)
+        self.assertIs(renderer.thread, threading.current_thread())
+        self.assertIs(renderer.templates, self.container.get(Templates))
+
+    def test_later_gets_take_prefetched_instances(self):
+        first = self.container.get(Renderer)
+        wait_for(self.ready().full)
+        renderers = [self.container.get(Renderer) for _ in range(2)]
+        for renderer in renderers:
+            self.assertIsNot(renderer.thread, threading.current_thread())
+            self.assertIs(renderer.templates, first.templates)
+        self.assertEqual(len({id(r) for r in [first, *renderers]}), 3)
+
+    def test_close_stops_prefetching(self):
+        self.container.get(Renderer)
+        wait_for(self.ready().full)
+        queue = self.ready()
+        self.container.close()
+        self.assertTrue(queue.empty())
+
+    def test_rebind_replaces_the_queue(self):
+        self.container.get(Renderer)
+        wait_for(self.ready().full)
+        self.container.rebind([ProviderBinding(Templates, scope="singleton")])
+        renderer = self.container.get(Renderer)
+        self.assertIs(renderer.templates, self.container.get(Templates))
+        self.assertIs(renderer.thread, threading.current_thread())
+
+    def test_errors_are_raised_to_the_caller(self):
+        container = StaticContainerBuilder().bind_prefetched(Failing).build()
+        with self.assertRaises(ValueError):
+            container.get(Failing)
+        with self.assertRaises(ValueError):
+            container.get(Failing)
+
+    def test_survives_pickling(self):
+        container = pickle.loads(pickle.dumps(self.container))
+        self.addCleanup(container.close)
+        self.assertIsInstance(container.get(Renderer), Renderer)
+
+    def test_threads_end_when_child_containers_are_collected(self):
+        self.container.get(Renderer)
+        wait_for(self.ready().full)
+        before = len(prefetch_threads())
+        for _ in range(20):
+            self.container.child().get(Renderer)
+        gc.collect()
+        wait_for(lambda: len(prefetch_threads()) <= before)
+
+    def test_raises_on_unbound_dependencies_on_build(self):
+        builder = StaticContainerBuilder().bind_prefetched(Renderer)
+        with self.assertRaises(MemberNotBoundError):
+            builder.build()
+
+    def test_raises_on_cycles_on_build(self):
+        builder = StaticContainerBuilder().bind_prefetched(LoopRenderer).bind(LoopView)
+        with self.assertRaises(CircularDependencyError):
+            builder.build()
@@ -0,0 +1,132 @@
+import gc
+import weakref
+from threading import Thread
+from unittest import TestCase
+
+from pyioc3 import StaticContainerBuilder
+from pyioc3.errors import MemberNotBoundError
+from pyioc3.interface import Container, ProviderBinding
+from pyioc3.scope_container import VersionedScope
+
+from .fixtures import DuckA, DuckInterface, HalfCircle1, QuackBehavior, Sqeak
+
+
+class Honk(QuackBehavior):
+    def quack(self):
+        return "honk"
+
+
+class Weather: ...
+
+
+class Pond:
+    def __init__(self, duck: DuckInterface, weather: Weather):
+        self.duck = duck
+        self.weather = weather
+
+
+class Incident:
+    def __init__(self, ctx: Container):
+        ctx.rebind([ProviderBinding(QuackBehavior, Honk)])
+
+
+class Report:
+    def __init__(self, incident: Incident, pond: Pond):
+        self.pond = pond
+
+
+class RebindTest(TestCase):
+    def setUp(self):
+        self.container = (
+            StaticContainerBuilder()
+            .bind(DuckInterface, DuckA, "singleton")
+            .bind(QuackBehavior, Sqeak, "singleton")
+            .bind(Weather, scope="singleton")
+            .bind(Pond)
+            .bind(Incident)
+            .bind(Report)
+            .build()
+        )
+
+    def test_rebind_replaces_binding(self):
+        self.container.rebind([ProviderBinding(QuackBehavior, Honk)])
+        self.assertIsInstance(self.container.get(QuackBehavior), Honk)
+        self.assertIsInstance(self.container.get(Pond).duck._quack_behavior, Honk)
+
+    def test_rebind_invalidates_affected_singletons(self):
+        duck = self.container.get(DuckInterface)
+        self.container.rebind([ProviderBinding(QuackBehavior, Honk, "singleton")])
+        self.assertIsNot(self.container.get(DuckInterface), duck)
+        self.assertIs(
+            self.container.get(DuckInterface), self.container.get(DuckInterface)
+        )
+
+    def test_rebind_keeps_unaffected_singletons(self):
+        weather = self.container.get(Weather)
+        self.container.rebind([ProviderBinding(QuackBehavior, Honk)])
+        self.container.rebind([ProviderBinding(DuckInterface, DuckA)])
+        self.assertIs(self.container.get(Weather), weather)
+
+    def test_rebind_keeps_singletons_created_after_rebind(self):
+        self.container.rebind([ProviderBinding(QuackBehavior, Honk, "singleton")])
+        quack = self.container.get(QuackBehavior)
+        self.container.rebind([ProviderBinding(Weather, Weather)])
+        self.assertIs(self.container.get(QuackBehavior), quack)
+
+    def test_rebind_does_not_chain_singleton_scopes(self):
+        for _ in range(3):
+            self.container.rebind([ProviderBinding(QuackBehavior, Honk)])
+        self.assertIsInstance(self.container._singletons, VersionedScope)
+        self.assertIsNone(self.container._singletons._previous)
+
+    def test_rebind_releases_invalidated_singletons(self):
+        quack = weakref.ref(self.container.get(QuackBehavior))
+        weather = self.container.get(Weather)
+        self.container.rebind([ProviderBinding(QuackBehavior, Honk)])
+        self.container.rebind([ProviderBinding(Pond, Pond)])
+        gc.collect()
+        self.assertIsNone(quack())
+        self.assertIs(self.container.get(Weather), weather)
+
+    def test_rebound_child_keeps_sharing_parent_singletons(self):
+        weather = self.container.get(Weather)
+        child = self.container.child([ProviderBinding(DuckInterface, DuckA)])
+        child.rebind([ProviderBinding(Pond, Pond)])
+        self.assertIs(child.get(Weather), weather)
+
+    def test_in_flight_get_finishes_on_previous_version(self):
+        report = self.container.get(Report)
+        self.assertIsInstance(report.pond.duck._quack_behavior, Sqeak)
+        self.assertIsInstance(self.container.get(Pond).duck._quack_behavior, Honk)
+
+    def test_rebind_can_add_bindings(self):
+        self.container.rebind([ProviderBinding(HalfCircle1, Weather)])
+        self.assertIsInstance(self.container.get(HalfCircle1), Weather)
+
+    def test_failed_rebind_keeps_current_version(self):
+        with self.assertRaises(MemberNotBoundError):
+            self.container.rebind(
+                [
+                    ProviderBinding(QuackBehavior, Honk),
+                    ProviderBinding(Weather, HalfCircle1),
+                ]
+            )
+        self.assertIsInstance(self.container.get(QuackBehavior), Sqeak)
+
+    def test_concurrent_readers_see_a_consistent_version(self):
+        errors = []
+
+        def read():
+            try:
+                for _ in range(500):
+                    pond = self.container.get(Pond)
+                    self.assertIsInstance(pond.duck._quack_behavior, QuackBehavior)
+            except Exception as ex:  # pragma: no cover
+                errors.append(ex)
+
+        readers = [Thread(target=read) for _ in range(4)]
+        [t.start() for t in readers]
+        for impl in [Honk, Sqeak] * 25:
+            self.container.rebind([ProviderBinding(QuackBehavior, impl, "singleton")])
+        [t.join() for t in readers]
+        self.assertListEqual(errors, [])
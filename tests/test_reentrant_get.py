@@ -0,0 +1,92 @@
+import asyncio
+from unittest import TestCase
+
+from pyioc3 import Container, ScopeEnum, StaticContainerBuilder
+from pyioc3.compiled_container import CompiledContainer
+
+
+class Session: ...
+
+
+class Repository:
+    def __init__(self, session: Session):
+        self.session = session
+
+
+class Service:
+    def __init__(self, ctx: Container):
+        self.session = ctx.get(Session)
+        self.repository = ctx.get(Repository)
+
+
+class Worker:
+    def __init__(self, ctx: Container):
+        self.ctx = ctx
+        self.session = ctx.get(Session)
+        self.task = asyncio.ensure_future(self.run())
+
+    async def run(self):
+        return self.ctx.get(Session)
+
+
+def handler_factory(ctx: Container):
+    session = ctx.get(Session)
+
+    def handler():
+        return session, ctx.get(Session)
+
+    return handler
+
+
+class ReentrantGetTest(TestCase):
+    def setUp(self):
+        self.container = (
+            StaticContainerBuilder()
+            .bind(Session, scope="requested")
+            .bind(Repository)
+            .bind(Service)
+            .bind(Worker)
+            .bind_factory("handler", handler_factory)
+            .build()
+        )
+
+    def test_nested_get_shares_requested_instances(self):
+        service = self.container.get(Service)
+        self.assertIs(service.session, service.repository.session)
+
+    def test_outer_gets_do_not_share_requested_instances(self):
+        self.assertIsNot(
+            self.container.get(Service).session, self.container.get(Service).session
+        )
+
+    def test_get_after_outer_get_returns_uses_new_scope(self):
+        session, later = self.container.get("handler")()
+        self.assertIsNot(session, later)
+
+    def test_tasks_created_during_get_use_new_scope(self):
+        async def main():
+            worker = self.container.get(Worker)
+            return worker, await worker.task
+
+        worker, session = asyncio.run(main())
+        self.assertIsInstance(session, Session)
+        self.assertIsNot(session, worker.session)
+
+    def test_nested_get_in_child_shares_requested_instances(self):
+        service = self.container.child().get(Service)
+        self.assertIs(service.session, service.repository.session)
+
+
+class CompiledReentrantGetTest(TestCase):
+    def test_nested_get_shares_requested_instances(self):
+        container = CompiledContainer(
+            {"session": 0, "pair": 1},
+            [
+                lambda r: object(),
+                lambda r: (r.resolve(0), r.container.get("session")),
+            ],
+            [ScopeEnum.REQUESTED, ScopeEnum.TRANSIENT],
+        )
+        first, second = container.get("pair")
+        self.assertIs(first, second)
+        self.assertIsNot(container.get("pair")[0], first)
@@ -0,0 +1,64 @@
+import pickle
+from array import array
+from multiprocessing.shared_memory import SharedMemory
+from unittest import TestCase
+
+from pyioc3 import StaticContainerBuilder
+from pyioc3.container_spec import ContainerSpec
+
+
+def decode(buf):
+    return buf.cast("i")
+
+
+class Table:
+    def __init__(self, values: "Values"):
+        self.values = values
+
+
+class Values: ...
+
+
+class SharedConstantTest(TestCase):
+    def setUp(self):
+        self.container = (
+            StaticContainerBuilder()
+            .bind_shared_constant("raw", b"duck")
+            .bind_shared_constant(Values, array("i", range(16)), decode)
+            .bind(Table)
+            .build()
+        )
+
+    def tearDown(self):
+        self.container.close()
+
+    def test_injects_read_only_view(self):
+        raw = self.container.get("raw")
+        self.assertTrue(raw.readonly)
+        self.assertEqual(bytes(raw), b"duck")
+
+    def test_loader_decodes_view(self):
+        self.assertEqual(self.container.get(Table).values[7], 7)
+
+    def test_spec_attaches_to_block(self):
+        spec = ContainerSpec.from_container(self.container)
+        (member,) = [m for m in spec.members if m.annotation == "raw"]
+        name, size, loader = member.target
+        self.assertEqual(size, 4)
+        self.assertIsNone(loader)
+
+        worker = pickle.loads(pickle.dumps(spec)).build()
+        self.assertEqual(bytes(worker.get("raw")), b"duck")
+        self.assertEqual(worker.get(Table).values[3], 3)
+        worker.close()
+
+        # Only the creating container unlinks the block.
+        SharedMemory(name=name).close()
+        self.container.close()
+        with self.assertRaises(FileNotFoundError):
+            SharedMemory(name=name)
+
+    def test_empty_values(self):
+        container = StaticContainerBuilder().bind_shared_constant("raw", b"").build()
+        self.assertEqual(container.get("raw").nbytes, 0)
+        container.close()
@@ -1,4 +1,9 @@
-from pyioc3.errors import CircularDependencyError, MemberNotBoundError
+from pyioc3.errors import (
+    CircularDependencyError,
+    LazyBindingError,
+    MemberNotBoundError,
+    PyIOC3Error,
+)
 from pyioc3.interface import Container
 from pyioc3.static_container_builder import StaticContainerBuilder
 from unittest.mock import patch
@@ -90,3 +95,61 @@ class StaticContainerTest(unittest.TestCase):
         self.builder.bind(DuckInterface, DuckA, "singleton")
         with self.assertRaises(MemberNotBoundError):
             self.builder.build()
+
+
+class StaticContainerLazyBuildTest(unittest.TestCase):
+    def setUp(self):
+        self.builder = StaticContainerBuilder()
+
+    def test_lazy_build_does_not_introspect(self):
+        self.builder.bind(DuckInterface, DuckA)
+        self.builder.bind(QuackBehavior, Sqeak)
+        container = self.builder.build(validate="lazy")
+        self.assertIsNone(container._bound_members[DuckInterface].parameters)
+
+    def test_lazy_build_links_on_first_get(self):
+        self.builder.bind(DuckInterface, DuckA)
+        self.builder.bind(QuackBehavior, Sqeak)
+        self.builder.bind(HalfCircle1, HalfCircle1)
+        container = self.builder.build(validate="lazy")
+        self.assertIsInstance(container.get(DuckInterface), DuckA)
+        self.assertIsNotNone(container._bound_members[QuackBehavior].parameters)
+        self.assertIsNone(container._bound_members[HalfCircle1].parameters)
+
+    def test_lazy_build_raises_on_get_if_unbound(self):
+        self.builder.bind(DuckInterface, DuckA)
+        self.builder.bind(Sqeak)
+        container = self.builder.build(validate="lazy")
+        self.assertIsInstance(container.get(Sqeak), Sqeak)
+        with self.assertRaises(MemberNotBoundError):
+            container.get(DuckInterface)
+
+    def test_lazy_build_raises_on_get_if_cyclic(self):
+        self.builder.bind(HalfCircle1, HalfCircle1)
+        self.builder.bind(HalfCircle2, HalfCircle2)
+        container = self.builder.build(validate="lazy")
+        with self.assertRaises(CircularDependencyError):
+            container.get(HalfCircle1)
+        with self.assertRaises(CircularDependencyError):
+            container.get(HalfCircle2)
+
+    def test_lazy_build_injects_container(self):
+        container = self.builder.build(validate="lazy")
+        self.assertIs(container.get(Container), container)
+
+    def test_lazy_build_validate_checks_whole_graph(self):
+        self.builder.bind(HalfCircle1, HalfCircle1)
+        self.builder.bind(HalfCircle2, HalfCircle2)
+        container = self.builder.build(validate="lazy")
+        with self.assertRaises(CircularDependencyError):
+            container.validate()
+
+    def test_full_build_imports_lazy_bindings(self):
+        self.builder.bind(DuckInterface, "tests.no_such_module:Duck")
+        self.builder.build()
+        with self.assertRaises(LazyBindingError):
+            self.builder.build(validate="full")
+
+    def test_raises_on_unknown_validation_mode(self):
+        with self.assertRaises(PyIOC3Error):
+            self.builder.build(validate="partial")